@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+SQL 덤프 용량 분석기 (오프라인)
+
+Streams a D1 dump (backups/db_backup_*.sql, prod-to-local-sync.sql, .sql.gz)
+and reports, without touching production:
+
+  - rows and bytes per table
+  - total / average / p95 / max bytes per column
+  - base64 data URIs stored inline in any column (count, bytes, MIME types)
+  - the largest rows
+
+Memory stays bounded: values are looked at one statement at a time and
+p95 is computed from a fixed-size sample per column.
+
+Usage:
+  python3 analyze_dump.py backups/db_backup_20251118_073354.sql
+  python3 analyze_dump.py prod-to-local-sync.sql --top 20 --json report.json
+"""
+
+from collections import Counter
+import argparse
+import random
+import heapq
+import json
+import sys
+
+from sql_dump import DumpSchema, iter_dump_rows
+
+# Values kept per column for the p95 estimate (exact below this many rows)
+SAMPLE_SIZE = 10000
+LARGEST_ROWS = 10
+
+def value_size(value):
+    """Approximate storage bytes of one SQLite value"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value) if value.isascii() else len(value.encode('utf-8'))
+    if isinstance(value, bytes):
+        return len(value)
+    return 8
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+class ColumnStats:
+    def __init__(self, rng):
+        self.rng = rng
+        self.count = 0
+        self.nulls = 0
+        self.total = 0
+        self.max = 0
+        self.sample = []
+        self.data_uris = 0
+        self.data_uri_bytes = 0
+        self.mime_types = Counter()
+
+    def add(self, value):
+        size = value_size(value)
+        self.count += 1
+        self.total += size
+        self.max = max(self.max, size)
+        if value is None:
+            self.nulls += 1
+
+        # Reservoir sample for the percentile
+        if len(self.sample) < SAMPLE_SIZE:
+            self.sample.append(size)
+        else:
+            slot = self.rng.randrange(self.count)
+            if slot < SAMPLE_SIZE:
+                self.sample[slot] = size
+
+        if isinstance(value, str) and value.startswith('data:'):
+            self.data_uris += 1
+            self.data_uri_bytes += size
+            self.mime_types[value[5:value.find(';', 5, 100)] or 'unknown'] += 1
+
+    def p95(self):
+        if not self.sample:
+            return 0
+        ordered = sorted(self.sample)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def to_dict(self):
+        return {
+            'rows': self.count, 'nulls': self.nulls, 'total_bytes': self.total,
+            'avg_bytes': self.total / self.count if self.count else 0,
+            'p95_bytes': self.p95(), 'max_bytes': self.max,
+            'data_uris': self.data_uris, 'data_uri_bytes': self.data_uri_bytes,
+            'mime_types': dict(self.mime_types),
+        }
+
+class TableStats:
+    def __init__(self, rng):
+        self.rng = rng
+        self.rows = 0
+        self.bytes = 0
+        self.columns = {}
+
+    def add(self, columns, row):
+        size = 0
+        for column, value in zip(columns, row):
+            stats = self.columns.get(column)
+            if stats is None:
+                stats = self.columns[column] = ColumnStats(self.rng)
+            stats.add(value)
+            size += value_size(value)
+        self.rows += 1
+        self.bytes += size
+        return size
+
+def analyze(paths, top=LARGEST_ROWS):
+    """Scan dumps, return (tables, largest_rows)"""
+    rng = random.Random(0)
+    tables = {}
+    # Min-heap of (bytes, table, key) holding the largest rows
+    largest = []
+
+    for path in paths:
+        schema = DumpSchema()
+        for table, columns, row in iter_dump_rows(path, schema):
+            stats = tables.get(table)
+            if stats is None:
+                stats = tables[table] = TableStats(rng)
+            size = stats.add(columns, row)
+
+            key = row[columns.index('id')] if 'id' in columns else row[0] if row else None
+            entry = (size, table, str(key))
+            if len(largest) < top:
+                heapq.heappush(largest, entry)
+            elif entry > largest[0]:
+                heapq.heapreplace(largest, entry)
+
+    return tables, sorted(largest, reverse=True)
+
+def print_report(tables, largest):
+    total = sum(stats.bytes for stats in tables.values())
+    print(f"📦 전체: {sum(s.rows for s in tables.values()):,} rows, {format_bytes(total)}\n")
+
+    for table, stats in sorted(tables.items(), key=lambda item: -item[1].bytes):
+        share = stats.bytes / total * 100 if total else 0
+        print(f"📋 {table}: {stats.rows:,} rows, {format_bytes(stats.bytes)} ({share:.1f}%)")
+        for column, col in sorted(stats.columns.items(), key=lambda item: -item[1].total):
+            if not col.total:
+                continue
+            print(f"     {column:<28} total {format_bytes(col.total):>9}  "
+                  f"avg {format_bytes(col.total / col.count):>9}  p95 {format_bytes(col.p95()):>9}  "
+                  f"max {format_bytes(col.max):>9}")
+        print()
+
+    inline = [(table, column, col) for table, stats in tables.items()
+              for column, col in stats.columns.items() if col.data_uris]
+    if inline:
+        print("🖼️  인라인 data URI:")
+        for table, column, col in sorted(inline, key=lambda item: -item[2].data_uri_bytes):
+            mimes = ", ".join(f"{mime} {count}" for mime, count in col.mime_types.most_common())
+            print(f"     {table}.{column}: {col.data_uris}개, {format_bytes(col.data_uri_bytes)} ({mimes})")
+        print()
+    else:
+        print("✅ 인라인 data URI 없음\n")
+
+    if largest:
+        print(f"🐘 가장 큰 행 {len(largest)}개:")
+        for size, table, key in largest:
+            print(f"     {table} #{key}: {format_bytes(size)}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQL 덤프 용량 분석")
+    parser.add_argument('dumps', nargs='+', help=".sql / .sql.gz 덤프 파일")
+    parser.add_argument('--top', type=int, default=LARGEST_ROWS, help="가장 큰 행 몇 개를 표시할지")
+    parser.add_argument('--json', help="분석 결과를 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    tables, largest = analyze(args.dumps, args.top)
+    print_report(tables, largest)
+
+    if args.json:
+        report = {
+            'tables': {
+                table: {'rows': stats.rows, 'bytes': stats.bytes,
+                        'columns': {column: col.to_dict() for column, col in stats.columns.items()}}
+                for table, stats in tables.items()
+            },
+            'largest_rows': [{'table': table, 'key': key, 'bytes': size} for size, table, key in largest],
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 JSON 저장: {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
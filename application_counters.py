@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+캠페인 지원자 카운터 검증/복구 (campaigns.*application_count)
+
+Migration 0105 stores application_count and a per-status breakdown on
+campaigns, kept current by triggers on applications. This tool recounts
+applications with a single GROUP BY and compares the result with the
+stored counters. Mismatches can appear after an import that bypassed the
+triggers, such as a restore into a pre-0105 schema or a manual fix.
+
+Exits 1 when any campaign is out of sync. With --fix, only the mismatched
+campaigns are recomputed. With --fix --all, every campaign is recomputed
+(the same backfill the migration runs).
+
+Usage:
+  python3 application_counters.py                          # 프로덕션 D1 검사
+  python3 application_counters.py --local --fix            # 로컬 D1 검사 + 복구
+  python3 application_counters.py --sqlite /tmp/g.sqlite --fix --all
+"""
+
+import argparse
+import sqlite3
+import time
+import sys
+
+from d1_client import D1Error, get_client
+
+# Stored counter column → application status it counts (None = all)
+COUNTER_COLUMNS = {
+    'application_count': None,
+    'pending_application_count': 'pending',
+    'approved_application_count': 'approved',
+    'rejected_application_count': 'rejected',
+}
+
+# Campaign ids per repair UPDATE (keeps each D1 statement small)
+FIX_BATCH_SIZE = 100
+# Mismatched campaigns printed in the report
+REPORT_LIMIT = 20
+
+def _actual_expr(status):
+    return "COUNT(*)" if status is None else f"SUM(status = '{status}')"
+
+MISMATCH_SQL = f"""
+SELECT c.id, {', '.join(f'c.{column}' for column in COUNTER_COLUMNS)},
+  {', '.join(f'COALESCE(x.{column}, 0) AS actual_{column}' for column in COUNTER_COLUMNS)}
+FROM campaigns c
+LEFT JOIN (
+  SELECT campaign_id, {', '.join(f'{_actual_expr(status)} AS {column}' for column, status in COUNTER_COLUMNS.items())}
+  FROM applications GROUP BY campaign_id
+) x ON x.campaign_id = c.id
+WHERE {' OR '.join(f'c.{column} IS NOT COALESCE(x.{column}, 0)' for column in COUNTER_COLUMNS)}
+ORDER BY c.id
+"""
+
+def _recount_expr(status):
+    condition = "" if status is None else f" AND a.status = '{status}'"
+    return f"(SELECT COUNT(*) FROM applications a WHERE a.campaign_id = campaigns.id{condition})"
+
+RECOUNT_SET = ',\n  '.join(f"{column} = {_recount_expr(status)}" for column, status in COUNTER_COLUMNS.items())
+
+def sqlite_query(path):
+    """query(sql, params) over a SQLite file, returning row dicts"""
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+
+    def query(sql, params=()):
+        return [dict(row) for row in conn.execute(sql, params)]
+    return query
+
+def d1_query(remote):
+    """query(sql, params) through the shared d1-bridge client"""
+    client = get_client(remote)
+    return lambda sql, params=(): client.query(sql, params)
+
+def find_mismatches(query):
+    """Campaigns whose stored counters differ from the real application counts"""
+    return query(MISMATCH_SQL)
+
+def recount(query, campaign_ids=None):
+    """Recompute the counters for the given campaigns (None = every campaign)"""
+    if campaign_ids is None:
+        query(f"UPDATE campaigns SET\n  {RECOUNT_SET}")
+        return
+    for start in range(0, len(campaign_ids), FIX_BATCH_SIZE):
+        batch = campaign_ids[start:start + FIX_BATCH_SIZE]
+        placeholders = ', '.join('?' * len(batch))
+        query(f"UPDATE campaigns SET\n  {RECOUNT_SET}\nWHERE id IN ({placeholders})", batch)
+
+def print_mismatches(mismatches):
+    print(f"⚠️  카운터 불일치 캠페인 {len(mismatches)}개")
+    for row in mismatches[:REPORT_LIMIT]:
+        diffs = [
+            f"{column} {row[column]}→{row['actual_' + column]}"
+            for column in COUNTER_COLUMNS if row[column] != row['actual_' + column]
+        ]
+        print(f"   #{row['id']}: {', '.join(diffs)}")
+    if len(mismatches) > REPORT_LIMIT:
+        print(f"   ... 외 {len(mismatches) - REPORT_LIMIT}개")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="캠페인 지원자 카운터 검증/복구")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 대상")
+    target.add_argument('--sqlite', help="SQLite 파일 대상")
+    parser.add_argument('--fix', action='store_true', help="불일치 캠페인의 카운터를 다시 계산")
+    parser.add_argument('--all', action='store_true', help="--fix와 함께: 모든 캠페인을 다시 계산 (백필)")
+    args = parser.parse_args(argv)
+
+    query = sqlite_query(args.sqlite) if args.sqlite else d1_query(remote=not args.local)
+    started = time.time()
+    try:
+        columns = {row['name'] for row in query("PRAGMA table_info(campaigns)")}
+        missing = [column for column in COUNTER_COLUMNS if column not in columns]
+        if missing:
+            print(f"❌ campaigns에 카운터 컬럼이 없습니다: {', '.join(missing)} "
+                  f"(먼저 migrations/0105_add_campaign_application_counters.sql 적용)")
+            return 1
+
+        if args.fix and args.all:
+            recount(query)
+            print(f"🔁 모든 캠페인 카운터 재계산 ({time.time() - started:.1f}s)")
+
+        mismatches = find_mismatches(query)
+        if mismatches and args.fix:
+            print_mismatches(mismatches)
+            recount(query, [row['id'] for row in mismatches])
+            print(f"🔁 {len(mismatches)}개 캠페인 카운터 재계산")
+            mismatches = find_mismatches(query)
+    except (D1Error, sqlite3.Error) as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return 1
+
+    if mismatches:
+        print_mismatches(mismatches)
+        if not args.fix:
+            print("\n`--fix`로 복구할 수 있습니다")
+        return 1
+    print(f"✅ 모든 캠페인의 지원자 카운터가 실제 지원 수와 일치합니다 ({time.time() - started:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
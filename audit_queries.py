@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+SQL 실행 계획 감사 (EXPLAIN QUERY PLAN)
+
+Pulls every `prepare(...)` SQL string out of the worker source
+(src/index.ts, src/routes/*.ts, src/middleware/*.ts, src/utils/*.ts),
+builds a SQLite from migrations/ filled with synthetic data
+(generate_dataset.py), and for each statement:
+
+  - runs EXPLAIN QUERY PLAN with representative bindings (values taken
+    from the data for the column each `?` is compared with)
+  - flags full table scans, temp B-trees for ORDER BY / GROUP BY /
+    DISTINCT, correlated subqueries and statements the schema rejects
+  - for flagged SELECTs, proposes a candidate (covering) index and times
+    the query before and after creating it
+
+It also reports duplicate indexes (same columns, or a non-unique index
+that is a prefix of another) and indexes no audited statement uses. An
+index on a table with a statement that could not be explained is listed
+as unknown rather than unused.
+
+Variables built from string literals (`let query = '...'; query += ...`)
+and `${...}` fragments are resolved: constants defined as literals
+(module-level ones included), the longest branch of a conditional
+fragment, `conditions.join(' AND ')` over every pushed literal, and
+`rows.map(() => '(?, ?)').join(', ')` as a single row. Write statements are only
+explained, never timed.
+
+Usage:
+  python3 audit_queries.py                      # 1x synthetic data
+  python3 audit_queries.py --scale 10 --json audit.json
+  python3 audit_queries.py --sqlite /tmp/restore.sqlite   # e.g. restore_dump.py output
+"""
+
+from collections import namedtuple
+import statistics
+import argparse
+import tempfile
+import sqlite3
+import glob
+import json
+import time
+import sys
+import os
+import re
+
+from generate_dataset import DatasetGenerator, generate
+
+SOURCE_GLOBS = ['src/index.ts', 'src/routes/*.ts', 'src/middleware/*.ts', 'src/utils/*.ts']
+
+# Time each query until this many seconds or runs, whichever comes first
+TIMING_SECONDS = 0.2
+TIMING_MAX_RUNS = 50
+# Covering candidates stop at this many columns
+COVERING_MAX_COLUMNS = 6
+
+# One prepare() call site; sql has ${...} fragments resolved
+Statement = namedtuple('Statement', ['path', 'line', 'sql', 'dynamic'])
+
+_PREPARE = re.compile(r'\.prepare\(\s*')
+_SQL_START = re.compile(r'\s*(?:SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b', re.I)
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_TABLE_REF = re.compile(
+    r'\b(?:FROM|JOIN|UPDATE|INTO)\s+"?(\w+)"?'
+    r'(?:\s+(?:AS\s+)?(?!(?:WHERE|ON|SET|LEFT|INNER|JOIN|GROUP|ORDER|LIMIT|VALUES|USING)\b)(\w+))?', re.I)
+_COLUMN_REF = re.compile(r'\b(?:(\w+)\.)?(\w+)\b')
+_PARAM_CONTEXT = re.compile(r'(?:(\w+)\.)?(\w+)\s*(=|!=|<>|<=|>=|<|>|\bLIKE|\bIN\s*\([^()]*)\s*$', re.I)
+
+def read_literal(src, i):
+    """JS string literal starting at src[i] → (text, end, [template expressions])"""
+    quote = src[i]
+    out = []
+    exprs = []
+    j = i + 1
+    while j < len(src):
+        ch = src[j]
+        if ch == '\\':
+            out.append({'n': '\n', 't': '\t'}.get(src[j + 1], src[j + 1]))
+            j += 2
+        elif ch == quote:
+            return ''.join(out), j + 1, exprs
+        elif quote == '`' and src.startswith('${', j):
+            depth = 1
+            k = j + 2
+            while depth and k < len(src):
+                depth += {'{': 1, '}': -1}.get(src[k], 0)
+                k += 1
+            out.append(f"\x00{len(exprs)}\x00")
+            exprs.append(src[j + 2:k - 1].strip())
+            j = k
+        else:
+            out.append(ch)
+            j += 1
+    raise ValueError("unterminated string literal")
+
+def read_concatenation(src, i):
+    """'a' + `b` + "c" starting at src[i] → (text, end, exprs) or None if not a literal"""
+    if i >= len(src) or src[i] not in '\'"`':
+        return None
+    text, end, exprs = read_literal(src, i)
+    while True:
+        m = re.compile(r'\s*\+\s*').match(src, end)
+        if not m or m.end() >= len(src) or src[m.end()] not in '\'"`':
+            return text, end, exprs
+        more, end, more_exprs = read_literal(src, m.end())
+        text += re.sub(r'\x00(\d+)\x00', lambda g: f"\x00{int(g.group(1)) + len(exprs)}\x00", more)
+        exprs += more_exprs
+
+def substitute(text, exprs, src, before, depth):
+    """Replace the ${...} markers of a literal with the resolved fragments"""
+    fragments = [resolve_fragment(expr, src, before, depth + 1) for expr in exprs]
+    return re.sub(r'\x00(\d+)\x00', lambda g: fragments[int(g.group(1))], text)
+
+def find_definition(name, src, before):
+    """The last `const/let/var name =` before the call, else a later (module-level) one"""
+    pattern = rf'(?:const|let|var)\s+{re.escape(name)}\s*=\s*'
+    definitions = list(re.finditer(pattern, src[:before]))
+    return definitions[-1] if definitions else re.compile(pattern).search(src, before)
+
+def array_elements(name, src, before, depth):
+    """String literals of `const name = [...]` plus every `name.push(literal)` before the call"""
+    definition = find_definition(name, src, before)
+    if not definition or not src.startswith('[', definition.end()):
+        return None
+    elements = []
+    i = definition.end() + 1
+    while True:
+        i = re.compile(r'[\s,]*').match(src, i).end()
+        parsed = read_concatenation(src, i)
+        if not parsed:
+            break
+        elements.append(substitute(parsed[0], parsed[2], src, before, depth))
+        i = parsed[1]
+    for m in re.finditer(rf'\b{re.escape(name)}\.push\(\s*', src[definition.end():before]):
+        parsed = read_concatenation(src, definition.end() + m.end())
+        if parsed:
+            elements.append(substitute(parsed[0], parsed[2], src, before, depth))
+    return elements
+
+def resolve_fragment(expr, src, before, depth=0):
+    """Value of a ${expr} fragment, '' if it cannot be resolved
+
+    - name: its definition; a literal (or concatenation) is read in full
+      with its own fragments resolved, otherwise (a conditional) the
+      longest string literal assigned to it
+    - list.join(sep): the list's literals plus every list.push(literal)
+    - rows.map(() => literal).join(sep): the literal, i.e. a single row
+    """
+    if depth > 5:
+        return ''
+    join = re.fullmatch(r'(\w+)\.join\(\s*([\'"`])(.*?)\2\s*\)', expr, re.S)
+    if join:
+        elements = array_elements(join.group(1), src, before, depth)
+        return join.group(3).join(elements) if elements else ''
+    mapped = re.fullmatch(r'\w+\.map\(\s*\(\s*\w*\s*\)\s*=>\s*(.+?)\s*\)\.join\(.*\)', expr, re.S)
+    if mapped:
+        parsed = read_concatenation(mapped.group(1), 0)
+        return substitute(parsed[0], parsed[2], src, before, depth) if parsed else ''
+    if not _IDENTIFIER.fullmatch(expr):
+        return ''
+    definition = find_definition(expr, src, before)
+    if not definition:
+        return ''
+    parsed = read_concatenation(src, definition.end())
+    if parsed and re.compile(r'\s*(?:;|\n|$)').match(src, parsed[1]):
+        return substitute(parsed[0], parsed[2], src, before, depth)
+    value = re.compile(r'[^;\n]+').match(src, definition.end())
+    literals = re.findall(r"'([^'\\]*)'|\"([^\"\\]*)\"|`([^`$\\]*)`", value.group(0) if value else '')
+    return max((''.join(parts) for parts in literals), key=len, default='')
+
+def resolve_variable(name, src, before):
+    """SQL held in a variable: its literal definition plus every `name += literal` before the call"""
+    definitions = list(re.finditer(rf'(?:const|let|var)\s+{re.escape(name)}\s*=\s*', src[:before]))
+    if not definitions:
+        return None
+    parsed = read_concatenation(src, definitions[-1].end())
+    if parsed is None:
+        return None
+    text, end, exprs = parsed
+    for m in re.finditer(rf'\b{re.escape(name)}\s*\+=\s*', src[end:before]):
+        more = read_concatenation(src, end + m.end())
+        if more:
+            text += re.sub(r'\x00(\d+)\x00', lambda g: f"\x00{int(g.group(1)) + len(exprs)}\x00", more[0])
+            exprs += more[2]
+    return text, exprs
+
+def extract_statements(paths):
+    """Every prepare() SQL in the given files, as [Statement]"""
+    statements = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            src = f.read()
+        for m in _PREPARE.finditer(src):
+            start = m.end()
+            parsed = read_concatenation(src, start)
+            if parsed:
+                text, _, exprs = parsed
+            else:
+                name = _IDENTIFIER.match(src, start)
+                resolved = name and resolve_variable(name.group(0), src, start)
+                if not resolved:
+                    continue
+                text, exprs = resolved
+
+            sql = substitute(text, exprs, src, start, -1)
+            if not _SQL_START.match(sql):
+                continue
+            statements.append(Statement(path, src.count('\n', 0, start) + 1, ' '.join(sql.split()),
+                                        bool(exprs) or not parsed))
+    return statements
+
+def table_columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+def statement_tables(conn, sql):
+    """{alias: table} for every table the statement references (tables are their own alias)"""
+    known = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    aliases = {}
+    for table, alias in _TABLE_REF.findall(sql):
+        if table in known:
+            aliases[table] = table
+            if alias:
+                aliases[alias] = table
+    return aliases
+
+class Binder:
+    """Representative values for `?` parameters, from the data the statement will hit"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.cache = {}
+
+    def column_value(self, table, column):
+        key = (table, column)
+        if key not in self.cache:
+            # The middle row by rowid: a real, deterministic value
+            row = self.conn.execute(
+                f'SELECT "{column}" FROM "{table}" WHERE "{column}" IS NOT NULL ORDER BY rowid '
+                f'LIMIT 1 OFFSET (SELECT COUNT(*) / 2 FROM "{table}" WHERE "{column}" IS NOT NULL)'
+            ).fetchone()
+            self.cache[key] = row[0] if row else None
+        return self.cache[key]
+
+    def bindings(self, sql, aliases):
+        values = []
+        for m in re.finditer(r'\?', sql):
+            before = sql[:m.start()]
+            if re.search(r'\b(?:LIMIT|OFFSET)\s*$', before, re.I):
+                values.append(20 if before.rstrip().upper().endswith('LIMIT') else 0)
+                continue
+            context = _PARAM_CONTEXT.search(before)
+            value = None
+            if context:
+                qualifier, column, operator = context.groups()
+                tables = [aliases[qualifier]] if qualifier in aliases else sorted(set(aliases.values()))
+                for table in tables:
+                    if column in table_columns(self.conn, table):
+                        value = self.column_value(table, column)
+                        break
+                if value is not None and operator.upper() == 'LIKE':
+                    value = f"%{str(value)[:3]}%"
+            values.append(value if value is not None else 1)
+        return values
+
+def explain(conn, sql, params):
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+def plan_findings(plan, aliases):
+    """[(kind, detail)] for the problems in a query plan"""
+    findings = []
+    for detail in plan:
+        m = re.match(r'SCAN (\w+)(.*)', detail)
+        if m and 'INDEX' not in m.group(2):
+            findings.append(('scan', aliases.get(m.group(1), m.group(1))))
+        elif detail.startswith('USE TEMP B-TREE'):
+            findings.append(('temp_btree', detail[len('USE TEMP B-TREE FOR '):]))
+        elif detail.startswith('CORRELATED'):
+            findings.append(('correlated', detail))
+    return findings
+
+def used_indexes(plan):
+    return {m.group(1) for detail in plan for m in [re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)] if m}
+
+def index_definitions(conn):
+    """{name: (table, (columns...), unique)} for every index, including UNIQUE autoindexes"""
+    indexes = {}
+    for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"):
+        for _, name, unique, origin, _ in conn.execute(f'PRAGMA index_list("{table}")'):
+            columns = tuple(
+                f"{column} DESC" if desc else column
+                for _, _, column, desc, _, key in conn.execute(f'PRAGMA index_xinfo("{name}")') if key
+            )
+            indexes[name] = (table, columns, bool(unique), origin)
+    return indexes
+
+def duplicate_indexes(indexes):
+    """[(redundant, kept, reason)]: identical column lists, or a non-unique prefix of a longer index"""
+    findings = []
+    names = sorted(indexes, key=lambda name: (indexes[name][3] == 'c', name))
+    for i, name in enumerate(names):
+        table, columns, unique, _ = indexes[name]
+        siblings = [other for other in names if other != name and indexes[other][0] == table]
+        same = [other for other in siblings if indexes[other][1] == columns and names.index(other) < i]
+        wider = [other for other in siblings if not unique and len(indexes[other][1]) > len(columns)
+                 and indexes[other][1][:len(columns)] == columns]
+        if same:
+            findings.append((name, same[0], "동일한 컬럼"))
+        elif wider:
+            findings.append((name, wider[0], f"{wider[0]}의 앞부분 컬럼과 동일"))
+    return findings
+
+def candidate_index(conn, sql, table, aliases, driving):
+    """Columns for an index serving this statement on table: equality, then ORDER BY / range, then covering
+
+    Join columns only help a table probed by the join, not the outer (driving) one.
+    """
+    columns = table_columns(conn, table)
+    own = {alias for alias, target in aliases.items() if target == table}
+    single = len(set(aliases.values())) == 1
+
+    def refs(text):
+        for qualifier, column in _COLUMN_REF.findall(text):
+            if column in columns and (qualifier in own or (not qualifier and single)):
+                yield column
+
+    equality, ranges, order = [], [], []
+    for m in re.finditer(r'(?:(\w+)\.)?(\w+)\s*(=|IN\b|IS\b|<=|>=|<|>|BETWEEN\b|LIKE\b)\s*(?:(\w+)\.(\w+))?',
+                         sql, re.I):
+        qualifier, column, operator, other_qualifier, other_column = m.groups()
+        if other_qualifier in aliases:
+            # Join predicate: a.x = b.y
+            if not driving and operator == '=':
+                if qualifier in own and column in columns:
+                    equality.append(column)
+                elif other_qualifier in own and other_column in columns:
+                    equality.append(other_column)
+            continue
+        if column not in columns or not (qualifier in own or (not qualifier and single)):
+            continue
+        (equality if operator.upper() in ('=', 'IN', 'IS') else ranges).append(column)
+
+    order_by = re.search(r'\bORDER BY\s+(.*?)(?:\bLIMIT\b|$)', sql, re.I)
+    if order_by and 'CASE' not in order_by.group(1).upper():
+        for term in order_by.group(1).split(','):
+            found = list(refs(term))
+            if found:
+                order.append(f"{found[0]} DESC" if re.search(r'\bDESC\b', term, re.I) else found[0])
+
+    key = list(dict.fromkeys([column for column in equality if column != 'id'] + (order or ranges[:1])))
+    if not key:
+        return None
+
+    selects_all = re.search(rf'(?:SELECT|,)\s*(?:(?:{"|".join(map(re.escape, own))})\.)?\*', sql, re.I)
+    if not selects_all:
+        extra = [column for column in dict.fromkeys(refs(sql))
+                 if column not in {k.split()[0] for k in key} and column != 'id']
+        if len(key) + len(extra) <= COVERING_MAX_COLUMNS:
+            key += extra
+    return key
+
+def time_query(conn, sql, params):
+    """Median seconds per run"""
+    runs = []
+    deadline = time.perf_counter() + TIMING_SECONDS
+    while len(runs) < TIMING_MAX_RUNS and (len(runs) < 3 or time.perf_counter() < deadline):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+def try_candidate(conn, sql, params, table, columns):
+    """Create a candidate index, return (before_s, after_s, new_plan); the index is dropped again"""
+    before = time_query(conn, sql, params)
+    name = f"audit_candidate_{table}"
+    conn.execute(f'CREATE INDEX "{name}" ON "{table}" ({", ".join(columns)})')
+    try:
+        conn.execute(f'ANALYZE "{name}"')
+        plan = explain(conn, sql, params)
+        after = time_query(conn, sql, params)
+    finally:
+        conn.execute(f'DROP INDEX "{name}"')
+    return before, after, plan
+
+def audit(conn, statements, try_candidates=True):
+    """Explain every statement, return the report dict"""
+    binder = Binder(conn)
+    indexes = index_definitions(conn)
+    used = set()
+    # Tables of statements that could not be explained: their indexes may still be used
+    unexplained = {}
+    results = []
+    tried = {}
+
+    for statement in statements:
+        location = f"{statement.path}:{statement.line}"
+        aliases = statement_tables(conn, statement.sql)
+        params = binder.bindings(statement.sql, aliases)
+        try:
+            plan = explain(conn, statement.sql, params)
+        except sqlite3.Error as e:
+            results.append({'location': location, 'sql': statement.sql, 'error': str(e)})
+            for table in set(aliases.values()):
+                unexplained.setdefault(table, []).append(location)
+            continue
+
+        used |= used_indexes(plan)
+        findings = plan_findings(plan, aliases)
+        result = {'location': location, 'sql': statement.sql, 'dynamic': statement.dynamic,
+                  'plan': plan, 'findings': findings, 'candidates': []}
+
+        is_select = re.match(r'\s*(?:SELECT|WITH)\b', statement.sql, re.I)
+        outer = next((aliases.get(m.group(1), m.group(1)) for detail in plan
+                      for m in [re.match(r'(?:SCAN|SEARCH) (\w+)', detail)] if m), None)
+        targets = [detail for kind, detail in findings if kind == 'scan']
+        if any(kind == 'temp_btree' for kind, _ in findings):
+            # A sort can only be avoided by an index on the outer table of the ORDER BY / GROUP BY
+            sort_by = re.search(r'\b(?:ORDER|GROUP) BY\s+(\w+)\.', statement.sql, re.I)
+            targets.append(aliases.get(sort_by.group(1)) if sort_by else outer)
+        for table in dict.fromkeys(target for target in targets if target):
+            columns = candidate_index(conn, statement.sql, table, aliases, driving=table == outer)
+            if not columns:
+                continue
+            candidate = {'table': table, 'columns': columns}
+            if try_candidates and is_select:
+                key = (statement.sql, table, tuple(columns))
+                if key not in tried:
+                    tried[key] = try_candidate(conn, statement.sql, params, table, columns)
+                before, after, new_plan = tried[key]
+                candidate.update(before_ms=before * 1000, after_ms=after * 1000, plan=new_plan,
+                                 used='audit_candidate_' + table in ' '.join(new_plan))
+            result['candidates'].append(candidate)
+        results.append(result)
+
+    not_seen = sorted(name for name, (_, _, unique, origin) in indexes.items()
+                      if name not in used and origin == 'c' and not unique)
+    unused = [name for name in not_seen if indexes[name][0] not in unexplained]
+    unknown = [name for name in not_seen if indexes[name][0] in unexplained]
+    return {
+        'statements': results,
+        'duplicate_indexes': [{'index': name, 'duplicate_of': other, 'reason': reason}
+                              for name, other, reason in duplicate_indexes(indexes)],
+        'unused_indexes': [{'index': name, 'table': indexes[name][0], 'columns': list(indexes[name][1])}
+                           for name in unused],
+        'unknown_indexes': [{'index': name, 'table': indexes[name][0], 'columns': list(indexes[name][1]),
+                             'unexplained': unexplained[indexes[name][0]]}
+                            for name in unknown],
+    }
+
+def print_report(report, rows_by_table):
+    statements = report['statements']
+    errors = [r for r in statements if 'error' in r]
+    flagged = [r for r in statements if r.get('findings')]
+    print(f"📋 구문 {len(statements)}개: 문제 {len(flagged)}개, 스키마 오류 {len(errors)}개\n")
+
+    labels = {'scan': '🐢 전체 스캔', 'temp_btree': '🧮 임시 B-tree', 'correlated': '🔁 상관 서브쿼리'}
+    for result in flagged:
+        print(f"── {result['location']}{' (동적 SQL)' if result['dynamic'] else ''}")
+        print(f"   {result['sql'][:160]}{'…' if len(result['sql']) > 160 else ''}")
+        for kind, detail in result['findings']:
+            size = f" ({rows_by_table[detail]:,}행)" if kind == 'scan' and detail in rows_by_table else ''
+            print(f"   {labels[kind]}: {detail}{size}")
+        for candidate in result['candidates']:
+            ddl = f"CREATE INDEX ON {candidate['table']}({', '.join(candidate['columns'])})"
+            if 'before_ms' in candidate:
+                speedup = candidate['before_ms'] / max(candidate['after_ms'], 1e-6)
+                verdict = "사용됨" if candidate['used'] else "플래너가 사용 안 함"
+                print(f"   💡 {ddl}: {candidate['before_ms']:.2f}ms → {candidate['after_ms']:.2f}ms "
+                      f"(x{speedup:.1f}, {verdict})")
+            else:
+                print(f"   💡 {ddl}")
+        print()
+
+    if errors:
+        print("❌ 감사 대상 스키마에서 실행할 수 없는 구문 (코드와 스키마 불일치):")
+        for result in errors:
+            print(f"   {result['location']}: {result['error']}")
+        print()
+
+    if report['duplicate_indexes']:
+        print("♊ 중복 인덱스:")
+        for entry in report['duplicate_indexes']:
+            print(f"   {entry['index']} ↔ {entry['duplicate_of']} ({entry['reason']})")
+        print()
+    if report['unused_indexes']:
+        print("🪦 어떤 구문도 사용하지 않는 인덱스 (FK 자식 컬럼이면 부모 DELETE CASCADE 에 필요할 수 있음):")
+        for entry in report['unused_indexes']:
+            print(f"   {entry['index']} ON {entry['table']}({', '.join(entry['columns'])})")
+        print()
+    if report['unknown_indexes']:
+        print("❔ 사용 여부 알 수 없음 (같은 테이블의 구문을 실행 계획으로 확인하지 못함):")
+        for entry in report['unknown_indexes']:
+            print(f"   {entry['index']} ON {entry['table']}({', '.join(entry['columns'])}): "
+                  f"{', '.join(entry['unexplained'])}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQL 실행 계획 감사 (EXPLAIN QUERY PLAN)")
+    parser.add_argument('files', nargs='*', help=f"검사할 .ts 파일 (기본: {' '.join(SOURCE_GLOBS)})")
+    parser.add_argument('--sqlite', help="감사에 사용할 기존 SQLite (기본: 합성 데이터로 임시 생성)")
+    parser.add_argument('--scale', type=float, default=1.0, help="합성 데이터 배율 (generate_dataset.py)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-timing', action='store_true', help="후보 인덱스 시간 측정 생략")
+    parser.add_argument('--json', help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    paths = args.files or sorted(path for pattern in SOURCE_GLOBS for path in glob.glob(pattern))
+    statements = extract_statements(paths)
+    print(f"🔎 {len(paths)}개 파일에서 prepare() 구문 {len(statements)}개 추출")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Always a scratch copy: ANALYZE and candidate indexes must not touch the source
+        path = os.path.join(tmp_dir, 'audit.sqlite')
+        conn = sqlite3.connect(path, isolation_level=None)
+        if args.sqlite:
+            source = sqlite3.connect(args.sqlite)
+            source.backup(conn)
+            source.close()
+        else:
+            print(f"🏭 합성 데이터 생성 (scale={args.scale:g}, seed={args.seed})")
+            generate(conn, DatasetGenerator(args.seed, args.scale), quiet=True)
+        conn.close()
+
+        conn = sqlite3.connect(path, isolation_level=None)
+        try:
+            conn.execute("ANALYZE")
+            rows_by_table = {
+                table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
+            print()
+            report = audit(conn, statements, try_candidates=not args.no_timing)
+        finally:
+            conn.close()
+
+    print_report(report, rows_by_table)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 JSON 저장: {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
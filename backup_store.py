@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+중복 제거 + 압축 증분 백업 저장소
+
+Stores `wrangler d1 export` dumps as content-defined chunks: each unique
+chunk is kept once (compressed, named by its SHA-256) and every backup is
+just a small manifest listing its chunks. A day where few rows changed
+adds only the few chunks around those rows, so disk use and write time
+follow the daily change instead of the database size.
+
+Chunk boundaries are content-defined at line granularity (a dump row is
+one line): a chunk ends after a line whose CRC32 matches a mask, once the
+chunk is at least CHUNK_MIN_BYTES. Inserting or changing a row therefore
+only changes the chunk containing it. Lines longer than CHUNK_MAX_BYTES
+(inline images) are cut at fixed offsets.
+
+Chunks are compressed with zstd when the `zstandard` module is installed,
+gzip otherwise; restore reads either.
+
+Layout (backups/store/):
+  chunks/ab/ab12....gz         unique chunks
+  manifests/<name>.json        one per backup (chunk list + sha256 of the dump)
+
+Usage:
+  python3 backup_store.py add backups/db_backup_20251118_073354.sql [--delete-source]
+  python3 backup_store.py list
+  python3 backup_store.py restore db_backup_20251118_073354 -o restored.sql
+  python3 backup_store.py prune --keep-days 365
+"""
+
+from datetime import datetime, timedelta, timezone
+import argparse
+import hashlib
+import gzip
+import json
+import zlib
+import time
+import sys
+import os
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+STORE_DIR = os.path.join("backups", "store")
+
+CHUNK_MIN_BYTES = 16 * 1024
+CHUNK_MAX_BYTES = 256 * 1024
+# Cut after a line when crc32(line) & CHUNK_MASK == 0 (about every 64 lines past the minimum)
+CHUNK_MASK = 0x3F
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+class StoreError(Exception):
+    """Missing or corrupt chunk/manifest"""
+
+def iter_chunks(f, min_bytes=CHUNK_MIN_BYTES, max_bytes=CHUNK_MAX_BYTES, mask=CHUNK_MASK):
+    """Yield content-defined chunks (bytes) of a binary file"""
+    pending = []
+    size = 0
+    for line in f:
+        while len(line) > max_bytes:
+            # Huge single line (inline image): fixed cuts inside it
+            if pending:
+                yield b''.join(pending)
+                pending, size = [], 0
+            yield line[:max_bytes]
+            line = line[max_bytes:]
+
+        if size + len(line) > max_bytes and pending:
+            yield b''.join(pending)
+            pending, size = [], 0
+
+        pending.append(line)
+        size += len(line)
+        if size >= min_bytes and zlib.crc32(line) & mask == 0:
+            yield b''.join(pending)
+            pending, size = [], 0
+
+    if pending:
+        yield b''.join(pending)
+
+class BackupStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.chunk_dir = os.path.join(root, "chunks")
+        self.manifest_dir = os.path.join(root, "manifests")
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+
+    def _chunk_paths(self, digest):
+        base = os.path.join(self.chunk_dir, digest[:2], digest)
+        return base + ".zst", base + ".gz"
+
+    def has_chunk(self, digest):
+        return any(os.path.exists(path) for path in self._chunk_paths(digest))
+
+    def put_chunk(self, digest, data):
+        """Store a chunk unless present, return compressed bytes written (0 if deduplicated)"""
+        if self.has_chunk(digest):
+            return 0
+        zst_path, gz_path = self._chunk_paths(digest)
+        if zstandard:
+            path, compressed = zst_path, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        else:
+            path, compressed = gz_path, gzip.compress(data, GZIP_LEVEL, mtime=0)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        return len(compressed)
+
+    def get_chunk(self, digest):
+        zst_path, gz_path = self._chunk_paths(digest)
+        if os.path.exists(zst_path):
+            if not zstandard:
+                raise StoreError(f"chunk {digest} is zstd compressed; install zstandard to read it")
+            with open(zst_path, 'rb') as f:
+                data = zstandard.ZstdDecompressor().decompress(f.read())
+        elif os.path.exists(gz_path):
+            with open(gz_path, 'rb') as f:
+                data = gzip.decompress(f.read())
+        else:
+            raise StoreError(f"missing chunk {digest}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise StoreError(f"corrupt chunk {digest}")
+        return data
+
+    def manifest_path(self, name):
+        return os.path.join(self.manifest_dir, f"{name}.json")
+
+    def add(self, dump_path, name=None):
+        """Store a dump, return its manifest (with new_chunks / stored_bytes stats)"""
+        name = name or os.path.basename(dump_path).split('.')[0]
+        whole = hashlib.sha256()
+        chunks = []
+        new_chunks = 0
+        stored_bytes = 0
+
+        with open(dump_path, 'rb') as f:
+            for data in iter_chunks(f):
+                whole.update(data)
+                digest = hashlib.sha256(data).hexdigest()
+                written = self.put_chunk(digest, data)
+                new_chunks += bool(written)
+                stored_bytes += written
+                chunks.append([digest, len(data)])
+
+        manifest = {
+            'name': name,
+            'source': os.path.basename(dump_path),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'size': sum(size for _, size in chunks),
+            'sha256': whole.hexdigest(),
+            'chunks': chunks,
+        }
+        tmp_path = self.manifest_path(name) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path(name))
+        return dict(manifest, new_chunks=new_chunks, stored_bytes=stored_bytes)
+
+    def load_manifest(self, name):
+        path = self.manifest_path(name)
+        if not os.path.exists(path):
+            raise StoreError(f"no backup named {name}")
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def manifests(self):
+        """All manifests, oldest first"""
+        names = sorted(entry[:-5] for entry in os.listdir(self.manifest_dir) if entry.endswith('.json'))
+        return [self.load_manifest(name) for name in names]
+
+    def restore(self, name, out):
+        """Stream a backup into a binary file object, verifying every chunk and the whole dump"""
+        manifest = self.load_manifest(name)
+        whole = hashlib.sha256()
+        for digest, _ in manifest['chunks']:
+            data = self.get_chunk(digest)
+            whole.update(data)
+            out.write(data)
+        if whole.hexdigest() != manifest['sha256']:
+            raise StoreError(f"{name}: restored dump does not match its sha256")
+        return manifest
+
+    def prune(self, keep_days):
+        """Drop manifests older than keep_days and chunks no manifest uses; return (manifests, chunks) removed"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+        removed_manifests = 0
+        for manifest in self.manifests():
+            if datetime.fromisoformat(manifest['created_at']) < cutoff:
+                os.remove(self.manifest_path(manifest['name']))
+                removed_manifests += 1
+
+        live = {digest for manifest in self.manifests() for digest, _ in manifest['chunks']}
+        removed_chunks = 0
+        for prefix in os.listdir(self.chunk_dir):
+            directory = os.path.join(self.chunk_dir, prefix)
+            for entry in os.listdir(directory):
+                if entry.split('.')[0] not in live:
+                    os.remove(os.path.join(directory, entry))
+                    removed_chunks += 1
+        return removed_manifests, removed_chunks
+
+    def disk_usage(self):
+        total = 0
+        for directory, _, files in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(directory, entry)) for entry in files)
+        return total
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="중복 제거 + 압축 증분 백업 저장소")
+    parser.add_argument('--store', default=STORE_DIR, help="저장소 디렉터리")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="덤프를 저장소에 추가")
+    add.add_argument('dumps', nargs='+')
+    add.add_argument('--name', help="백업 이름 (기본: 파일 이름)")
+    add.add_argument('--delete-source', action='store_true', help="저장 + 검증 후 원본 .sql 삭제")
+
+    commands.add_parser('list', help="백업 목록")
+
+    restore = commands.add_parser('restore', help="백업을 SQL 덤프로 복원")
+    restore.add_argument('name')
+    restore.add_argument('-o', '--output', help="출력 파일 (기본: stdout)")
+
+    prune = commands.add_parser('prune', help="오래된 백업과 사용되지 않는 청크 삭제")
+    prune.add_argument('--keep-days', type=int, required=True)
+
+    args = parser.parse_args(argv)
+    store = BackupStore(args.store)
+
+    if args.command == 'add':
+        if args.name and len(args.dumps) > 1:
+            parser.error("--name 은 덤프 하나에만 사용할 수 있습니다")
+        for dump_path in args.dumps:
+            started = time.time()
+            manifest = store.add(dump_path, args.name)
+            print(f"✓ {manifest['name']}: {format_bytes(manifest['size'])}, 청크 {len(manifest['chunks'])}개 "
+                  f"(새 청크 {manifest['new_chunks']}개, {format_bytes(manifest['stored_bytes'])} 저장, "
+                  f"{time.time() - started:.2f}s)")
+            if args.delete_source:
+                # Prove the stored copy restores byte-for-byte before dropping the original
+                with open(os.devnull, 'wb') as devnull:
+                    store.restore(manifest['name'], devnull)
+                os.remove(dump_path)
+        print(f"📦 저장소 크기: {format_bytes(store.disk_usage())}")
+
+    elif args.command == 'list':
+        manifests = store.manifests()
+        for manifest in manifests:
+            print(f"{manifest['name']}  {format_bytes(manifest['size']):>10}  "
+                  f"청크 {len(manifest['chunks'])}개  {manifest['created_at'][:19]}")
+        logical = sum(manifest['size'] for manifest in manifests)
+        print(f"\n📦 백업 {len(manifests)}개, 원본 합계 {format_bytes(logical)} → "
+              f"저장소 {format_bytes(store.disk_usage())}")
+
+    elif args.command == 'restore':
+        try:
+            if args.output:
+                with open(args.output, 'wb') as out:
+                    store.restore(args.name, out)
+                print(f"✓ 복원 완료: {args.output}", file=sys.stderr)
+            else:
+                store.restore(args.name, sys.stdout.buffer)
+        except StoreError as e:
+            print(f"❌ 복원 실패: {e}", file=sys.stderr)
+            return 1
+
+    elif args.command == 'prune':
+        manifests, chunks = store.prune(args.keep_days)
+        print(f"✓ 백업 {manifests}개, 청크 {chunks}개 삭제 (저장소 {format_bytes(store.disk_usage())})")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+썸네일 변형 이미지 빌드 (WebP/AVIF × 여러 너비)
+
+Transcodes every campaign thumbnail in R2 ({id}.jpg) into WebP and AVIF
+at the card / detail / OG widths on a process pool, and uploads them
+under predictable keys that /api/images/* picks from Accept and ?w=:
+
+  13.jpg → variants/13/480.avif, variants/13/480.webp, variants/13/1024.avif, ...
+
+Sources whose bytes are unchanged since the last build are skipped
+(image-variants.{remote,local}.json) as long as their variants are still
+in R2, and uploads go through the upload manifest so identical outputs
+are not put twice.
+
+AVIF needs Pillow >= 11.3 or pillow-avif-plugin; without it only WebP
+variants are built (the route falls back to WebP/the original).
+
+Usage:
+  python3 build_image_variants.py              # 전체 빌드 (production)
+  python3 build_image_variants.py --local      # 로컬 miniflare R2
+  python3 build_image_variants.py --force      # 변경 여부와 관계없이 재빌드
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import argparse
+import tempfile
+import json
+import time
+import sys
+import os
+
+from PIL import Image, ImageOps
+
+from d1_client import get_client
+from r2_manifest import UploadManifest, file_sha256
+from r2_migrate import with_retry
+
+try:
+    import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+except ImportError:
+    pass
+
+# Must match IMAGE_VARIANT_WIDTHS in src/index.ts
+VARIANT_WIDTHS = {'card': 480, 'detail': 1024, 'og': 1200}
+# ext → (Pillow format, content type, save options); preferred first
+VARIANT_FORMATS = {
+    'avif': ('AVIF', 'image/avif', {'quality': 50, 'speed': 6}),
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 6}),
+}
+
+IMAGE_URL_PREFIX = "/api/images/"
+VARIANT_STATE_FILE = "image-variants.{mode}.json"
+
+# Processes for transcoding, threads for R2 downloads/uploads
+TRANSCODE_WORKERS = os.cpu_count() or 4
+IO_WORKERS = 8
+
+def load_state(path):
+    """{source key: sha256 of the source last built} ({} before the first build)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state, path):
+    """Write the build state atomically"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def variant_key(source_key, width, ext):
+    stem = source_key.rsplit('.', 1)[0]
+    return f"variants/{stem}/{width}.{ext}"
+
+def available_formats():
+    Image.init()
+    return [ext for ext, (fmt, _, _) in VARIANT_FORMATS.items() if fmt in Image.SAVE]
+
+def transcode(source_key, source_path, out_dir, formats):
+    """Render every width × format of one source, return [(key, path, content_type)]
+
+    Runs in a worker process. Sources narrower than a width are not
+    upscaled; the variant is written at the source width.
+    """
+    outputs = []
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+        for width in sorted(set(VARIANT_WIDTHS.values())):
+            target = min(width, image.width)
+            if target == image.width:
+                resized = image
+            else:
+                resized = image.resize((target, max(1, round(image.height * target / image.width))),
+                                       Image.LANCZOS)
+
+            for ext in formats:
+                fmt, content_type, options = VARIANT_FORMATS[ext]
+                key = variant_key(source_key, width, ext)
+                path = os.path.join(out_dir, key.replace('/', '_'))
+                resized.save(path, fmt, **options)
+                outputs.append((key, path, content_type))
+    return outputs
+
+def iter_source_keys(client):
+    """Distinct R2 keys that campaigns.thumbnail_image points at"""
+    rows = with_retry(lambda: client.query(
+        "SELECT DISTINCT thumbnail_image FROM campaigns WHERE thumbnail_image LIKE ? ORDER BY 1",
+        [IMAGE_URL_PREFIX + '%']
+    ), "썸네일 목록 조회")
+    keys = []
+    for row in rows:
+        key = row['thumbnail_image'][len(IMAGE_URL_PREFIX):].split('?', 1)[0]
+        if key and not key.startswith('variants/'):
+            keys.append(key)
+    return keys
+
+def download(client, key, out_dir, built_digest=None, probe_key=None):
+    """Fetch one source from R2, return (path, sha256, up to date) or None if missing
+
+    Up to date: the bytes match the last build (built_digest) and its
+    variants are still in R2. The worker deletes variants/{id}/ whenever a
+    thumbnail is replaced, even with identical bytes, so one variant
+    (probe_key) is checked with a HEAD.
+    """
+    path = os.path.join(out_dir, 'src_' + key.replace('/', '_'))
+    if with_retry(lambda: client.r2_get(key, path), f"{key} 다운로드") is None:
+        return None
+    digest = file_sha256(path)
+    up_to_date = digest == built_digest and probe_key is not None and \
+        with_retry(lambda: client.r2_head(probe_key), f"{probe_key} 확인") is not None
+    return path, digest, up_to_date
+
+def upload_variants(client, manifest, outputs):
+    """Put transcoded variants, return (bytes by width, number actually uploaded)"""
+    sizes = {}
+    uploaded_count = 0
+    for key, path, content_type in outputs:
+        _, uploaded = manifest.put(client, key, path, content_type, put=lambda k, p, ct: with_retry(
+            lambda: client.r2_put(k, p, ct), f"{k} 업로드"
+        ))
+        uploaded_count += uploaded
+        width = int(key.rsplit('/', 1)[1].split('.')[0])
+        size = os.path.getsize(path)
+        sizes[width] = min(sizes.get(width, size), size)
+        os.unlink(path)
+    return sizes, uploaded_count
+
+def build(remote=True, workers=TRANSCODE_WORKERS, force=False, keys=None):
+    """Build variants for all (or the given) source keys, return (built, skipped, failed)"""
+    client = get_client(remote)
+    manifest = UploadManifest.for_mode(remote)
+    state_path = VARIANT_STATE_FILE.format(mode='remote' if remote else 'local')
+    state = load_state(state_path)
+    formats = available_formats()
+    if 'avif' not in formats:
+        print("⚠️  AVIF 인코더 없음 (Pillow >= 11.3 또는 pillow-avif-plugin 필요) → WebP만 생성")
+
+    keys = keys or iter_source_keys(client)
+    if not formats:
+        print("❌ Pillow에 WebP/AVIF 인코더가 없음 → 변형 이미지를 만들 수 없음")
+        manifest.close()
+        return 0, 0, len(keys)
+    print(f"🖼️  원본 {len(keys)}개, 형식 {formats}, 너비 {sorted(set(VARIANT_WIDTHS.values()))}\n")
+
+    counts = {'built': 0, 'skip': 0, 'fail': 0}
+    source_bytes = 0
+    card_bytes = 0
+
+    with tempfile.TemporaryDirectory() as out_dir, \
+            ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool, \
+            ProcessPoolExecutor(max_workers=workers) as cpu_pool:
+        downloads = {
+            io_pool.submit(download, client, key, out_dir, None if force else state.get(key),
+                           variant_key(key, VARIANT_WIDTHS['card'], formats[0])): key
+            for key in keys
+        }
+        transcodes = {}
+        for future in as_completed(downloads):
+            key = downloads[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"   ❌ {key}: 다운로드 실패 - {e}")
+                counts['fail'] += 1
+                continue
+            if result is None:
+                print(f"   ⚠️  {key}: R2에 원본 없음")
+                counts['fail'] += 1
+                continue
+
+            path, digest, up_to_date = result
+            if up_to_date:
+                counts['skip'] += 1
+                os.unlink(path)
+                continue
+            transcodes[cpu_pool.submit(transcode, key, path, out_dir, formats)] = (key, path, digest)
+
+        uploads = {}
+        for future in as_completed(transcodes):
+            key, path, digest = transcodes[future]
+            try:
+                outputs = future.result()
+            except Exception as e:
+                print(f"   ❌ {key}: 변환 실패 - {e}")
+                counts['fail'] += 1
+                continue
+            finally:
+                source_size = os.path.getsize(path)
+                os.unlink(path)
+            uploads[io_pool.submit(upload_variants, client, manifest, outputs)] = (key, digest, source_size)
+
+        for future in as_completed(uploads):
+            key, digest, source_size = uploads[future]
+            try:
+                sizes, uploaded = future.result()
+            except Exception as e:
+                print(f"   ❌ {key}: 업로드 실패 - {e}")
+                counts['fail'] += 1
+                continue
+
+            card = sizes.get(VARIANT_WIDTHS['card'])
+            if card is None:
+                print(f"   ⚠️  {key}: 만들어진 변형 이미지 없음")
+                counts['fail'] += 1
+                continue
+            source_bytes += source_size
+            card_bytes += card
+            print(f"   ✅ {key}: {source_size:,} → 카드 {card:,} bytes (업로드 {uploaded}개)")
+            state[key] = digest
+            counts['built'] += 1
+
+    manifest.close()
+    save_state(state, state_path)
+
+    if source_bytes:
+        print(f"\n📉 카드 이미지: {source_bytes:,} → {card_bytes:,} bytes "
+              f"({source_bytes / max(card_bytes, 1):.1f}x 감소)")
+    return counts['built'], counts['skip'], counts['fail']
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="썸네일 WebP/AVIF 변형 이미지 빌드")
+    parser.add_argument('--local', action='store_true', help="로컬 miniflare D1/R2 대상")
+    parser.add_argument('--workers', type=int, default=TRANSCODE_WORKERS)
+    parser.add_argument('--force', action='store_true', help="변경되지 않은 원본도 다시 빌드")
+    parser.add_argument('keys', nargs='*', help="특정 R2 키만 빌드 (예: 13.jpg)")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    built, skipped, failed = build(remote=not args.local, workers=args.workers,
+                                   force=args.force, keys=args.keys)
+
+    print(f"\n📊 결과 ({time.time() - started:.1f}s): ✅ {built}개 빌드, "
+          f"⏭️  {skipped}개 변경 없음, ❌ {failed}개 실패")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
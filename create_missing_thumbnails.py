@@ -2,11 +2,13 @@
 """
 누락된 캠페인의 기본 썸네일 생성 및 R2 업로드
 """
-from PIL import Image, ImageDraw
-import subprocess
 import tempfile
 import os
 
+from d1_client import D1Error, get_client
+from r2_manifest import UploadManifest
+from thumbnails import render_batch
+
 # 누락된 캠페인 ID 목록
 missing_ids = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 23]
 
@@ -19,64 +21,53 @@ colors = [
     ('#EC4899', '#F472B6'),  # 핑크
 ]
 
-print("🚀 누락된 캠페인 썸네일 생성 시작...\n")
+if __name__ == "__main__":
+    print("🚀 누락된 캠페인 썸네일 생성 시작...\n")
+
+    success_count = 0
+    skip_count = 0
+    fail_count = 0
+    manifest = UploadManifest.for_mode(remote=True)
+
+    # 그라디언트 이미지 생성 (프로세스 풀, 디스크 캐시)
+    images = render_batch([
+        (*colors[idx % len(colors)], None, (400, 300)) for idx in range(len(missing_ids))
+    ])
 
-success_count = 0
-fail_count = 0
+    for campaign_id, image_data in zip(missing_ids, images):
+        print(f"📤 Campaign {campaign_id}: 생성 및 업로드 중...")
 
-for idx, campaign_id in enumerate(missing_ids):
-    color_pair = colors[idx % len(colors)]
-    
-    print(f"📤 Campaign {campaign_id}: 생성 및 업로드 중...")
-    
-    try:
-        # 그라디언트 이미지 생성
-        width, height = 400, 300
-        image = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(image)
-        
-        # 수평 그라디언트
-        for y in range(height):
-            ratio = y / height
-            r1, g1, b1 = int(color_pair[0][1:3], 16), int(color_pair[0][3:5], 16), int(color_pair[0][5:7], 16)
-            r2, g2, b2 = int(color_pair[1][1:3], 16), int(color_pair[1][3:5], 16), int(color_pair[1][5:7], 16)
-            
-            r = int(r1 + (r2 - r1) * ratio)
-            g = int(g1 + (g2 - g1) * ratio)
-            b = int(b1 + (b2 - b1) * ratio)
-            
-            draw.rectangle([(0, y), (width, y+1)], fill=(r, g, b))
-        
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-            image.save(tmp_file.name, 'JPEG', quality=85)
-            tmp_path = tmp_file.name
-        
-        # R2에 업로드
-        r2_key = f'{campaign_id}.jpg'
-        upload_result = subprocess.run([
-            'npx', 'wrangler', 'r2', 'object', 'put',
-            f'reviewsphere-images/{r2_key}',
-            '--file', tmp_path,
-            '--content-type', 'image/jpeg',
-            '--remote'
-        ], capture_output=True, text=True, cwd='/home/user/webapp')
-        
-        # 임시 파일 삭제
-        os.unlink(tmp_path)
-        
-        if upload_result.returncode == 0:
-            print(f"   ✅ 업로드 완료: {r2_key}")
-            success_count += 1
-        else:
-            print(f"   ❌ 업로드 실패: {upload_result.stderr}")
+        try:
+            # 임시 파일로 저장
+            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
+                tmp_file.write(image_data)
+                tmp_path = tmp_file.name
+
+            # R2에 업로드
+            r2_key = f'{campaign_id}.jpg'
+            try:
+                _, uploaded = manifest.put(get_client(remote=True), r2_key, tmp_path, 'image/jpeg')
+                if uploaded:
+                    print(f"   ✅ 업로드 완료: {r2_key}")
+                    success_count += 1
+                else:
+                    print(f"   ⏭️  변경 없음 (스킵): {r2_key}")
+                    skip_count += 1
+            except D1Error as e:
+                print(f"   ❌ 업로드 실패: {e}")
+                fail_count += 1
+            finally:
+                # 임시 파일 삭제
+                os.unlink(tmp_path)
+
+        except Exception as e:
+            print(f"   ❌ 오류: {e}")
             fail_count += 1
-    
-    except Exception as e:
-        print(f"   ❌ 오류: {e}")
-        fail_count += 1
 
-print(f"\n📊 업로드 결과:")
-print(f"   ✅ 성공: {success_count}개")
-print(f"   ❌ 실패: {fail_count}개")
-print("\n🎉 썸네일 생성 완료!")
+    manifest.close()
+
+    print(f"\n📊 업로드 결과:")
+    print(f"   ✅ 성공: {success_count}개")
+    print(f"   ⏭️  스킵: {skip_count}개")
+    print(f"   ❌ 실패: {fail_count}개")
+    print("\n🎉 썸네일 생성 완료!")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Shared D1/R2 client for the Python tools
+
+Instead of spawning `npx wrangler ...` for every query or upload, one
+long-lived helper process (scripts/d1-bridge.mjs) is started per mode and
+requests are pipelined to it over stdin/stdout as JSON lines. Responses
+are matched by id, so many requests can be in flight at once (from one
+thread or several).
+
+  --remote: Cloudflare REST API (CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID)
+  --local:  miniflare state in .wrangler/state/v3 (offline testing)
+
+Usage:
+  from d1_client import get_client
+  rows = get_client(remote=True).query("SELECT * FROM users WHERE id = ?", [1])
+"""
+
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from collections import deque
+import subprocess
+import threading
+import atexit
+import json
+import sys
+import os
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BRIDGE_SCRIPT = os.path.join(REPO_DIR, "scripts", "d1-bridge.mjs")
+
+# Seconds to wait for the helper to start (wrangler/miniflare bootstrap)
+STARTUP_TIMEOUT = 120
+# Last lines of the helper's stderr kept for startup error messages
+STDERR_TAIL_LINES = 20
+
+class D1Error(Exception):
+    """Raised when the bridge reports a failed D1/R2 request"""
+
+class D1Client:
+    """Pipelined JSON-lines client for one scripts/d1-bridge.mjs process"""
+
+    def __init__(self, remote=True, bridge=BRIDGE_SCRIPT):
+        self.remote = remote
+        self.proc = subprocess.Popen(
+            ['node', bridge, '--remote' if remote else '--local'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding='utf-8', bufsize=1, cwd=REPO_DIR
+        )
+        self.stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        self.next_id = 1
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.ready = Future()
+        self.pending[0] = self.ready
+
+        self.reader = threading.Thread(target=self._read_responses, daemon=True)
+        self.reader.start()
+        self.stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self.stderr_reader.start()
+
+        # Wait for the helper's {"id": 0, "ready": true} handshake
+        try:
+            self.ready.result(timeout=STARTUP_TIMEOUT)
+        except FutureTimeoutError:
+            self._kill()
+            raise D1Error(f"d1-bridge did not start within {STARTUP_TIMEOUT}s{self._stderr_summary()}") from None
+        except D1Error as e:
+            self._kill()
+            raise D1Error(f"d1-bridge failed to start: {e}{self._stderr_summary()}") from None
+
+    def _read_responses(self):
+        for line in self.proc.stdout:
+            # wrangler may print banners/warnings; only JSON objects are responses
+            if not line.startswith('{'):
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            with self.lock:
+                future = self.pending.pop(message.get('id'), None)
+            if future is None:
+                continue
+            if message.get('ok'):
+                future.set_result(message)
+            else:
+                future.set_exception(D1Error(message.get('error', 'unknown error')))
+
+        # Helper exited: fail everything still waiting
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(D1Error("d1-bridge exited"))
+
+    def _read_stderr(self):
+        # Pass the helper's logs through, keeping the tail for error messages
+        for line in self.proc.stderr:
+            self.stderr_tail.append(line.rstrip('\n'))
+            sys.stderr.write(line)
+
+    def _stderr_summary(self):
+        lines = list(self.stderr_tail)
+        return "\n  " + "\n  ".join(lines) if lines else " (no stderr output)"
+
+    def _kill(self):
+        """Stop a helper that never became ready"""
+        self.proc.kill()
+        self.proc.wait()
+        self.reader.join(timeout=5)
+        self.stderr_reader.join(timeout=5)
+
+    def submit(self, op, **payload):
+        """Send a request without waiting; returns a Future of the response"""
+        future = Future()
+        with self.lock:
+            request_id = self.next_id
+            self.next_id += 1
+            self.pending[request_id] = future
+            try:
+                self.proc.stdin.write(json.dumps({'id': request_id, 'op': op, **payload}) + "\n")
+                self.proc.stdin.flush()
+            except (BrokenPipeError, ValueError) as e:
+                self.pending.pop(request_id, None)
+                future.set_exception(D1Error(f"d1-bridge is not running: {e}"))
+        return future
+
+    def query(self, sql, params=()):
+        """Run one statement, return its rows as dicts"""
+        return self.submit('query', sql=sql, params=list(params)).result()['results']
+
+    def batch(self, statements):
+        """Run [(sql, params), ...] as one D1 batch, return a list of row lists"""
+        response = self.submit('batch', statements=[
+            {'sql': sql, 'params': list(params)} for sql, params in statements
+        ]).result()
+        return [result['results'] for result in response['results']]
+
+    def r2_put(self, key, path, content_type='image/jpeg'):
+        """Upload a local file to the R2 bucket bound as R2"""
+        return self.submit('r2_put', key=key, file=os.path.abspath(path),
+                           content_type=content_type).result()['results'][0]
+
+    def r2_get(self, key, path):
+        """Download an R2 object to a local file, return its metadata (None if missing)"""
+        results = self.submit('r2_get', key=key, file=os.path.abspath(path)).result()['results']
+        return results[0] if results else None
+
+    def r2_head(self, key):
+        """Size and etag of an R2 object without downloading it (None if missing)"""
+        results = self.submit('r2_head', key=key).result()['results']
+        return results[0] if results else None
+
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            try:
+                self.proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+        self.reader.join(timeout=5)
+        self.stderr_reader.join(timeout=5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(remote=True):
+    """Shared client per mode, started on first use and closed at exit"""
+    with _clients_lock:
+        client = _clients.get(remote)
+        if client is None or client.proc.poll() is not None:
+            client = D1Client(remote=remote)
+            _clients[remote] = client
+        return client
+
+@atexit.register
+def _close_clients():
+    for client in list(_clients.values()):
+        client.close()
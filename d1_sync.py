@@ -0,0 +1,682 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for syncing the production D1 database to local
+(used by sync-prod-to-local.py and sync-prod-to-local-v2.py)
+
+Full sync replaces every table; incremental sync (the default once a
+state file exists) only fetches rows past a per-table high-water mark
+and upserts them. Tables are discovered from migrations/ (or production),
+exported concurrently and applied in foreign-key order.
+
+Production is read through the shared d1-bridge client (d1_client.py),
+so exports no longer start a wrangler process per page.
+
+Sinks:
+  - file:     write one SQL dump file and apply it with a single wrangler call
+  - wrangler: apply each table with its own wrangler --file call
+  - sqlite:   write rows straight into the local miniflare SQLite file
+
+Every sink finishes by recomputing trigger-maintained data
+(derived_data.py): the triggers fire on the loaded rows on top of the
+copied values.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import tempfile
+import sqlite3
+import shutil
+import glob
+import json
+import os
+
+from d1_client import D1Error, get_client
+from derived_data import rebuild_sqlite, rebuild_statements
+
+DB_NAME = "review-spheres-v1-production"
+
+# Local D1 state written by `wrangler ... --local` (miniflare)
+LOCAL_D1_STATE_DIR = ".wrangler/state/v3/d1"
+
+# Keyset pagination for exports (rows per D1 response)
+EXPORT_PAGE_SIZE = 500
+# Tables whose rows can carry inline base64 images get smaller pages
+EXPORT_PAGE_SIZE_OVERRIDES = {
+    "campaigns": 20,
+    "reviews": 50,
+}
+
+# Per-table high-water marks for incremental sync
+SYNC_STATE_FILE = ".sync-state.json"
+# Timestamp column used as the watermark. Tables without it always take the
+# full-export path: their rows can change in place (application approvals,
+# notifications.read, ...) without anything a delta could see
+WATERMARK_COLUMN = "updated_at"
+
+# Multi-row INSERT limits (D1 rejects SQL statements over 100 KB)
+BATCH_MAX_ROWS = 100
+BATCH_MAX_BYTES = 90 * 1024
+
+# Schema source for table discovery and the foreign-key DAG
+MIGRATIONS_DIR = "migrations"
+# Internal tables that are never synced
+SKIP_TABLES = {"d1_migrations", "sqlite_sequence",
+               # Trigger-derived rollups (0107): no id column, rebuilt locally by derived_data.py
+               "daily_stats", "daily_visitor_ips"}
+
+# Concurrent table exports
+SYNC_WORKERS = 4
+
+def run_d1_query(sql, params=(), remote=True):
+    """Run one statement through the shared d1-bridge client, return rows (None on error)"""
+    try:
+        return get_client(remote).query(sql, params)
+    except D1Error as e:
+        print(f"Error executing query: {e}")
+        return None
+
+class ExportError(Exception):
+    """Raised when a page of a table cannot be fetched from D1"""
+
+def export_table(table, page_size=None, remote=True, condition=None, condition_params=()):
+    """Stream a table from D1 one page at a time
+
+    Pages with `WHERE id > ? ORDER BY id LIMIT n` instead of a single
+    `SELECT *`, so each D1 response (and peak memory) is bounded by the
+    page size. An optional SQL condition narrows the rows (delta sync).
+    Yields lists of row dicts.
+    """
+    page_size = page_size or EXPORT_PAGE_SIZE_OVERRIDES.get(table, EXPORT_PAGE_SIZE)
+    last_id = None
+
+    while True:
+        clauses = [f"({condition})"] if condition else []
+        params = list(condition_params)
+        if last_id is not None:
+            clauses.append("id > ?")
+            params.append(last_id)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = run_d1_query(
+            f"SELECT * FROM {table} {where}ORDER BY id LIMIT ?", params + [page_size], remote=remote
+        )
+        if rows is None:
+            raise ExportError(f"Failed to fetch {table} after id {last_id}")
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+def run_wrangler_sql_file(path, remote=False):
+    """Execute a SQL file with a single wrangler process
+
+    wrangler runs every statement of --file as one D1 batch, so the whole
+    script is applied in a single transaction.
+    """
+    location = "--remote" if remote else "--local"
+    result = subprocess.run(
+        ['npx', 'wrangler', 'd1', 'execute', DB_NAME, location, f'--file={path}', '--yes'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"Error: {result.stderr.strip()[:500]}")
+        return False
+    return True
+
+def escape_sql_value(value):
+    """Escape value for SQL INSERT"""
+    if value is None:
+        return "NULL"
+    elif isinstance(value, (int, float)):
+        return str(value)
+    else:
+        # Escape single quotes
+        return "'" + str(value).replace("'", "''") + "'"
+
+def upsert_clause(columns):
+    """ON CONFLICT(id) clause that overwrites every non-key column"""
+    assignments = ", ".join(f"{col} = excluded.{col}" for col in columns if col != 'id')
+    if not assignments:
+        return " ON CONFLICT(id) DO NOTHING"
+    return f" ON CONFLICT(id) DO UPDATE SET {assignments}"
+
+def build_insert_batches(table, columns, rows, max_rows=BATCH_MAX_ROWS, max_bytes=BATCH_MAX_BYTES,
+                         upsert=False):
+    """Group rows into multi-row INSERT statements capped by row count and byte size
+
+    A single row larger than max_bytes (e.g. inline base64 thumbnail) is
+    emitted as its own statement since it cannot be split further.
+    With upsert=True each statement ends with an ON CONFLICT(id) update.
+    """
+    prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    suffix = (upsert_clause(columns) if upsert else "") + ";"
+    prefix_size = len(prefix.encode('utf-8')) + len(suffix.encode('utf-8'))
+
+    statements = []
+    batch = []
+    batch_size = prefix_size
+
+    for row in rows:
+        values = "(" + ", ".join(escape_sql_value(row.get(col)) for col in columns) + ")"
+        # +2 for the ", " separator between tuples
+        value_size = len(values.encode('utf-8')) + 2
+
+        if batch and (len(batch) >= max_rows or batch_size + value_size > max_bytes):
+            statements.append(prefix + ", ".join(batch) + suffix)
+            batch = []
+            batch_size = prefix_size
+
+        batch.append(values)
+        batch_size += value_size
+
+    if batch:
+        statements.append(prefix + ", ".join(batch) + suffix)
+
+    return statements
+
+def find_local_d1_sqlite(state_dir=LOCAL_D1_STATE_DIR):
+    """Locate the miniflare SQLite file that backs the local D1 database
+
+    miniflare names the file after a hash of the database id, so pick the
+    database that has the app schema (most recently modified if several).
+    """
+    candidates = [
+        path for path in glob.glob(os.path.join(state_dir, '**', '*.sqlite'), recursive=True)
+        if os.path.basename(path) != 'metadata.sqlite'
+    ]
+
+    matches = []
+    for path in candidates:
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                found = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            continue
+        if found:
+            matches.append(path)
+
+    if not matches:
+        return None
+    return max(matches, key=os.path.getmtime)
+
+class SqlFileSink:
+    """Write every table into one SQL dump file, then apply it with one wrangler call"""
+
+    name = "file"
+
+    def __init__(self, sql_file="prod-to-local-sync.sql"):
+        self.sql_file = sql_file
+        self.f = open(sql_file, 'w', encoding='utf-8')
+        self.f.write("-- Production DB Sync Script\n")
+        self.f.write("-- Generated automatically\n\n")
+        # Disable foreign keys temporarily
+        self.f.write("PRAGMA foreign_keys = OFF;\n\n")
+
+    def load_table(self, table, pages, upsert=False):
+        """Write DELETE + batched INSERTs for a stream of pages, return row count
+
+        Statements are spooled to a temp file first so a failed export
+        never leaves a half-written table in the dump. With upsert=True
+        the table is not cleared and rows are merged by id.
+        """
+        row_count = 0
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+            for rows in pages:
+                for statement in build_insert_batches(table, list(rows[0].keys()), rows, upsert=upsert):
+                    spool.write(statement + "\n")
+                row_count += len(rows)
+
+            self.f.write(f"-- Table {table}: {row_count} rows{' (delta)' if upsert else ''}\n")
+            if not upsert:
+                self.f.write(f"DELETE FROM {table};\n")
+            spool.seek(0)
+            shutil.copyfileobj(spool, self.f)
+            self.f.write("\n")
+
+        return row_count
+
+    def close(self):
+        # Trigger-maintained columns were double counted while loading (derived_data.py)
+        self.f.write("-- Derived data\n")
+        for sql in rebuild_statements(keep_history=False):
+            self.f.write(sql + ";\n")
+        # Re-enable foreign keys
+        self.f.write("\nPRAGMA foreign_keys = ON;\n")
+        self.f.close()
+
+        print(f"\nSQL dump created: {self.sql_file}")
+        print("Applying to local database...")
+        result = subprocess.run(
+            ['npx', 'wrangler', 'd1', 'execute', DB_NAME, '--local', f'--file={self.sql_file}'],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(result.stderr)
+            return False
+        return True
+
+class WranglerSink:
+    """Apply each table with its own wrangler --file call (one transaction per table)"""
+
+    name = "wrangler"
+
+    def load_table(self, table, pages, upsert=False):
+        """Spool batched INSERTs to a temp file and apply it, return row count"""
+        with tempfile.NamedTemporaryFile('w', suffix='.sql', delete=False, encoding='utf-8') as tmp_file:
+            tmp_path = tmp_file.name
+            if not upsert:
+                tmp_file.write(f"DELETE FROM {table};\n")
+
+            row_count = 0
+            batch_count = 0
+            try:
+                for rows in pages:
+                    for statement in build_insert_batches(table, list(rows[0].keys()), rows, upsert=upsert):
+                        tmp_file.write(statement + "\n")
+                        batch_count += 1
+                    row_count += len(rows)
+            except Exception:
+                tmp_file.close()
+                os.unlink(tmp_path)
+                raise
+
+        if row_count == 0 and upsert:
+            return 0
+        print(f"  📦 {row_count} rows → {batch_count} INSERT batches")
+        try:
+            if not run_wrangler_sql_file(tmp_path, remote=False):
+                return None
+        finally:
+            os.unlink(tmp_path)
+        return row_count
+
+    def close(self):
+        """Recompute trigger-maintained columns once every table is loaded"""
+        with tempfile.NamedTemporaryFile('w', suffix='.sql', delete=False, encoding='utf-8') as tmp_file:
+            tmp_path = tmp_file.name
+            for sql in rebuild_statements(keep_history=False):
+                tmp_file.write(sql + ";\n")
+        try:
+            return run_wrangler_sql_file(tmp_path, remote=False)
+        finally:
+            os.unlink(tmp_path)
+
+class SQLiteSink:
+    """Write rows straight into the local miniflare SQLite file
+
+    Values are bound as parameters (no SQL escaping) and each table is
+    loaded with executemany inside its own transaction. Foreign keys and
+    fsync are switched off for the duration of the sync.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path=None):
+        self.path = path or find_local_d1_sqlite()
+        if not self.path:
+            raise FileNotFoundError(
+                f"No local D1 database under {LOCAL_D1_STATE_DIR} "
+                f"(run `npm run db:migrate:local` first)"
+            )
+
+        # Autocommit mode: transactions are managed explicitly per table
+        self.conn = sqlite3.connect(self.path, isolation_level=None)
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        self.conn.execute("PRAGMA synchronous = OFF")
+
+    def table_columns(self, table):
+        return [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+
+    def row_count(self, table):
+        try:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        except sqlite3.Error:
+            return None
+
+    def load_table(self, table, pages, upsert=False):
+        """Load a stream of pages in one transaction, return row count"""
+        local_columns = self.table_columns(table)
+        if not local_columns:
+            print(f"  ⚠️  Table {table} does not exist locally")
+            return None
+
+        row_count = 0
+        columns = None
+        sql = None
+
+        try:
+            self.conn.execute("BEGIN")
+            if not upsert:
+                self.conn.execute(f"DELETE FROM {table}")
+
+            for rows in pages:
+                if columns is None:
+                    columns = [col for col in rows[0].keys() if col in local_columns]
+                    skipped = [col for col in rows[0].keys() if col not in local_columns]
+                    if skipped:
+                        print(f"  ⚠️  Skipping columns missing locally: {', '.join(skipped)}")
+                    placeholders = ', '.join('?' for _ in columns)
+                    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+                    if upsert:
+                        sql += upsert_clause(columns)
+
+                self.conn.executemany(sql, (tuple(row.get(col) for col in columns) for row in rows))
+                row_count += len(rows)
+
+            self.conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self.conn.execute("ROLLBACK")
+            print(f"  ❌ SQLite error: {e}")
+            return None
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return row_count
+
+    def close(self):
+        # Trigger-maintained columns were double counted while loading (derived_data.py)
+        ok = True
+        try:
+            rebuild_sqlite(self.conn, keep_history=False)
+        except sqlite3.Error as e:
+            print(f"  ❌ Derived data rebuild failed (local migrations applied?): {e}")
+            ok = False
+        self.conn.execute("PRAGMA synchronous = FULL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.close()
+        return ok
+
+SINKS = {
+    SqlFileSink.name: SqlFileSink,
+    WranglerSink.name: WranglerSink,
+    SQLiteSink.name: SQLiteSink,
+}
+
+def make_sink(name, sqlite_path=None):
+    """Create a sink by name"""
+    if name == SQLiteSink.name:
+        sink = SQLiteSink(sqlite_path)
+        print(f"🗄️  Local SQLite: {sink.path}")
+        return sink
+    return SINKS[name]()
+
+def load_sync_state(path=SYNC_STATE_FILE):
+    """Load per-table high-water marks ({} if no previous sync)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_sync_state(state, path=SYNC_STATE_FILE):
+    """Persist per-table high-water marks atomically"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def remote_table_columns(table):
+    """Column names of a production table (None on failure)"""
+    rows = run_d1_query(f"PRAGMA table_info({table})", remote=True)
+    if rows is None:
+        return None
+    return [row['name'] for row in rows]
+
+def remote_id_checksum(table):
+    """COUNT(*), SUM(id) and MAX(id) of a production table (None on failure)
+
+    A delete plus an insert between syncs keeps COUNT(*) but moves SUM(id).
+    """
+    rows = run_d1_query(
+        f"SELECT COUNT(*) AS count, COALESCE(SUM(id), 0) AS id_sum, MAX(id) AS max_id FROM {table}",
+        remote=True
+    )
+    if not rows:
+        return None
+    return rows[0]
+
+def normalize_timestamp(value):
+    """Normalize D1 timestamps to 'YYYY-MM-DD HH:MM:SS'
+
+    Rows carry both SQLite defaults ('2025-11-10 08:34:14') and JS ISO
+    strings ('2025-11-10T08:34:14.123Z'), which do not sort together.
+    """
+    if not value:
+        return None
+    return str(value)[:19].replace('T', ' ')
+
+def track_marks(pages, stats, watermark):
+    """Pass pages through while recording row count, new ids, max id and max watermark"""
+    for rows in pages:
+        for row in rows:
+            stats['rows'] += 1
+            if stats['previous_max_id'] is None or row['id'] > stats['previous_max_id']:
+                stats['new_rows'] += 1
+                stats['new_id_sum'] += row['id']
+            stats['max_id'] = max(stats['max_id'] or 0, row['id'])
+            mark = normalize_timestamp(row.get(watermark)) if watermark else None
+            if mark and (stats['mark'] is None or mark > stats['mark']):
+                stats['mark'] = mark
+        yield rows
+
+def schema_from_migrations(migrations_dir=MIGRATIONS_DIR):
+    """Build {table: set(referenced tables)} by applying migrations to an in-memory SQLite"""
+    conn = sqlite3.connect(":memory:")
+    try:
+        for path in sorted(glob.glob(os.path.join(migrations_dir, '*.sql'))):
+            with open(path, encoding='utf-8') as f:
+                conn.executescript(f.read())
+
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+        )]
+        return {
+            table: {row[2] for row in conn.execute(f"PRAGMA foreign_key_list({table})")}
+            for table in tables if table not in SKIP_TABLES
+        }
+    finally:
+        conn.close()
+
+def schema_from_remote():
+    """Build {table: set(referenced tables)} from production PRAGMA foreign_key_list"""
+    rows = run_d1_query(
+        "SELECT name FROM sqlite_master WHERE type = 'table' "
+        "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '_cf_%' ORDER BY name",
+        remote=True
+    )
+    if rows is None:
+        raise ExportError("Failed to list production tables")
+
+    schema = {}
+    for row in rows:
+        table = row['name']
+        if table in SKIP_TABLES:
+            continue
+        fks = run_d1_query(f"PRAGMA foreign_key_list({table})", remote=True)
+        if fks is None:
+            raise ExportError(f"Failed to read foreign keys of {table}")
+        schema[table] = {fk['table'] for fk in fks}
+    return schema
+
+def topological_order(schema):
+    """Order tables so every table comes after the tables it references
+
+    Self-references are ignored and references to unknown tables are
+    dropped; a cycle raises ValueError.
+    """
+    deps = {table: {ref for ref in refs if ref in schema and ref != table}
+            for table, refs in schema.items()}
+    order = []
+    ready = sorted(table for table, refs in deps.items() if not refs)
+
+    while ready:
+        table = ready.pop(0)
+        order.append(table)
+        for other in sorted(deps):
+            if table in deps[other]:
+                deps[other].discard(table)
+                if not deps[other]:
+                    ready.append(other)
+        ready.sort()
+        deps.pop(table)
+
+    remaining = [table for table in deps if table not in order]
+    if remaining:
+        raise ValueError(f"Foreign key cycle between tables: {', '.join(sorted(remaining))}")
+    return order
+
+def sync_tables_in_order(source="migrations"):
+    """Tables to sync in dependency order, discovered from the schema"""
+    schema = schema_from_remote() if source == "remote" else schema_from_migrations()
+    return topological_order(schema)
+
+def spool_pages(pages):
+    """Write pages to a temp file (one JSON page per line), return its path"""
+    with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as spool:
+        try:
+            for rows in pages:
+                spool.write(json.dumps(rows, ensure_ascii=False) + "\n")
+        except Exception:
+            spool.close()
+            os.unlink(spool.name)
+            raise
+        return spool.name
+
+def read_spool(path):
+    """Yield pages back from a spool file"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+def fetch_table(table, previous, full=False, page_size=None):
+    """Export one table (full or delta) from production into a spool file
+
+    Only touches production, so it is safe to run in a worker thread.
+    Falls back to a full export when forced, when there is no previous
+    state, when the production columns changed (schema drift), when the
+    table has no updated_at column, or when COUNT(*)/SUM(id)/MAX(id) show
+    rows were deleted (or deleted and replaced) since the last sync.
+    Returns {'upsert', 'spool', 'state'}.
+    """
+    columns = remote_table_columns(table)
+    if columns is None:
+        raise ExportError(f"Failed to read schema of {table}")
+
+    watermark = WATERMARK_COLUMN if WATERMARK_COLUMN in columns else None
+
+    reason = None
+    if full:
+        reason = "requested"
+    elif not previous:
+        reason = "no previous sync"
+    elif previous.get('columns') != columns:
+        reason = "schema drift"
+    elif watermark is None:
+        reason = f"no {WATERMARK_COLUMN} column"
+    elif 'id_sum' not in previous:
+        reason = "no id checksum in previous sync"
+
+    if reason is None:
+        # Delta: new rows by id, changed rows by timestamp watermark
+        condition = "id > ?"
+        condition_params = [previous['max_id'] or 0]
+        if previous.get('mark'):
+            condition += f" OR datetime({watermark}) >= datetime(?)"
+            condition_params.append(previous['mark'])
+
+        stats = {'rows': 0, 'new_rows': 0, 'new_id_sum': 0, 'max_id': previous['max_id'],
+                 'previous_max_id': previous['max_id'] or 0, 'mark': previous.get('mark')}
+        spool = spool_pages(track_marks(
+            export_table(table, page_size, condition=condition, condition_params=condition_params),
+            stats, watermark
+        ))
+
+        remote = remote_id_checksum(table) or {}
+        expected = {'count': previous['row_count'] + stats['new_rows'],
+                    'id_sum': previous['id_sum'] + stats['new_id_sum'],
+                    'max_id': stats['max_id']}
+        if all(remote.get(key) == value for key, value in expected.items()):
+            print(f"  🔁 {table}: delta of {stats['rows']} rows ({stats['new_rows']} new)")
+            return {'upsert': True, 'spool': spool,
+                    'state': {'columns': columns, 'watermark': watermark, 'mark': stats['mark'],
+                              'max_id': stats['max_id'], 'row_count': remote['count'],
+                              'id_sum': remote['id_sum']}}
+
+        os.unlink(spool)
+        reason = f"id checksum {remote} != expected {expected} (deleted rows)"
+
+    print(f"  🔄 {table}: full export ({reason})")
+    stats = {'rows': 0, 'new_rows': 0, 'new_id_sum': 0, 'max_id': None, 'previous_max_id': None,
+             'mark': None}
+    spool = spool_pages(track_marks(export_table(table, page_size), stats, watermark))
+    return {'upsert': False, 'spool': spool,
+            'state': {'columns': columns, 'watermark': watermark, 'mark': stats['mark'],
+                      'max_id': stats['max_id'], 'row_count': stats['rows'],
+                      'id_sum': stats['new_id_sum']}}
+
+def apply_fetched(table, sink, fetched):
+    """Load a spooled export into the sink, return the table's new state or None"""
+    try:
+        row_count = sink.load_table(table, read_spool(fetched['spool']), upsert=fetched['upsert'])
+    finally:
+        os.unlink(fetched['spool'])
+
+    if row_count is None:
+        return None
+    return fetched['state']
+
+def sync_tables(tables, sink, state, full=False, page_size=None, workers=SYNC_WORKERS):
+    """Export tables concurrently and apply them in dependency order
+
+    Exports only read production, so every table is fetched in parallel on
+    a bounded thread pool; the sink is written from the calling thread in
+    the given (topological) order as each export finishes.
+    Returns (new_state, failed_tables).
+    """
+    new_state = dict(state)
+    failed = []
+
+    # Decide local-side resyncs up front (sink connections stay on this thread)
+    force_full = set()
+    for table in tables:
+        previous = state.get(table)
+        if full or (previous and hasattr(sink, 'row_count') and sink.row_count(table) != previous['row_count']):
+            force_full.add(table)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            table: pool.submit(fetch_table, table, state.get(table), table in force_full, page_size)
+            for table in tables
+        }
+
+        for table in tables:
+            try:
+                fetched = futures[table].result()
+                table_state = apply_fetched(table, sink, fetched)
+            except ExportError as e:
+                print(f"  ⚠️  {e}")
+                table_state = None
+
+            if table_state is None:
+                print(f"  ❌ {table}: sync failed")
+                failed.append(table)
+                # Force a full resync of this table next time
+                new_state.pop(table, None)
+            else:
+                print(f"  ✅ {table}: {table_state['row_count']} rows")
+                new_state[table] = table_state
+
+    return new_state, failed
+
+if __name__ == "__main__":
+    # Print sync tables in dependency order (used by export-prod-db.sh)
+    for table in sync_tables_in_order():
+        print(table)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Streaming base64 data URI decoder
+
+Decodes `data:<mime>;base64,...` text that arrives in chunks (D1 substr()
+pages, file reads) straight into a binary file, so peak memory is one
+chunk no matter how large the image is. The MIME type from the header is
+returned so uploads can keep it.
+"""
+
+import base64
+import binascii
+
+DEFAULT_MIME = "image/jpeg"
+# A data URI header never gets near this; anything longer is not a header
+MAX_HEADER_CHARS = 256
+
+def parse_data_uri_header(text):
+    """Return (mime, payload_offset) for a data URI prefix, or bare base64
+
+    Raises ValueError for data URIs that are not base64 encoded or whose
+    header is not complete within text.
+    """
+    if not text.startswith('data:'):
+        # Bare base64 (campaign_*_base64.txt files without a header)
+        return DEFAULT_MIME, 0
+
+    comma = text.find(',', 0, MAX_HEADER_CHARS)
+    if comma == -1:
+        raise ValueError("Incomplete data URI header")
+
+    header = text[5:comma]
+    parts = header.split(';')
+    if 'base64' not in parts[1:]:
+        raise ValueError(f"Not a base64 data URI: data:{header}")
+    return parts[0] or DEFAULT_MIME, comma + 1
+
+class Base64StreamDecoder:
+    """Incremental base64 decoder (carries partial 4-char groups between chunks)"""
+
+    def __init__(self):
+        self.carry = ''
+
+    def feed(self, text):
+        text = self.carry + ''.join(text.split())
+        usable = len(text) - len(text) % 4
+        self.carry = text[usable:]
+        return base64.b64decode(text[:usable], validate=True) if usable else b''
+
+    def finish(self):
+        """Decode what is left, tolerating missing '=' padding"""
+        carry, self.carry = self.carry, ''
+        if not carry:
+            return b''
+        if len(carry) % 4 == 1:
+            raise binascii.Error("Truncated base64 data")
+        return base64.b64decode(carry + '=' * (-len(carry) % 4), validate=True)
+
+def decode_stream(chunks, out):
+    """Decode an iterable of text chunks (data URI or bare base64) into out
+
+    Returns (mime, bytes_written).
+    """
+    decoder = None
+    mime = DEFAULT_MIME
+    head = ''
+    written = 0
+
+    for chunk in chunks:
+        if decoder is None:
+            # Buffer just enough of the start to read the header
+            head += chunk
+            maybe_header = head.startswith('data:') or 'data:'.startswith(head)
+            if maybe_header and ',' not in head and len(head) < MAX_HEADER_CHARS:
+                continue
+            mime, offset = parse_data_uri_header(head)
+            decoder = Base64StreamDecoder()
+            chunk, head = head[offset:], ''
+
+        data = decoder.feed(chunk)
+        out.write(data)
+        written += len(data)
+
+    if decoder is None:
+        if not head:
+            raise ValueError("Empty image data")
+        mime, offset = parse_data_uri_header(head)
+        decoder = Base64StreamDecoder()
+        data = decoder.feed(head[offset:])
+        out.write(data)
+        written += len(data)
+
+    data = decoder.finish()
+    out.write(data)
+    written += len(data)
+    return mime, written
+
+def iter_file_chunks(path, chunk_chars=256 * 1024):
+    """Yield text chunks of a (possibly huge) base64 text file"""
+    with open(path, encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+트리거가 유지하는 파생 데이터 재계산
+
+Some columns are never written by the app. Triggers maintain them from
+other rows:
+
+  - campaigns.sort_rank                         (0104, from status)
+  - campaigns.*application_count                (0105, from applications)
+  - campaigns.display_status / _until           (0106, from status, payment and dates)
+  - daily_stats / daily_visitor_ips             (0107, from users, campaigns, visitor_logs)
+
+Bulk loads that copy rows from another database run with those triggers
+live. Examples are the d1_sync sinks and split_dump --rebuild-derived.
+Copied counter values then get the copied applications added on top.
+Counter changes also never touch campaigns.updated_at, so a delta sync
+cannot see them. After such a load, every derived value is recomputed
+from the base tables. The statements are idempotent and take no
+parameters, so the same list can be run on a sqlite3 connection, written
+into a SQL file or sent as one D1 batch.
+
+visitor_logs only holds the last RETENTION_DAYS days, so raw logs cannot
+rebuild older visitor counts. With keep_history (the default, safe for
+production), visitors/page_views are recomputed only for days that lie
+entirely inside the retention window, and older days keep their stored
+values. The sync sinks never copy the rollup tables (d1_sync SKIP_TABLES),
+so they rebuild them from scratch (keep_history=False): a local copy's
+history is what its raw logs cover.
+
+Usage:
+  python3 derived_data.py --sqlite /tmp/g.sqlite
+  python3 derived_data.py --local
+"""
+
+from datetime import date, timedelta
+import argparse
+import sqlite3
+import time
+import sys
+
+from application_counters import RECOUNT_SET
+from d1_client import D1Error, get_client
+from purge_visitor_logs import RETENTION_DAYS, VISITOR_IP_DAYS
+from refresh_display_status import DISPLAY_STATUS_SQL, DISPLAY_STATUS_UNTIL_SQL, kst_today
+
+# Same ranks as the 0104 triggers (higher = listed first)
+SORT_RANK_SQL = """CASE status
+    WHEN 'approved' THEN 4
+    WHEN 'suspended' THEN 3
+    WHEN 'completed' THEN 2
+    WHEN 'cancelled' THEN 1
+    ELSE 0
+  END"""
+
+# Tables whose rows feed a derived value; loading any of them calls for a rebuild
+SOURCE_TABLES = {'campaigns', 'applications', 'users', 'visitor_logs'}
+
+VISIT_DAY_SQL = "date(visited_at, '+9 hours')"
+CREATED_DAY_SQL = "COALESCE(date(created_at, '+9 hours'), date('now', '+9 hours'))"
+
+def daily_stats_statements(today, keep_history=True):
+    """Rebuild daily_visitor_ips and daily_stats (0107) as of `today` (KST date)"""
+    ip_days_start = (today - timedelta(days=VISITOR_IP_DAYS - 1)).isoformat()
+    statements = [
+        # Inserting dedup IPs bumps daily_stats.visitors; recomputed right below
+        "DELETE FROM daily_visitor_ips",
+        f"INSERT INTO daily_visitor_ips (day, ip_address)\n"
+        f"SELECT DISTINCT {VISIT_DAY_SQL}, ip_address FROM visitor_logs\n"
+        f"WHERE ip_address IS NOT NULL AND {VISIT_DAY_SQL} >= '{ip_days_start}'",
+    ]
+    if keep_history:
+        # Days at or before the purge cutoff may be partial in visitor_logs
+        complete = f"> '{(today - timedelta(days=RETENTION_DAYS)).isoformat()}'"
+        statements.append(f"UPDATE daily_stats SET visitors = 0, page_views = 0 WHERE day {complete}")
+        visit_filter = f" AND {VISIT_DAY_SQL} {complete}"
+    else:
+        statements.append("DELETE FROM daily_stats")
+        visit_filter = ""
+    statements += [
+        f"INSERT INTO daily_stats (day, visitors, page_views)\n"
+        f"SELECT {VISIT_DAY_SQL} AS day, COUNT(DISTINCT ip_address), COUNT(*) FROM visitor_logs\n"
+        f"WHERE visited_at IS NOT NULL{visit_filter}\nGROUP BY day\n"
+        f"ON CONFLICT(day) DO UPDATE SET visitors = excluded.visitors, page_views = excluded.page_views",
+        "UPDATE daily_stats SET new_users = 0, new_campaigns = 0",
+    ]
+    for table, column in (('users', 'new_users'), ('campaigns', 'new_campaigns')):
+        statements.append(
+            f"INSERT INTO daily_stats (day, {column})\n"
+            f"SELECT {CREATED_DAY_SQL} AS day, COUNT(*) FROM {table}\nWHERE 1\nGROUP BY day\n"
+            f"ON CONFLICT(day) DO UPDATE SET {column} = excluded.{column}"
+        )
+    return statements
+
+def rebuild_statements(today=None, keep_history=True):
+    """SQL statements (no parameters) that recompute every derived value as of `today` (KST)"""
+    today = date.fromisoformat(today or kst_today())
+    literal = f"'{today.isoformat()}'"
+    return [
+        f"UPDATE campaigns SET sort_rank = {SORT_RANK_SQL}",
+        f"UPDATE campaigns SET\n  {RECOUNT_SET}",
+        f"UPDATE campaigns SET\n  display_status = {DISPLAY_STATUS_SQL.replace('?1', literal)},\n"
+        f"  display_status_until = {DISPLAY_STATUS_UNTIL_SQL.replace('?1', literal)}",
+    ] + daily_stats_statements(today, keep_history)
+
+def rebuild_sqlite(conn, today=None, keep_history=True):
+    """Run the rebuild in one transaction on an autocommit sqlite3 connection"""
+    conn.execute("BEGIN")
+    try:
+        for sql in rebuild_statements(today, keep_history):
+            conn.execute(sql)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="트리거 파생 데이터 재계산")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 대상")
+    target.add_argument('--sqlite', help="SQLite 파일 대상")
+    parser.add_argument('--date', default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘, 한국 시간)")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    try:
+        if args.sqlite:
+            conn = sqlite3.connect(args.sqlite, isolation_level=None)
+            try:
+                rebuild_sqlite(conn, args.date)
+            finally:
+                conn.close()
+        else:
+            get_client(not args.local).batch([(sql, []) for sql in rebuild_statements(args.date)])
+    except (D1Error, sqlite3.Error) as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return 1
+
+    print(f"🔁 파생 데이터 재계산 완료 ({time.time() - started:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
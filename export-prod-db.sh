@@ -8,21 +8,8 @@ echo "-- Production DB Dump - $(date)" > $OUTPUT_FILE
 echo "-- Exporting from $DB_NAME" >> $OUTPUT_FILE
 echo "" >> $OUTPUT_FILE
 
-# Tables to export (in order to respect foreign keys)
-TABLES=(
-  "users"
-  "advertiser_profiles"
-  "influencer_profiles"
-  "campaigns"
-  "applications"
-  "reviews"
-  "points"
-  "notifications"
-  "settlements"
-  "withdrawal_requests"
-  "password_reset_tokens"
-  "system_settings"
-)
+# Tables to export, in foreign-key order (discovered from migrations/ by d1_sync.py)
+mapfile -t TABLES < <(python3 d1_sync.py)
 
 echo "Exporting production database..."
 
@@ -2,11 +2,11 @@
 """
 실제 상품 썸네일 Base64 추출 및 R2 업로드
 """
-import json
-import subprocess
 import sys
-import base64
-import os
+
+from d1_client import D1Error, get_client
+from r2_manifest import UploadManifest
+from r2_migrate import iter_db_data_uri_chunks, upload_image
 
 print("=" * 60)
 print("실제 상품 이미지 복구 작업")
@@ -14,41 +14,24 @@ print("=" * 60)
 
 # 1. DB에서 Base64 썸네일 추출
 print("\n[1/3] DB에서 Base64 썸네일 추출 중...")
-result = subprocess.run(
-    ['npx', 'wrangler', 'd1', 'execute', 'review-spheres-v1-production', 
-     '--remote', '--command=SELECT id, title, thumbnail_image FROM campaigns ORDER BY id'],
-    capture_output=True,
-    text=True,
-    timeout=60
-)
-
-if result.returncode != 0:
-    print(f"❌ 오류: {result.stderr}")
+try:
+    # 길이만 조회 (본문은 업로드 단계에서 청크 단위로 스트리밍)
+    rows = get_client(remote=True).query(
+        "SELECT id, title, length(thumbnail_image) AS length FROM campaigns "
+        "WHERE thumbnail_image LIKE 'data:image%' ORDER BY id"
+    )
+except D1Error as e:
+    print(f"❌ 오류: {e}")
     sys.exit(1)
 
-# 결과 파싱
-lines = result.stdout.strip().split('\n')
 campaigns = []
-
-# 테이블 형식 파싱
-for line in lines:
-    if '│' in line and 'id' not in line.lower() and '─' not in line:
-        parts = [p.strip() for p in line.split('│') if p.strip()]
-        if len(parts) >= 3:
-            try:
-                campaign_id = int(parts[0])
-                title = parts[1]
-                thumbnail = parts[2] if len(parts) > 2 else None
-                
-                if thumbnail and thumbnail.startswith('data:image'):
-                    campaigns.append({
-                        'id': campaign_id,
-                        'title': title,
-                        'thumbnail': thumbnail
-                    })
-                    print(f"  ✓ 캠페인 {campaign_id}: {title[:30]}... ({len(thumbnail)} bytes)")
-            except:
-                continue
+for row in rows:
+    campaigns.append({
+        'id': row['id'],
+        'title': row['title'],
+        'length': row['length']
+    })
+    print(f"  ✓ 캠페인 {row['id']}: {row['title'][:30]}... ({row['length']} bytes)")
 
 print(f"\n✓ 총 {len(campaigns)}개 Base64 이미지 발견")
 
@@ -59,57 +42,39 @@ if len(campaigns) == 0:
 # 2. Base64를 R2에 업로드
 print(f"\n[2/3] R2에 실제 상품 이미지 업로드 중...")
 success_count = 0
+skip_count = 0
 fail_count = 0
+manifest = UploadManifest.for_mode(remote=True)
 
 for campaign in campaigns:
     campaign_id = campaign['id']
-    thumbnail = campaign['thumbnail']
-    
+    client = get_client(remote=True)
+
     try:
-        # Base64 디코딩
-        if thumbnail.startswith('data:image'):
-            base64_data = thumbnail.split(',')[1]
-        else:
-            base64_data = thumbnail
-        
-        image_data = base64.b64decode(base64_data)
-        
-        # 임시 파일 저장
-        temp_file = f'/tmp/campaign_{campaign_id}.jpg'
-        with open(temp_file, 'wb') as f:
-            f.write(image_data)
-        
-        # R2 업로드
-        r2_filename = f'{campaign_id}.jpg'
-        upload_result = subprocess.run(
-            ['npx', 'wrangler', 'r2', 'object', 'put', 
-             f'reviewsphere-images/{r2_filename}',
-             '--file', temp_file,
-             '--content-type', 'image/jpeg'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if upload_result.returncode == 0:
-            print(f"  ✓ 캠페인 {campaign_id}: {len(image_data)} bytes 업로드 완료")
+        # Base64 스트리밍 디코딩 + R2 업로드 (MIME 타입 유지)
+        chunks = iter_db_data_uri_chunks(client, campaign_id, campaign['length'])
+        key, size, uploaded = upload_image(client, campaign_id, chunks, manifest=manifest)
+        if uploaded:
+            print(f"  ✓ 캠페인 {campaign_id}: {size} bytes 업로드 완료")
             success_count += 1
         else:
-            print(f"  ✗ 캠페인 {campaign_id}: 업로드 실패 - {upload_result.stderr[:50]}")
-            fail_count += 1
-        
-        # 임시 파일 삭제
-        os.remove(temp_file)
-        
+            print(f"  ⏭ 캠페인 {campaign_id}: R2에 동일 이미지 있음 (스킵)")
+            skip_count += 1
+    except D1Error as e:
+        print(f"  ✗ 캠페인 {campaign_id}: 업로드 실패 - {str(e)[:50]}")
+        fail_count += 1
     except Exception as e:
         print(f"  ✗ 캠페인 {campaign_id}: 오류 - {str(e)[:50]}")
         fail_count += 1
 
+manifest.close()
+
 print(f"\n[3/3] 업로드 완료:")
 print(f"  ✓ 성공: {success_count}개")
+print(f"  ⏭ 스킵 (변경 없음): {skip_count}개")
 print(f"  ✗ 실패: {fail_count}개")
 
-if success_count > 0:
+if success_count + skip_count > 0:
     print(f"\n✅ 실제 상품 이미지 복구 완료!")
     print(f"   - R2에 {success_count}개 이미지 업로드됨")
     print(f"   - DB는 이미 R2 URL로 설정되어 있음")
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+대용량 테스트 데이터 생성기 (결정적, 1x ~ 100x)
+
+Generates a realistic, referentially consistent dataset (users, profiles,
+campaigns, applications, reviews, points, notifications, visitor_logs,
+user_ips) for load and performance testing, and streams it straight into
+a SQLite file or the local miniflare D1 state:
+
+  - the schema is built from migrations/ (the same files wrangler applies),
+    and every generated column is checked against it before loading
+  - the same --seed / --scale / --now always produce the same rows, so
+    benchmark runs are comparable; each table has its own random stream
+  - rows are produced lazily and fed to executemany() in ONE transaction
+    with indexes dropped during the load and rebuilt afterwards
+
+Sizes at 1x (×scale): 2 admins, 50 advertisers, 1,000 influencers,
+200 campaigns (~5,000 applications) and 20,000 visits over 90 days.
+Popularity is skewed: a few campaigns get most applications and a few
+influencers apply to most campaigns.
+
+Every generated account logs in with LOGIN_PASSWORD
+(influencer1@example.com, advertiser1@example.com, admin1@example.com, ...).
+
+Usage:
+  python3 generate_dataset.py --sqlite /tmp/bench-10x.sqlite --scale 10
+  python3 generate_dataset.py --local --scale 1 --drop-existing
+"""
+
+from datetime import datetime, timedelta
+import argparse
+import hashlib
+import sqlite3
+import random
+import glob
+import time
+import sys
+import os
+
+from d1_sync import LOCAL_D1_STATE_DIR, MIGRATIONS_DIR, find_local_d1_sqlite
+from refresh_display_status import refresh as refresh_display_status
+from restore_dump import user_tables
+
+DEFAULT_SEED = 42
+# Fixed "today" so the same seed gives the same dataset on any day
+DEFAULT_NOW = "2025-11-18T09:00:00"
+
+# Row counts at scale 1
+BASE_COUNTS = {
+    'admins': 2,
+    'advertisers': 50,
+    'influencers': 1000,
+    'campaigns': 200,
+    'visits': 20000,
+}
+HISTORY_DAYS = 90
+
+LOGIN_PASSWORD = "test1234!"
+# src/utils.ts hashPassword(): hex SHA-256 of the password
+PASSWORD_HASH = hashlib.sha256(LOGIN_PASSWORD.encode('utf-8')).hexdigest()
+
+CATEGORIES = {
+    '뷰티': ['수분 크림', '비타민 세럼', '쿠션 파운데이션', '선크림', '립 틴트', '클렌징 오일'],
+    '맛집': ['브런치 세트', '한우 오마카세', '수제 버거', '디저트 플레이트', '파스타 코스'],
+    '패션': ['울 니트', '데님 재킷', '러닝화', '가죽 토트백', '캐시미어 머플러'],
+    '디지털': ['무선 이어폰', '스마트워치', '휴대용 선풍기', '블루투스 스피커', '태블릿 거치대'],
+    '생활': ['무선 청소기', '전기 포트', '극세사 이불', '향초 세트', '주방 세제'],
+    '육아': ['유기농 이유식', '아기 로션', '원목 교구', '휴대용 유모차'],
+    '반려동물': ['동결건조 간식', '고양이 스크래처', '강아지 하네스', '자동 급식기'],
+    '여행': ['호텔 숙박권', '글램핑 이용권', '스파 이용권', '렌터카 이용권'],
+}
+BRANDS = ['글로우', '루미', '온담', '하루', '모아', '클린업', '포레스트', '바른', '소소', '데일리']
+REGIONS = ['서울 강남구', '서울 마포구', '서울 성동구', '부산 해운대구', '대구 수성구',
+           '인천 연수구', '경기 성남시', '경기 수원시', '대전 유성구', '제주 제주시']
+NAME_FAMILY = '김이박최정강조윤장임한오서신권황안송류홍'
+NAME_GIVEN = ['민준', '서연', '도윤', '하은', '지호', '수아', '예준', '지유', '시우', '하린',
+              '주원', '윤서', '지훈', '채원', '건우', '다은', '현우', '소율', '우진', '가은']
+BANKS = ['국민은행', '신한은행', '우리은행', '하나은행', '카카오뱅크', '토스뱅크', '농협은행']
+USER_AGENTS = [
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148',
+    'Mozilla/5.0 (Linux; Android 14; SM-S921N) AppleWebKit/537.36 Chrome/124.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/124.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 Version/17.5 Safari/605.1.15',
+    'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
+]
+CHANNELS = ['instagram', 'blog', 'youtube']
+PRICING_TYPES = ['product_only', 'points_only', 'purchase_with_points',
+                 'product_with_points', 'voucher_only', 'voucher_with_points']
+
+def iso(moment):
+    """Timestamp in the format the worker writes (getCurrentDateTime)"""
+    return moment.isoformat(timespec='milliseconds') + 'Z'
+
+def day(moment):
+    return moment.date().isoformat()
+
+class DatasetGenerator:
+    """Yields (table, columns, rows) in load order; rows are lazy tuples"""
+
+    def __init__(self, seed=DEFAULT_SEED, scale=1.0, now=DEFAULT_NOW):
+        self.seed = seed
+        self.now = datetime.fromisoformat(now)
+        self.start = self.now - timedelta(days=HISTORY_DAYS)
+        self.counts = {name: max(1, round(count * scale)) for name, count in BASE_COUNTS.items()}
+
+        # User id layout: admins, then advertisers, then influencers
+        self.first_advertiser = self.counts['admins'] + 1
+        self.first_influencer = self.first_advertiser + self.counts['advertisers']
+        self.user_count = self.first_influencer + self.counts['influencers'] - 1
+
+        # Filled while generating, used by the tables that depend on them
+        self.user_created = {}
+        self.campaigns = []
+        self.approved = []
+
+    def rng(self, table):
+        """Independent, seed-derived random stream per table"""
+        return random.Random(f"{self.seed}:{table}")
+
+    def moment(self, rng, after=None, before=None):
+        after = after or self.start
+        before = before or self.now
+        span = max((before - after).total_seconds(), 1)
+        return after + timedelta(seconds=rng.random() * span)
+
+    def tables(self):
+        yield 'users', ('id', 'email', 'nickname', 'password_hash', 'role', 'created_at',
+                        'updated_at', 'sphere_points'), self.users()
+        yield 'advertiser_profiles', ('user_id', 'company_name', 'business_number', 'representative_name',
+                                      'business_address', 'contact_phone', 'contact_email', 'created_at',
+                                      'updated_at'), self.advertiser_profiles()
+        yield 'influencer_profiles', ('user_id', 'instagram_handle', 'youtube_channel', 'blog_url',
+                                      'follower_count', 'category', 'account_holder_name', 'bank_name',
+                                      'account_number', 'contact_phone', 'real_name', 'birth_date', 'gender',
+                                      'shipping_name', 'shipping_phone', 'shipping_postal_code',
+                                      'shipping_address', 'portrait_rights_consent', 'personal_info_consent',
+                                      'content_usage_consent', 'third_party_provision_consent',
+                                      'created_at', 'updated_at'), self.influencer_profiles()
+        yield 'campaigns', ('id', 'advertiser_id', 'title', 'description', 'product_name', 'budget', 'slots',
+                            'status', 'created_at', 'updated_at', 'point_reward', 'application_start_date',
+                            'application_end_date', 'announcement_date', 'content_start_date',
+                            'content_end_date', 'result_announcement_date', 'provided_items', 'mission',
+                            'keywords', 'channel_type', 'thumbnail_image', 'payment_status', 'pricing_type',
+                            'product_value', 'sphere_points', 'is_best'), self.campaigns_rows()
+        yield 'applications', ('id', 'campaign_id', 'influencer_id', 'status', 'message', 'applied_at',
+                               'reviewed_at', 'real_name', 'contact_phone', 'shipping_recipient',
+                               'shipping_address', 'portrait_rights_consent', 'personal_info_consent',
+                               'content_usage_consent'), self.applications()
+        yield 'reviews', ('application_id', 'post_url', 'image_url', 'submitted_at', 'approval_status',
+                          'reviewed_at', 'is_best'), self.reviews()
+        yield 'points', ('user_id', 'amount', 'balance', 'type', 'source', 'reference_id', 'description',
+                         'created_at'), self.points()
+        yield 'notifications', ('user_id', 'title', 'message', 'type', 'read', 'created_at'), self.notifications()
+        yield 'visitor_logs', ('user_id', 'ip_address', 'user_agent', 'visited_at'), self.visitor_logs()
+        yield 'user_ips', ('user_id', 'ip_address', 'created_at'), self.user_ips()
+
+    def person(self, rng):
+        return rng.choice(NAME_FAMILY) + rng.choice(NAME_GIVEN)
+
+    def phone(self, rng):
+        return f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}"
+
+    def users(self):
+        rng = self.rng('users')
+        for user_id in range(1, self.user_count + 1):
+            if user_id < self.first_advertiser:
+                role, number = 'admin', user_id
+            elif user_id < self.first_influencer:
+                role, number = 'advertiser', user_id - self.first_advertiser + 1
+            else:
+                role, number = 'influencer', user_id - self.first_influencer + 1
+            created = self.moment(rng, self.start - timedelta(days=365), self.now - timedelta(days=1))
+            self.user_created[user_id] = created
+            # sphere_points is set from the points ledger after loading
+            yield (user_id, f"{role}{number}@example.com", f"{self.person(rng)}{number}", PASSWORD_HASH,
+                   role, iso(created), iso(created), 0)
+
+    def advertiser_profiles(self):
+        rng = self.rng('advertiser_profiles')
+        for user_id in range(self.first_advertiser, self.first_influencer):
+            created = iso(self.user_created[user_id])
+            company = f"{rng.choice(BRANDS)}{rng.choice(['컴퍼니', '코리아', '랩', '스튜디오'])}"
+            yield (user_id, company, f"{rng.randrange(100, 999)}-{rng.randrange(10, 99)}-{rng.randrange(10000, 99999)}",
+                   self.person(rng), f"{rng.choice(REGIONS)} {rng.randrange(1, 300)}", self.phone(rng),
+                   f"contact{user_id}@example.com", created, created)
+
+    def influencer_profiles(self):
+        rng = self.rng('influencer_profiles')
+        for user_id in range(self.first_influencer, self.user_count + 1):
+            created = iso(self.user_created[user_id])
+            name = self.person(rng)
+            phone = self.phone(rng)
+            handle = f"sphere_{user_id}"
+            # Follower counts are long-tailed
+            followers = int(300 * rng.paretovariate(1.2))
+            birth = self.now - timedelta(days=rng.randrange(19 * 365, 45 * 365))
+            yield (user_id, handle, f"https://youtube.com/@{handle}" if rng.random() < 0.2 else None,
+                   f"https://blog.naver.com/{handle}" if rng.random() < 0.5 else None, followers,
+                   rng.choice(list(CATEGORIES)), name, rng.choice(BANKS),
+                   f"{rng.randrange(100, 999)}-{rng.randrange(100000, 999999)}-{rng.randrange(10, 99)}", phone,
+                   name, day(birth), rng.choice(['female', 'female', 'male', 'other']), name, phone,
+                   f"{rng.randrange(10000, 63999):05d}", f"{rng.choice(REGIONS)} {rng.randrange(1, 300)}",
+                   1, 1, 1, int(rng.random() < 0.8), created, created)
+
+    def campaigns_rows(self):
+        rng = self.rng('campaigns')
+        for campaign_id in range(1, self.counts['campaigns'] + 1):
+            advertiser = rng.randrange(self.first_advertiser, self.first_influencer)
+            category = rng.choice(list(CATEGORIES))
+            product = f"{rng.choice(BRANDS)} {rng.choice(CATEGORIES[category])}"
+            created = self.moment(rng, max(self.user_created[advertiser], self.start))
+
+            apply_start = created + timedelta(days=rng.randrange(0, 4))
+            apply_end = apply_start + timedelta(days=rng.randrange(5, 15))
+            announce = apply_end + timedelta(days=rng.randrange(1, 3))
+            content_start = announce + timedelta(days=1)
+            content_end = content_start + timedelta(days=rng.randrange(7, 15))
+            result = content_end + timedelta(days=rng.randrange(1, 4))
+
+            roll = rng.random()
+            if roll < 0.08:
+                status, payment = 'pending', 'unpaid'
+            elif roll < 0.12:
+                status, payment = rng.choice(['suspended', 'cancelled']), 'paid'
+            elif self.now > result:
+                status, payment = 'completed', 'paid'
+            else:
+                status, payment = 'approved', 'paid'
+
+            pricing = rng.choice(PRICING_TYPES)
+            point_reward = rng.choice([0, 5000, 10000, 20000, 30000]) if 'points' in pricing else 0
+            slots = rng.choice([5, 10, 10, 15, 20, 30, 50])
+            product_value = rng.randrange(10, 300) * 1000
+            thumbnail = f"/api/images/campaigns/{campaign_id}/thumbnail.png" if rng.random() < 0.9 else None
+
+            self.campaigns.append((campaign_id, advertiser, status, slots, point_reward, created,
+                                   apply_end, announce, result))
+            yield (campaign_id, advertiser, f"[{category}] {product} 체험단 모집",
+                   f"{product}을(를) 직접 사용해보고 솔직한 후기를 남겨주실 {category} 인플루언서를 모집합니다.",
+                   product, product_value * slots, slots, status, iso(created), iso(created), point_reward,
+                   day(apply_start), day(apply_end), day(announce), day(content_start), day(content_end),
+                   day(result), product, "제품 사진 3장 이상, 사용 후기 500자 이상, 필수 해시태그 포함",
+                   f"{category},{product.split()[-1]},체험단", rng.choice(CHANNELS), thumbnail, payment, pricing,
+                   product_value, point_reward, int(rng.random() < 0.05))
+
+    def applications(self):
+        rng = self.rng('applications')
+        influencers = self.counts['influencers']
+        application_id = 0
+        for campaign_id, _, status, slots, point_reward, created, apply_end, announce, _ in self.campaigns:
+            if status == 'pending':
+                continue
+            # Few campaigns get most applications (Pareto), capped at the influencer pool
+            wanted = min(influencers // 2, int(slots * 0.6 * rng.paretovariate(1.5)))
+            chosen = set()
+            while len(chosen) < wanted:
+                # Squared uniform: low ids (early users) are the most active appliers
+                chosen.add(int(influencers * rng.random() ** 2))
+
+            approved_left = slots
+            apply_until = min(apply_end + timedelta(days=1), self.now)
+            for offset in sorted(chosen):
+                influencer_id = self.first_influencer + offset
+                applied = self.moment(rng, max(created, self.user_created[influencer_id]), apply_until)
+                if applied > apply_until:
+                    continue
+                application_id += 1
+                reviewed = None
+                state = 'pending'
+                if self.now > announce and status != 'suspended':
+                    reviewed = min(announce + timedelta(hours=rng.randrange(1, 48)), self.now)
+                    if approved_left and rng.random() < 0.6:
+                        state = 'approved'
+                        approved_left -= 1
+                        self.approved.append((application_id, campaign_id, influencer_id, point_reward,
+                                              reviewed, status))
+                    else:
+                        state = 'rejected'
+                yield (application_id, campaign_id, influencer_id, state, "열심히 작성하겠습니다!",
+                       iso(applied), iso(reviewed) if reviewed else None, None, None, None, None, 1, 1, 1)
+
+    def reviews(self):
+        rng = self.rng('reviews')
+        for application_id, campaign_id, _, _, reviewed, _ in self.approved:
+            if rng.random() > 0.75:
+                continue
+            submitted = self.moment(rng, reviewed, min(reviewed + timedelta(days=14), self.now))
+            approval = rng.choice(['approved', 'approved', 'approved', 'pending'])
+            yield (application_id, f"https://www.instagram.com/p/{campaign_id:05d}{application_id:07d}/",
+                   f"/api/images/reviews/{application_id}.jpg" if rng.random() < 0.7 else None,
+                   iso(submitted), approval, iso(submitted + timedelta(hours=6)) if approval == 'approved' else None,
+                   int(rng.random() < 0.03))
+
+    def points(self):
+        """Per-influencer ledger: campaign rewards, then occasional withdrawals; balance never negative"""
+        rng = self.rng('points')
+        events = {}
+        for _, campaign_id, influencer_id, point_reward, reviewed, status in self.approved:
+            if point_reward and status == 'completed':
+                events.setdefault(influencer_id, []).append((reviewed + timedelta(days=14), campaign_id, point_reward))
+
+        for influencer_id in sorted(events):
+            balance = 0
+            for moment, campaign_id, reward in sorted(events[influencer_id]):
+                moment = min(moment, self.now)
+                balance += reward
+                yield (influencer_id, reward, balance, 'earn', 'campaign', campaign_id,
+                       f"캠페인 #{campaign_id} 리뷰 보상", iso(moment))
+                if balance >= 30000 and rng.random() < 0.3:
+                    amount = balance - balance % 10000
+                    balance -= amount
+                    yield (influencer_id, -amount, balance, 'withdraw', 'withdrawal', None, "포인트 출금",
+                           iso(min(moment + timedelta(days=rng.randrange(1, 10)), self.now)))
+
+    def notifications(self):
+        rng = self.rng('notifications')
+        for application_id, campaign_id, influencer_id, _, reviewed, _ in self.approved:
+            yield (influencer_id, '지원 결과 알림', f"캠페인 #{campaign_id} 지원이 승인되었습니다.",
+                   'application_status', int(rng.random() < 0.7), iso(reviewed))
+
+    def visitor_logs(self):
+        """Visits in time order: 30% logged in, a pool of repeat IPs, a few bots"""
+        rng = self.rng('visitor_logs')
+        # The biggest table: plain rng.random() indexing instead of randrange()/choice()
+        rand = rng.random
+        visits = self.counts['visits']
+        step = (self.now - self.start).total_seconds() / visits
+        ip_pool = max(visits // 8, 1)
+        for i in range(visits):
+            moment = self.start + timedelta(seconds=(i + rand()) * step)
+            user_id = int(rand() * self.user_count) + 1 if rand() < 0.3 else None
+            if user_id and self.user_created[user_id] > moment:
+                user_id = None
+            ip = int(rand() * ip_pool)
+            yield (user_id, f"{211 if ip % 3 else 175}.{ip >> 16 & 255}.{ip >> 8 & 255}.{ip & 255}",
+                   USER_AGENTS[int(rand() * len(USER_AGENTS))], iso(moment))
+
+    def user_ips(self):
+        """Sign-up IP per user (the register rate limiter reads these), some shared"""
+        rng = self.rng('user_ips')
+        for user_id in range(1, self.user_count + 1):
+            ip = rng.randrange(max(self.user_count // 2, 1))
+            yield (user_id, f"121.{ip >> 16 & 255}.{ip >> 8 & 255}.{ip & 255}", iso(self.user_created[user_id]))
+
+def apply_migrations(conn, migrations_dir=MIGRATIONS_DIR):
+    for path in sorted(glob.glob(os.path.join(migrations_dir, '*.sql'))):
+        with open(path, encoding='utf-8') as f:
+            conn.executescript(f.read())
+
+def check_columns(conn, table, columns):
+    """Fail early if the generator and migrations/ disagree on a table's columns"""
+    info = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+    if not info:
+        raise ValueError(f"{table}: migrations/ 에 없는 테이블")
+    existing = {row[1] for row in info}
+    unknown = [column for column in columns if column not in existing]
+    if unknown:
+        raise ValueError(f"{table}: migrations/ 에 없는 컬럼 {unknown}")
+    # NOT NULL without default and not generated (the INTEGER PRIMARY KEY is filled by SQLite)
+    missing = [row[1] for row in info if row[3] and row[4] is None and not row[5] and row[1] not in columns]
+    if missing:
+        raise ValueError(f"{table}: 생성기가 채우지 않는 NOT NULL 컬럼 {missing}")
+
+def generate(conn, generator, drop_existing=False, migrations_dir=MIGRATIONS_DIR, quiet=False):
+    """Build the schema from migrations and load the generated rows, return {table: rows}"""
+    existing = [table for table in user_tables(conn) if table != 'd1_migrations']
+    if existing:
+        if not drop_existing:
+            raise ValueError(f"이미 테이블 {len(existing)}개가 있습니다 (--drop-existing 으로 덮어쓰기)")
+        conn.execute("PRAGMA foreign_keys = OFF")
+        for table in existing:
+            conn.execute(f'DROP TABLE "{table}"')
+    apply_migrations(conn, migrations_dir)
+
+    # Build indexes once after the load instead of updating them per row. Triggers stay:
+    # they maintain derived columns (e.g. campaigns.sort_rank) the generator does not fill
+    deferred = conn.execute(
+        "SELECT type, name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 MB
+    loaded = {}
+
+    conn.execute("BEGIN")
+    try:
+        for kind, name, _ in deferred:
+            conn.execute(f'DROP {kind.upper()} "{name}"')
+
+        for table, columns, rows in generator.tables():
+            check_columns(conn, table, columns)
+            started = time.time()
+            cursor = conn.executemany(
+                f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})', rows
+            )
+            loaded[table] = cursor.rowcount
+            if not quiet:
+                elapsed = time.time() - started
+                print(f"   📥 {table}: {cursor.rowcount:,}행 ({cursor.rowcount / max(elapsed, 1e-9):,.0f} rows/s)")
+
+        started = time.time()
+        for _, _, sql in deferred:
+            conn.execute(sql)
+        if not quiet:
+            print(f"   🗂️  인덱스 {len(deferred)}개 생성 ({time.time() - started:.2f}s)")
+
+        # Balances follow the ledger (after the indexes: the lookup uses idx_points_user_id)
+        conn.execute("""
+            UPDATE users SET sphere_points = COALESCE(
+                (SELECT balance FROM points WHERE points.user_id = users.id ORDER BY id DESC LIMIT 1), 0)
+            WHERE role = 'influencer'
+        """)
+        conn.execute("""
+            UPDATE influencer_profiles SET points_balance =
+                (SELECT sphere_points FROM users WHERE users.id = influencer_profiles.user_id)
+        """)
+        # Display status as of the dataset's "now" (KST), not the wall clock the triggers used
+        refresh_display_status(lambda sql, params=(): conn.execute(sql, params).fetchall(),
+                               (generator.now + timedelta(hours=9)).date().isoformat(), full=True)
+
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    if violations:
+        raise ValueError(f"외래 키 위반 {len(violations)}건: {violations[:5]}")
+    conn.execute("ANALYZE")
+    return loaded
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대용량 테스트 데이터 생성기 (결정적)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--sqlite', help="생성할 SQLite 파일 경로")
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 상태에 생성")
+    parser.add_argument('--scale', type=float, default=1.0, help="데이터 배율 (1 ~ 100, 기본 1)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="난수 시드 (같은 시드 = 같은 데이터)")
+    parser.add_argument('--now', default=DEFAULT_NOW, help="기준 시각 (기본 %(default)s)")
+    parser.add_argument('--drop-existing', action='store_true', help="기존 테이블을 지우고 생성")
+    args = parser.parse_args(argv)
+
+    path = args.sqlite
+    if args.local:
+        path = find_local_d1_sqlite()
+        if not path:
+            print(f"❌ {LOCAL_D1_STATE_DIR} 아래에 로컬 D1 데이터베이스가 없습니다 "
+                  f"(먼저 `npm run db:migrate:local` 실행)")
+            return 1
+
+    generator = DatasetGenerator(args.seed, args.scale, args.now)
+    print(f"🏭 테스트 데이터 생성: scale={args.scale:g}, seed={args.seed}, now={args.now} → {path}")
+    started = time.time()
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        loaded = generate(conn, generator, drop_existing=args.drop_existing)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        conn.close()
+
+    print(f"\n✅ 완료: {sum(loaded.values()):,}행 ({time.time() - started:.1f}s)")
+    print(f"   🔑 로그인: influencer1@example.com / advertiser1@example.com / admin1@example.com "
+          f"(비밀번호 {LOGIN_PASSWORD})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
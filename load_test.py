@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+로컬 부하 테스트 (asyncio, 라우트별 지연 시간 분포)
+
+Drives the worker running under `wrangler pages dev` with local D1/R2
+state (the stand-in for production) with weighted scenarios replayed
+by concurrent virtual users, each on its own keep-alive connection:
+
+  browse       anonymous campaign list, best campaigns, best reviews
+  images       /api/images/* thumbnails (card width)
+  login        POST /api/auth/login
+  apply        influencer login (cached), campaign detail, application submit
+  admin_stats  admin login (cached), /api/admin/stats
+
+Reports throughput, status codes and p50/p95/p99 latency per route and
+saves everything (with the git commit) as JSON so runs can be compared
+across commits (--compare).
+
+Accounts come from generate_dataset.py (same password for everyone):
+  python3 generate_dataset.py --local --drop-existing --scale 1
+  npm run build && npm run dev:d1
+  python3 load_test.py --duration 60 --concurrency 20 --json loadtest-$(git rev-parse --short HEAD).json
+  python3 load_test.py --duration 60 --compare loadtest-abc1234.json
+"""
+
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import subprocess
+import argparse
+import asyncio
+import random
+import json
+import time
+import sys
+
+from generate_dataset import BASE_COUNTS, LOGIN_PASSWORD
+
+DEFAULT_URL = "http://localhost:3000"
+DEFAULT_CONCURRENCY = 10
+DEFAULT_DURATION = 30.0
+DEFAULT_WARMUP = 3.0
+REQUEST_TIMEOUT = 30.0
+
+SCENARIO_WEIGHTS = {
+    'browse': 50,
+    'images': 25,
+    'login': 10,
+    'apply': 10,
+    'admin_stats': 5,
+}
+
+# Upper bounds (ms) of the latency histogram buckets saved in the JSON
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+class HttpError(Exception):
+    """Connection failed or the response could not be parsed"""
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client connection (Content-Length and chunked bodies)"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method, path, headers=None, body=None):
+        """Return (status, body bytes); reconnects once if a kept-alive connection went stale"""
+        for attempt in (0, 1):
+            reused = self.writer is not None
+            try:
+                if not reused:
+                    self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+                return await asyncio.wait_for(self._exchange(method, path, headers or {}, body), REQUEST_TIMEOUT)
+            except (ConnectionError, OSError, asyncio.IncompleteReadError, HttpError) as e:
+                await self.close()
+                if not reused or attempt:
+                    raise HttpError(str(e) or type(e).__name__) from e
+            except asyncio.TimeoutError as e:
+                await self.close()
+                raise HttpError("timeout") from e
+
+    async def _exchange(self, method, path, headers, body):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + (body or b''))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise HttpError("connection closed")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise HttpError(f"bad status line {status_line[:80]!r}")
+        status = int(parts[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if 'chunked' in response_headers.get('transfer-encoding', ''):
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            data = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            data = await self.reader.readexactly(int(response_headers['content-length']))
+        elif method == 'HEAD' or status in (204, 304):
+            data = b''
+        else:
+            data = await self.reader.read()
+            await self.close()
+            return status, data
+
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, data
+
+class Stats:
+    """Latency samples and status counts per route"""
+
+    def __init__(self):
+        self.samples = {}
+        self.statuses = {}
+        self.recording = False
+
+    def record(self, route, seconds, status):
+        if not self.recording:
+            return
+        self.samples.setdefault(route, []).append(seconds)
+        counts = self.statuses.setdefault(route, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def summary(self, elapsed):
+        routes = {}
+        for route, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+
+            def percentile(p):
+                return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+            histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+            for sample in ordered:
+                ms = sample * 1000
+                histogram[next((i for i, bound in enumerate(HISTOGRAM_BUCKETS_MS) if ms <= bound),
+                               len(HISTOGRAM_BUCKETS_MS))] += 1
+            statuses = self.statuses[route]
+            errors = sum(count for status, count in statuses.items() if status == 'error' or status >= 500)
+            routes[route] = {
+                'requests': len(ordered),
+                'rps': len(ordered) / elapsed,
+                'errors': errors,
+                'error_rate': errors / len(ordered),
+                'p50_ms': percentile(0.50),
+                'p95_ms': percentile(0.95),
+                'p99_ms': percentile(0.99),
+                'max_ms': ordered[-1] * 1000,
+                'statuses': {str(status): count for status, count in sorted(statuses.items(), key=str)},
+                'histogram_ms': dict(zip([str(bound) for bound in HISTOGRAM_BUCKETS_MS] + ['inf'], histogram)),
+            }
+        return routes
+
+class VirtualUser:
+    """One simulated client: a connection, a random stream and cached logins"""
+
+    def __init__(self, number, target, stats, seed, shared):
+        self.number = number
+        self.connection = HttpConnection(target.hostname, target.port or 80)
+        self.stats = stats
+        self.rng = random.Random(f"{seed}:{number}")
+        self.shared = shared
+        self.tokens = {}
+
+    async def call(self, route, method, path, payload=None, token=None, headers=None):
+        headers = dict(headers or {})
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+
+        started = time.perf_counter()
+        try:
+            status, data = await self.connection.request(method, path, headers, body)
+        except HttpError:
+            self.stats.record(route, time.perf_counter() - started, 'error')
+            return None, None
+        self.stats.record(route, time.perf_counter() - started, status)
+        try:
+            return status, json.loads(data) if data[:1] in (b'{', b'[') else data
+        except ValueError:
+            return status, data
+
+    async def login(self, role, number):
+        key = (role, number)
+        if key not in self.tokens:
+            status, data = await self.call('POST /api/auth/login', 'POST', '/api/auth/login',
+                                           {'email': f"{role}{number}@example.com", 'password': LOGIN_PASSWORD})
+            if status != 200 or not isinstance(data, dict):
+                return None
+            self.tokens[key] = data['token']
+        return self.tokens[key]
+
+    async def browse(self):
+        status, data = await self.call('GET /api/campaigns', 'GET', '/api/campaigns?visible=1')
+        if status == 200 and isinstance(data, list) and data:
+            self.shared['campaigns'] = data
+        await self.call('GET /api/campaigns?type=best', 'GET', '/api/campaigns?type=best&visible=1')
+        await self.call('GET /api/campaigns/reviews/best', 'GET', '/api/campaigns/reviews/best?visible=1')
+
+    async def images(self):
+        thumbnails = [campaign['thumbnail_image'] for campaign in self.shared.get('campaigns', [])
+                      if str(campaign.get('thumbnail_image') or '').startswith('/api/images/')]
+        if not thumbnails:
+            return await self.browse()
+        for path in self.rng.sample(thumbnails, min(4, len(thumbnails))):
+            await self.call('GET /api/images/*', 'GET', f"{path}?w=480",
+                            headers={'Accept': 'image/avif,image/webp,image/*'})
+
+    async def login_scenario(self):
+        number = self.rng.randrange(1, self.shared['influencers'] + 1)
+        await self.call('POST /api/auth/login', 'POST', '/api/auth/login',
+                        {'email': f"influencer{number}@example.com", 'password': LOGIN_PASSWORD})
+
+    async def apply(self):
+        campaigns = self.shared.get('campaigns')
+        if not campaigns:
+            return await self.browse()
+        # Each virtual user applies as its own influencer, so duplicates are rare
+        token = await self.login('influencer', self.number % self.shared['influencers'] + 1)
+        if not token:
+            return
+        recruiting = [c for c in campaigns if c.get('display_status') == 'recruiting'] or campaigns
+        campaign_id = self.rng.choice(recruiting)['id']
+        await self.call('GET /api/campaigns/:id', 'GET', f"/api/campaigns/{campaign_id}", token=token)
+        # 201, or 400 when already applied / out of the application period: both are normal traffic
+        await self.call('POST /api/campaigns/:id/apply', 'POST', f"/api/campaigns/{campaign_id}/apply", {
+            'message': '부하 테스트 지원', 'real_name': '테스트', 'birth_date': '1995-01-01', 'gender': 'female',
+            'contact_phone': '010-0000-0000', 'portrait_rights_consent': True, 'personal_info_consent': True,
+            'content_usage_consent': True, 'shipping_recipient': '테스트', 'shipping_phone': '010-0000-0000',
+            'shipping_zipcode': '06236', 'shipping_address': '서울 강남구 테헤란로 1', 'shipping_detail': '101호',
+        }, token=token)
+
+    async def admin_stats(self):
+        token = await self.login('admin', 1)
+        if token:
+            await self.call('GET /api/admin/stats', 'GET', '/api/admin/stats', token=token)
+
+    async def run(self, deadline, think_time):
+        scenarios = {
+            'browse': self.browse, 'images': self.images, 'login': self.login_scenario,
+            'apply': self.apply, 'admin_stats': self.admin_stats,
+        }
+        names = list(SCENARIO_WEIGHTS)
+        weights = [SCENARIO_WEIGHTS[name] for name in names]
+        try:
+            while time.monotonic() < deadline:
+                await scenarios[self.rng.choices(names, weights)[0]]()
+                if think_time:
+                    await asyncio.sleep(self.rng.expovariate(1 / think_time))
+        finally:
+            await self.connection.close()
+
+async def run_load(base_url, concurrency, duration, warmup, seed, think_time, influencers):
+    target = urlsplit(base_url)
+    stats = Stats()
+    shared = {'influencers': influencers}
+    users = [VirtualUser(number, target, stats, seed, shared) for number in range(concurrency)]
+
+    # Campaign list for the image/apply scenarios
+    await users[0].browse()
+
+    deadline = time.monotonic() + warmup + duration
+    tasks = [asyncio.create_task(user.run(deadline, think_time)) for user in users]
+    await asyncio.sleep(warmup)
+    stats.recording = True
+    started = time.monotonic()
+    await asyncio.gather(*tasks)
+    return stats.summary(time.monotonic() - started), time.monotonic() - started
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(routes, elapsed, previous=None):
+    total = sum(route['requests'] for route in routes.values())
+    print(f"\n📊 {total:,}건 / {elapsed:.1f}s = {total / elapsed:,.1f} req/s\n")
+    print(f"{'route':<34} {'req':>7} {'req/s':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  status")
+    for name, route in routes.items():
+        statuses = " ".join(f"{status}×{count}" for status, count in route['statuses'].items())
+        print(f"{name:<34} {route['requests']:>7,} {route['rps']:>8.1f} {route['error_rate'] * 100:>5.1f}% "
+              f"{route['p50_ms']:>7.1f}ms {route['p95_ms']:>6.1f}ms {route['p99_ms']:>6.1f}ms "
+              f"{route['max_ms']:>6.0f}ms  {statuses}")
+
+    if previous:
+        print(f"\n🔁 비교: {previous['meta'].get('commit') or '?'} → 현재 (p95, req/s)")
+        for name, route in routes.items():
+            before = previous['routes'].get(name)
+            if not before:
+                continue
+            delta = (route['p95_ms'] - before['p95_ms']) / max(before['p95_ms'], 1e-9) * 100
+            marker = '🔺' if delta > 10 else '🔻' if delta < -10 else '  '
+            print(f"   {marker} {name:<34} p95 {before['p95_ms']:>7.1f} → {route['p95_ms']:>7.1f}ms "
+                  f"({delta:+.0f}%), req/s {before['rps']:.1f} → {route['rps']:.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 부하 테스트 (라우트별 p50/p95/p99)")
+    parser.add_argument('--url', default=DEFAULT_URL, help="대상 서버 (기본 %(default)s)")
+    parser.add_argument('--concurrency', '-c', type=int, default=DEFAULT_CONCURRENCY, help="가상 사용자 수")
+    parser.add_argument('--duration', '-d', type=float, default=DEFAULT_DURATION, help="측정 시간 (초)")
+    parser.add_argument('--warmup', type=float, default=DEFAULT_WARMUP, help="측정 전 워밍업 (초)")
+    parser.add_argument('--think-time', type=float, default=0.0, help="시나리오 사이 평균 대기 (초, 0 = 없음)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="generate_dataset.py 배율 (로그인에 쓸 인플루언서 수)")
+    parser.add_argument('--json', help="결과를 JSON으로 저장할 경로")
+    parser.add_argument('--compare', help="이전 실행 JSON과 비교")
+    args = parser.parse_args(argv)
+
+    influencers = max(1, round(BASE_COUNTS['influencers'] * args.scale))
+    print(f"🚦 부하 테스트: {args.url}, 가상 사용자 {args.concurrency}명, {args.duration:g}s "
+          f"(워밍업 {args.warmup:g}s)")
+    try:
+        routes, elapsed = asyncio.run(run_load(args.url, args.concurrency, args.duration, args.warmup,
+                                               args.seed, args.think_time, influencers))
+    except KeyboardInterrupt:
+        return 130
+    if not routes:
+        print(f"❌ 응답이 없습니다 - 서버가 실행 중인지 확인하세요 ({args.url})")
+        return 1
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+    print_report(routes, elapsed, previous)
+
+    if args.json:
+        result = {
+            'meta': {
+                'commit': git_commit(), 'url': args.url, 'concurrency': args.concurrency,
+                'duration': args.duration, 'warmup': args.warmup, 'think_time': args.think_time,
+                'seed': args.seed, 'scenarios': SCENARIO_WEIGHTS,
+                'finished_at': datetime.now(timezone.utc).isoformat(), 'elapsed': elapsed,
+            },
+            'routes': routes,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 JSON 저장: {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+-- Persisted sort rank for the public campaign list (keyset pagination)
+-- 목록 순서(모집중 → 일시중지 → 완료 → 취소 → 승인대기)를 컬럼으로 저장
+-- 높은 순위가 먼저: approved 4, suspended 3, completed 2, cancelled 1, pending 0
+-- 인덱스가 모두 DESC 이므로 커서 조건 (sort_rank, created_at, id) < (?, ?, ?) 하나로 바로 탐색
+
+ALTER TABLE campaigns ADD COLUMN sort_rank INTEGER NOT NULL DEFAULT 0;
+
+UPDATE campaigns SET sort_rank = CASE status
+  WHEN 'approved' THEN 4
+  WHEN 'suspended' THEN 3
+  WHEN 'completed' THEN 2
+  WHEN 'cancelled' THEN 1
+  ELSE 0
+END;
+
+CREATE INDEX IF NOT EXISTS idx_campaigns_list_order ON campaigns(sort_rank DESC, created_at DESC, id DESC);
+
+-- 상태가 바뀌는 모든 경로(등록, 상태 변경, 관리자 처리)에서 순위를 자동 갱신
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_sort_rank_insert
+AFTER INSERT ON campaigns
+BEGIN
+  UPDATE campaigns SET sort_rank = CASE NEW.status
+    WHEN 'approved' THEN 4
+    WHEN 'suspended' THEN 3
+    WHEN 'completed' THEN 2
+    WHEN 'cancelled' THEN 1
+    ELSE 0
+  END
+  WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_sort_rank_update
+AFTER UPDATE OF status ON campaigns
+WHEN NEW.status IS NOT OLD.status
+BEGIN
+  UPDATE campaigns SET sort_rank = CASE NEW.status
+    WHEN 'approved' THEN 4
+    WHEN 'suspended' THEN 3
+    WHEN 'completed' THEN 2
+    WHEN 'cancelled' THEN 1
+    ELSE 0
+  END
+  WHERE id = NEW.id;
+END;
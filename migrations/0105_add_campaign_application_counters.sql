@@ -0,0 +1,58 @@
+-- Denormalized application counters on campaigns
+-- 목록/광고주 화면에서 매 요청마다 applications를 COUNT하지 않도록 캠페인에 저장
+-- applications 트리거가 자동 갱신, application_counters.py로 검증/복구
+
+ALTER TABLE campaigns ADD COLUMN application_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE campaigns ADD COLUMN pending_application_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE campaigns ADD COLUMN approved_application_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE campaigns ADD COLUMN rejected_application_count INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 데이터 백필
+UPDATE campaigns SET
+  application_count = (SELECT COUNT(*) FROM applications a WHERE a.campaign_id = campaigns.id),
+  pending_application_count = (SELECT COUNT(*) FROM applications a WHERE a.campaign_id = campaigns.id AND a.status = 'pending'),
+  approved_application_count = (SELECT COUNT(*) FROM applications a WHERE a.campaign_id = campaigns.id AND a.status = 'approved'),
+  rejected_application_count = (SELECT COUNT(*) FROM applications a WHERE a.campaign_id = campaigns.id AND a.status = 'rejected');
+
+-- 지원 등록
+CREATE TRIGGER IF NOT EXISTS trg_applications_count_insert
+AFTER INSERT ON applications
+BEGIN
+  UPDATE campaigns SET
+    application_count = application_count + 1,
+    pending_application_count = pending_application_count + (NEW.status = 'pending'),
+    approved_application_count = approved_application_count + (NEW.status = 'approved'),
+    rejected_application_count = rejected_application_count + (NEW.status = 'rejected')
+  WHERE id = NEW.campaign_id;
+END;
+
+-- 지원 취소 (캠페인 삭제로 인한 CASCADE 포함)
+CREATE TRIGGER IF NOT EXISTS trg_applications_count_delete
+AFTER DELETE ON applications
+BEGIN
+  UPDATE campaigns SET
+    application_count = application_count - 1,
+    pending_application_count = pending_application_count - (OLD.status = 'pending'),
+    approved_application_count = approved_application_count - (OLD.status = 'approved'),
+    rejected_application_count = rejected_application_count - (OLD.status = 'rejected')
+  WHERE id = OLD.campaign_id;
+END;
+
+-- 승인/거절 처리 (campaign_id 변경도 이전 캠페인에서 빼고 새 캠페인에 더함)
+CREATE TRIGGER IF NOT EXISTS trg_applications_count_update
+AFTER UPDATE OF status, campaign_id ON applications
+WHEN NEW.status IS NOT OLD.status OR NEW.campaign_id IS NOT OLD.campaign_id
+BEGIN
+  UPDATE campaigns SET
+    application_count = application_count - 1,
+    pending_application_count = pending_application_count - (OLD.status = 'pending'),
+    approved_application_count = approved_application_count - (OLD.status = 'approved'),
+    rejected_application_count = rejected_application_count - (OLD.status = 'rejected')
+  WHERE id = OLD.campaign_id;
+  UPDATE campaigns SET
+    application_count = application_count + 1,
+    pending_application_count = pending_application_count + (NEW.status = 'pending'),
+    approved_application_count = approved_application_count + (NEW.status = 'approved'),
+    rejected_application_count = rejected_application_count + (NEW.status = 'rejected')
+  WHERE id = NEW.campaign_id;
+END;
@@ -0,0 +1,80 @@
+-- Materialized display status (getDisplayStatus in src/utils/campaign-status.ts)
+-- 화면에 보이는 상태(recruiting/in_progress/...)를 컬럼으로 저장해 DB에서 필터/정렬
+--
+-- display_status_until: 날짜 경계(신청 시작일, 신청 마감 다음날, 콘텐츠 종료 다음날) 중
+-- 오늘(KST) 이후 가장 가까운 날짜. 이 날짜가 지나면 refresh_display_status.py가 다시 계산
+-- (날짜로 바뀌지 않는 상태는 NULL). 상태/결제/일정 변경은 트리거가 즉시 반영
+-- 계산식은 refresh_display_status.py와 동일하게 유지할 것
+
+ALTER TABLE campaigns ADD COLUMN display_status TEXT NOT NULL DEFAULT 'pending';
+ALTER TABLE campaigns ADD COLUMN display_status_until TEXT;
+
+-- 기존 데이터 백필 (오늘 = 한국 시간 기준)
+UPDATE campaigns SET
+  display_status = CASE
+    WHEN status != 'approved' THEN status
+    WHEN payment_status IS NOT 'paid' THEN 'pending'
+    WHEN NULLIF(application_start_date, '') IS NOT NULL AND NULLIF(application_end_date, '') IS NOT NULL
+      AND date('now', '+9 hours') >= application_start_date AND date('now', '+9 hours') <= application_end_date THEN 'recruiting'
+    WHEN NULLIF(application_end_date, '') IS NOT NULL AND date('now', '+9 hours') > application_end_date
+      AND (NULLIF(content_end_date, '') IS NULL OR date('now', '+9 hours') <= content_end_date) THEN 'in_progress'
+    ELSE 'approved'
+  END,
+  display_status_until = CASE WHEN status = 'approved' AND payment_status IS 'paid' THEN (
+    SELECT MIN(d) FROM (
+      SELECT NULLIF(campaigns.application_start_date, '') AS d
+      UNION ALL SELECT date(NULLIF(campaigns.application_end_date, ''), '+1 day')
+      UNION ALL SELECT date(NULLIF(campaigns.content_end_date, ''), '+1 day')
+    ) WHERE d > date('now', '+9 hours')
+  ) END;
+
+-- "모집중" 등 화면 상태별 목록: 같은 정렬 키로 커서 페이지네이션
+CREATE INDEX IF NOT EXISTS idx_campaigns_display_status ON campaigns(display_status, sort_rank DESC, created_at DESC, id DESC);
+-- 스케줄 작업: 경계가 지난 행만 조회
+CREATE INDEX IF NOT EXISTS idx_campaigns_display_status_until ON campaigns(display_status_until) WHERE display_status_until IS NOT NULL;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_display_status_insert
+AFTER INSERT ON campaigns
+BEGIN
+  UPDATE campaigns SET
+    display_status = CASE
+      WHEN NEW.status != 'approved' THEN NEW.status
+      WHEN NEW.payment_status IS NOT 'paid' THEN 'pending'
+      WHEN NULLIF(NEW.application_start_date, '') IS NOT NULL AND NULLIF(NEW.application_end_date, '') IS NOT NULL
+        AND date('now', '+9 hours') >= NEW.application_start_date AND date('now', '+9 hours') <= NEW.application_end_date THEN 'recruiting'
+      WHEN NULLIF(NEW.application_end_date, '') IS NOT NULL AND date('now', '+9 hours') > NEW.application_end_date
+        AND (NULLIF(NEW.content_end_date, '') IS NULL OR date('now', '+9 hours') <= NEW.content_end_date) THEN 'in_progress'
+      ELSE 'approved'
+    END,
+    display_status_until = CASE WHEN NEW.status = 'approved' AND NEW.payment_status IS 'paid' THEN (
+      SELECT MIN(d) FROM (
+        SELECT NULLIF(NEW.application_start_date, '') AS d
+        UNION ALL SELECT date(NULLIF(NEW.application_end_date, ''), '+1 day')
+        UNION ALL SELECT date(NULLIF(NEW.content_end_date, ''), '+1 day')
+      ) WHERE d > date('now', '+9 hours')
+    ) END
+  WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_display_status_update
+AFTER UPDATE OF status, payment_status, application_start_date, application_end_date, content_end_date ON campaigns
+BEGIN
+  UPDATE campaigns SET
+    display_status = CASE
+      WHEN NEW.status != 'approved' THEN NEW.status
+      WHEN NEW.payment_status IS NOT 'paid' THEN 'pending'
+      WHEN NULLIF(NEW.application_start_date, '') IS NOT NULL AND NULLIF(NEW.application_end_date, '') IS NOT NULL
+        AND date('now', '+9 hours') >= NEW.application_start_date AND date('now', '+9 hours') <= NEW.application_end_date THEN 'recruiting'
+      WHEN NULLIF(NEW.application_end_date, '') IS NOT NULL AND date('now', '+9 hours') > NEW.application_end_date
+        AND (NULLIF(NEW.content_end_date, '') IS NULL OR date('now', '+9 hours') <= NEW.content_end_date) THEN 'in_progress'
+      ELSE 'approved'
+    END,
+    display_status_until = CASE WHEN NEW.status = 'approved' AND NEW.payment_status IS 'paid' THEN (
+      SELECT MIN(d) FROM (
+        SELECT NULLIF(NEW.application_start_date, '') AS d
+        UNION ALL SELECT date(NULLIF(NEW.application_end_date, ''), '+1 day')
+        UNION ALL SELECT date(NULLIF(NEW.content_end_date, ''), '+1 day')
+      ) WHERE d > date('now', '+9 hours')
+    ) END
+  WHERE id = NEW.id;
+END;
@@ -0,0 +1,99 @@
+-- Daily rollup for the admin dashboard (admin /stats)
+-- 대시보드가 visitor_logs/users/campaigns를 매번 집계하지 않도록 일별 통계를 트리거로 누적
+-- day = 한국 시간 기준 날짜 (YYYY-MM-DD)
+-- new_users / new_campaigns: 그날 생성된 행 수 (나중에 삭제되면 생성일에서 차감)
+--   → SUM(new_users) = 전체 회원 수, SUM(new_campaigns) = 전체 캠페인 수
+-- visitor_logs 보관 기간 정리는 purge_visitor_logs.py (스케줄 작업)가 담당, 롤업은 유지됨
+
+CREATE TABLE IF NOT EXISTS daily_stats (
+  day TEXT PRIMARY KEY,
+  visitors INTEGER NOT NULL DEFAULT 0,
+  page_views INTEGER NOT NULL DEFAULT 0,
+  new_users INTEGER NOT NULL DEFAULT 0,
+  new_campaigns INTEGER NOT NULL DEFAULT 0
+);
+
+-- 일별 순 방문자(IP) 중복 제거용, 최근 이틀만 보관 (purge_visitor_logs.py)
+CREATE TABLE IF NOT EXISTS daily_visitor_ips (
+  day TEXT NOT NULL,
+  ip_address TEXT NOT NULL,
+  PRIMARY KEY (day, ip_address)
+) WITHOUT ROWID;
+
+-- 기존 데이터 백필
+INSERT OR IGNORE INTO daily_visitor_ips (day, ip_address)
+SELECT DISTINCT date(visited_at, '+9 hours'), ip_address
+FROM visitor_logs
+WHERE ip_address IS NOT NULL AND date(visited_at, '+9 hours') >= date('now', '+9 hours', '-1 day');
+
+INSERT INTO daily_stats (day, visitors, page_views)
+SELECT date(visited_at, '+9 hours') AS day, COUNT(DISTINCT ip_address), COUNT(*)
+FROM visitor_logs
+WHERE visited_at IS NOT NULL
+GROUP BY day;
+
+INSERT INTO daily_stats (day, new_users)
+SELECT COALESCE(date(created_at, '+9 hours'), date('now', '+9 hours')) AS day, COUNT(*)
+FROM users
+WHERE 1
+GROUP BY day
+ON CONFLICT(day) DO UPDATE SET new_users = excluded.new_users;
+
+INSERT INTO daily_stats (day, new_campaigns)
+SELECT COALESCE(date(created_at, '+9 hours'), date('now', '+9 hours')) AS day, COUNT(*)
+FROM campaigns
+WHERE 1
+GROUP BY day
+ON CONFLICT(day) DO UPDATE SET new_campaigns = excluded.new_campaigns;
+
+-- 방문 기록: 페이지뷰 +1, 그날 처음 보는 IP면 daily_visitor_ips에 추가
+CREATE TRIGGER IF NOT EXISTS trg_visitor_logs_daily_stats
+AFTER INSERT ON visitor_logs
+BEGIN
+  INSERT INTO daily_stats (day, page_views)
+  VALUES (COALESCE(date(NEW.visited_at, '+9 hours'), date('now', '+9 hours')), 1)
+  ON CONFLICT(day) DO UPDATE SET page_views = page_views + 1;
+  INSERT INTO daily_visitor_ips (day, ip_address)
+  SELECT COALESCE(date(NEW.visited_at, '+9 hours'), date('now', '+9 hours')), NEW.ip_address
+  WHERE NEW.ip_address IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM daily_visitor_ips
+    WHERE day = COALESCE(date(NEW.visited_at, '+9 hours'), date('now', '+9 hours')) AND ip_address = NEW.ip_address
+  );
+END;
+
+-- 새 IP → 순 방문자 +1
+CREATE TRIGGER IF NOT EXISTS trg_daily_visitor_ips_insert
+AFTER INSERT ON daily_visitor_ips
+BEGIN
+  UPDATE daily_stats SET visitors = visitors + 1 WHERE day = NEW.day;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_daily_stats_insert
+AFTER INSERT ON users
+BEGIN
+  INSERT INTO daily_stats (day, new_users)
+  VALUES (COALESCE(date(NEW.created_at, '+9 hours'), date('now', '+9 hours')), 1)
+  ON CONFLICT(day) DO UPDATE SET new_users = new_users + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_daily_stats_delete
+AFTER DELETE ON users
+BEGIN
+  UPDATE daily_stats SET new_users = new_users - 1
+  WHERE day = COALESCE(date(OLD.created_at, '+9 hours'), date('now', '+9 hours'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_daily_stats_insert
+AFTER INSERT ON campaigns
+BEGIN
+  INSERT INTO daily_stats (day, new_campaigns)
+  VALUES (COALESCE(date(NEW.created_at, '+9 hours'), date('now', '+9 hours')), 1)
+  ON CONFLICT(day) DO UPDATE SET new_campaigns = new_campaigns + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_campaigns_daily_stats_delete
+AFTER DELETE ON campaigns
+BEGIN
+  UPDATE daily_stats SET new_campaigns = new_campaigns - 1
+  WHERE day = COALESCE(date(OLD.created_at, '+9 hours'), date('now', '+9 hours'));
+END;
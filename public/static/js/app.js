@@ -9,9 +9,13 @@ class ReviewSphere {
   }
 
   // 이미지 URL에 타임스탬프 추가 (캐시 우회)
-  addTimestampToImageUrl(url) {
+  // width 를 주면 R2 이미지는 해당 너비의 WebP/AVIF 변형 이미지로 요청
+  addTimestampToImageUrl(url, width) {
     if (!url) return url;
     const timestamp = Date.now();
+    if (width && url.startsWith('/api/images/')) {
+      url = `${url}${url.includes('?') ? '&' : '?'}w=${width}`;
+    }
     const separator = url.includes('?') ? '&' : '?';
     return `${url}${separator}t=${timestamp}`;
   }
@@ -369,13 +373,16 @@ class ReviewSphere {
     
     // Load campaigns and reviews for display
     let ongoingCampaigns = [];
+    let nextOngoingCursor = null;
     let bestCampaigns = [];
     let bestReviews = [];
     
     try {
       // 진행중인 캠페인 (메인 페이지에서는 visible=1만 표시)
-      const ongoingResponse = await axios.get('/api/campaigns?visible=1');
-      ongoingCampaigns = ongoingResponse.data || [];
+      // 카드용 필드만 첫 페이지(24개)로 조회
+      const ongoingResponse = await axios.get('/api/campaigns?visible=1&limit=24');
+      ongoingCampaigns = ongoingResponse.data.campaigns || [];
+      nextOngoingCursor = ongoingResponse.data.next_cursor || null;
       
       // 베스트 캠페인 (메인 페이지에서는 visible=1만 표시)
       const bestResponse = await axios.get('/api/campaigns?type=best&visible=1');
@@ -387,6 +394,10 @@ class ReviewSphere {
     } catch (error) {
       console.log('Failed to load data:', error);
     }
+
+    // 더보기에서 이어서 조회할 위치
+    this.ongoingCursor = nextOngoingCursor;
+    this.ongoingCount = ongoingCampaigns.length;
     
     app.innerHTML = `
         <div class="min-h-screen flex flex-col bg-gray-50">
@@ -717,113 +728,7 @@ class ReviewSphere {
               ` : ''}
               <div id="ongoingScroll" class="overflow-x-auto pb-4 -mx-3 px-3 scrollbar-hide">
                 <div class="flex space-x-4" style="width: max-content;">
-                ${ongoingCampaigns.length > 0 ? ongoingCampaigns.map(c => {
-                  const channelIcon = UIUtils.getChannelIcon(c.channel_type);
-                  return `
-                  <div onclick="app.viewCampaignDetail(${c.id})" class="bg-white border-2 border-gray-200 rounded-xl overflow-hidden hover:shadow-xl transition cursor-pointer flex-shrink-0" style="width: 280px;">
-                    ${c.thumbnail_image ? `
-                      <div class="w-full h-64 overflow-hidden bg-gray-100">
-                        <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-full object-cover">
-                      </div>
-                    ` : `
-                      <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center">
-                        <i class="fas fa-image text-white text-5xl opacity-50"></i>
-                      </div>
-                    `}
-                    <div class="p-4 flex flex-col" style="min-height: 220px;">
-                      <div class="flex items-start justify-between mb-2">
-                        <h4 class="font-bold text-base line-clamp-1 flex-1">${c.title}</h4>
-                        <span class="px-2 py-1 rounded-full text-xs font-semibold ${this.getStatusBadge(c.status, c)} ml-2 whitespace-nowrap">
-                          ${this.getStatusText(c.status, c)}
-                        </span>
-                      </div>
-                      <p class="text-gray-600 text-sm mb-3 line-clamp-2" style="height: 40px;">${c.description || '캠페인 설명이 없습니다'}</p>
-                      
-                      <!-- 과금 방식 정보 -->
-                      <div class="bg-purple-50 px-3 py-2 rounded-lg mb-2 space-y-1">
-                        ${c.pricing_type === 'points_only' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">포인트만</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
-                          </div>
-                        ` : c.pricing_type === 'purchase_with_points' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">총 지급 포인트</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">페이백</span>
-                            <span class="font-bold text-orange-600">${c.product_value ? c.product_value.toLocaleString() + 'P' : '-'}</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">리뷰댓가</span>
-                            <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
-                          </div>
-                        ` : c.pricing_type === 'product_with_points' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">상품 + 포인트</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">상품</span>
-                            <span class="font-bold text-green-600">제공</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
-                          </div>
-                        ` : c.pricing_type === 'voucher_with_points' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">이용권 + 포인트</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">이용권</span>
-                            <span class="font-bold text-green-600">제공</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
-                          </div>
-                        ` : c.pricing_type === 'product_only' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">상품만</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">상품</span>
-                            <span class="font-bold text-green-600">제공</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-gray-500">- P</span>
-                          </div>
-                        ` : c.pricing_type === 'voucher_only' ? `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-purple-700 font-semibold">이용권만</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">이용권</span>
-                            <span class="font-bold text-green-600">제공</span>
-                          </div>
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-gray-500">- P</span>
-                          </div>
-                        ` : `
-                          <div class="flex items-center justify-between text-xs">
-                            <span class="text-gray-600">포인트</span>
-                            <span class="font-bold text-purple-600">${(c.sphere_points > 0 || c.point_reward > 0) ? (c.sphere_points || c.point_reward).toLocaleString() + ' P' : '- P'}</span>
-                          </div>
-                        `}
-                      </div>
-                      
-                      <div class="flex items-center justify-between pt-2 border-t mt-auto">
-                        <span>${channelIcon}</span>
-                        <span class="text-sm text-gray-600"><i class="fas fa-users mr-1"></i><span class="font-semibold text-purple-600">${c.application_count || 0}</span>/${c.slots}명</span>
-                      </div>
-                    </div>
-                  </div>
-                `}).join('') : `
+                ${ongoingCampaigns.length > 0 ? ongoingCampaigns.map(c => this.renderOngoingCampaignCard(c)).join('') + (nextOngoingCursor ? this.renderOngoingLoadMore() : '') : `
                   <div class="w-full text-center py-16">
                     <i class="fas fa-inbox text-6xl text-gray-300 mb-4"></i>
                     <p class="text-xl text-gray-500 mb-2">아직 진행중인 캠페인이 없어요</p>
@@ -862,7 +767,7 @@ class ReviewSphere {
                   <div onclick="app.viewCampaignDetail(${c.id})" class="bg-white border-2 border-yellow-200 rounded-xl overflow-hidden hover:shadow-xl transition cursor-pointer flex-shrink-0" style="width: 280px;">
                     ${c.thumbnail_image ? `
                       <div class="w-full h-56 overflow-hidden bg-gray-100 relative">
-                        <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-full object-cover">
+                        <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-full object-cover">
                         <div class="absolute top-2 left-2">
                           <span class="px-3 py-1 bg-yellow-100 text-yellow-800 rounded-full text-xs font-semibold shadow-md">
                             <i class="fas fa-crown mr-1"></i>Top ${idx + 1}
@@ -1065,7 +970,7 @@ class ReviewSphere {
           <div class="max-w-7xl mx-auto px-3 sm:px-4 lg:px-8">
             <div class="grid grid-cols-2 md:grid-cols-4 gap-4 sm:gap-6">
               <div class="text-center text-white">
-                <div class="text-3xl sm:text-4xl font-bold mb-2">${ongoingCampaigns.length}</div>
+                <div id="ongoingCount" class="text-3xl sm:text-4xl font-bold mb-2">${ongoingCampaigns.length}${nextOngoingCursor ? '+' : ''}</div>
                 <div class="text-sm sm:text-base opacity-90">진행중인 캠페인</div>
               </div>
               <div class="text-center text-white">
@@ -1093,6 +998,160 @@ class ReviewSphere {
     this.initHeroSlider();
   }
 
+  // 메인 페이지 진행중 캠페인 카드 (첫 페이지와 더보기에서 함께 사용)
+  renderOngoingCampaignCard(c) {
+    const channelIcon = UIUtils.getChannelIcon(c.channel_type);
+    return `
+    <div onclick="app.viewCampaignDetail(${c.id})" class="bg-white border-2 border-gray-200 rounded-xl overflow-hidden hover:shadow-xl transition cursor-pointer flex-shrink-0" style="width: 280px;">
+      ${c.thumbnail_image ? `
+        <div class="w-full h-64 overflow-hidden bg-gray-100">
+          <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-full object-cover">
+        </div>
+      ` : `
+        <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center">
+          <i class="fas fa-image text-white text-5xl opacity-50"></i>
+        </div>
+      `}
+      <div class="p-4 flex flex-col" style="min-height: 220px;">
+        <div class="flex items-start justify-between mb-2">
+          <h4 class="font-bold text-base line-clamp-1 flex-1">${c.title}</h4>
+          <span class="px-2 py-1 rounded-full text-xs font-semibold ${this.getStatusBadge(c.status, c)} ml-2 whitespace-nowrap">
+            ${this.getStatusText(c.status, c)}
+          </span>
+        </div>
+        <p class="text-gray-600 text-sm mb-3 line-clamp-2" style="height: 40px;">${c.description || '캠페인 설명이 없습니다'}</p>
+        
+        <!-- 과금 방식 정보 -->
+        <div class="bg-purple-50 px-3 py-2 rounded-lg mb-2 space-y-1">
+          ${c.pricing_type === 'points_only' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">포인트만</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
+            </div>
+          ` : c.pricing_type === 'purchase_with_points' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">총 지급 포인트</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">페이백</span>
+              <span class="font-bold text-orange-600">${c.product_value ? c.product_value.toLocaleString() + 'P' : '-'}</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">리뷰댓가</span>
+              <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
+            </div>
+          ` : c.pricing_type === 'product_with_points' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">상품 + 포인트</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">상품</span>
+              <span class="font-bold text-green-600">제공</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
+            </div>
+          ` : c.pricing_type === 'voucher_with_points' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">이용권 + 포인트</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">이용권</span>
+              <span class="font-bold text-green-600">제공</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-purple-600">${(c.sphere_points || c.point_reward).toLocaleString()} P</span>
+            </div>
+          ` : c.pricing_type === 'product_only' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">상품만</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">상품</span>
+              <span class="font-bold text-green-600">제공</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-gray-500">- P</span>
+            </div>
+          ` : c.pricing_type === 'voucher_only' ? `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-purple-700 font-semibold">이용권만</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">이용권</span>
+              <span class="font-bold text-green-600">제공</span>
+            </div>
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-gray-500">- P</span>
+            </div>
+          ` : `
+            <div class="flex items-center justify-between text-xs">
+              <span class="text-gray-600">포인트</span>
+              <span class="font-bold text-purple-600">${(c.sphere_points > 0 || c.point_reward > 0) ? (c.sphere_points || c.point_reward).toLocaleString() + ' P' : '- P'}</span>
+            </div>
+          `}
+        </div>
+        
+        <div class="flex items-center justify-between pt-2 border-t mt-auto">
+          <span>${channelIcon}</span>
+          <span class="text-sm text-gray-600"><i class="fas fa-users mr-1"></i><span class="font-semibold text-purple-600">${c.application_count || 0}</span>/${c.slots}명</span>
+        </div>
+      </div>
+    </div>
+    `;
+  }
+
+  // 진행중 캠페인 더보기 카드 (next_cursor가 있을 때 목록 끝에 표시)
+  renderOngoingLoadMore() {
+    return `
+      <div id="ongoingLoadMore" class="flex-shrink-0 flex items-center justify-center" style="width: 160px;">
+        <button onclick="app.loadMoreOngoingCampaigns()" class="flex flex-col items-center text-purple-600 hover:text-purple-800 transition">
+          <span class="w-14 h-14 rounded-full border-2 border-purple-300 flex items-center justify-center mb-2"><i class="fas fa-plus text-xl"></i></span>
+          <span class="font-semibold">더보기</span>
+        </button>
+      </div>
+    `;
+  }
+
+  // 진행중 캠페인 다음 페이지 로드 (keyset cursor)
+  async loadMoreOngoingCampaigns() {
+    const loadMore = document.getElementById('ongoingLoadMore');
+    if (!this.ongoingCursor || this.loadingOngoing || !loadMore) return;
+    this.loadingOngoing = true;
+    loadMore.querySelector('button').disabled = true;
+
+    try {
+      const response = await axios.get(`/api/campaigns?visible=1&limit=24&cursor=${encodeURIComponent(this.ongoingCursor)}`);
+      const campaigns = response.data.campaigns || [];
+      this.ongoingCursor = response.data.next_cursor || null;
+      this.ongoingCount += campaigns.length;
+
+      loadMore.insertAdjacentHTML('beforebegin', campaigns.map(c => this.renderOngoingCampaignCard(c)).join(''));
+      if (!this.ongoingCursor) {
+        loadMore.remove();
+      }
+
+      const count = document.getElementById('ongoingCount');
+      if (count) {
+        count.textContent = `${this.ongoingCount}${this.ongoingCursor ? '+' : ''}`;
+      }
+    } catch (error) {
+      console.error('Failed to load more campaigns:', error);
+      alert('캠페인을 불러오지 못했습니다');
+    } finally {
+      this.loadingOngoing = false;
+      const button = document.querySelector('#ongoingLoadMore button');
+      if (button) button.disabled = false;
+    }
+  }
+
   // 뒤로가기
   goBack() {
     // 스크롤을 맨 위로
@@ -1193,7 +1252,7 @@ class ReviewSphere {
                   ${campaigns.map(c => `
                     <div onclick="app.viewCampaignDetail(${c.id})" class="bg-white border rounded-lg overflow-hidden hover:shadow-lg transition cursor-pointer">
                       ${c.thumbnail_image ? `
-                        <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-64 object-cover">
+                        <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-64 object-cover">
                       ` : `
                         <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center">
                           <i class="fas fa-image text-white text-6xl opacity-50"></i>
@@ -1257,7 +1316,7 @@ class ReviewSphere {
                       </span>
                     </div>
                     ${c.thumbnail_image ? `
-                      <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-64 object-cover">
+                      <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-64 object-cover">
                     ` : `
                       <div class="w-full h-64 bg-gradient-to-br from-yellow-400 to-orange-500 flex items-center justify-center">
                         <i class="fas fa-trophy text-white text-6xl opacity-50"></i>
@@ -1413,7 +1472,7 @@ class ReviewSphere {
                       <div class="p-4">
                         <div class="flex items-center gap-2 mb-2">
                           ${review.campaign_thumbnail ? `
-                            <img src="${this.addTimestampToImageUrl(review.campaign_thumbnail)}" alt="캠페인" class="w-8 h-8 rounded-full object-cover">
+                            <img src="${this.addTimestampToImageUrl(review.campaign_thumbnail, 480)}" alt="캠페인" class="w-8 h-8 rounded-full object-cover">
                           ` : ''}
                           <div class="flex-1 min-w-0">
                             <h3 class="font-bold text-sm text-gray-800 truncate">${review.campaign_title}</h3>
@@ -1695,7 +1754,7 @@ class ReviewSphere {
                 <!-- 썸네일/상세 이미지 -->
                 ${campaign.thumbnail_image ? `
                   <div class="w-full bg-gray-100">
-                    <img src="${this.addTimestampToImageUrl(campaign.thumbnail_image)}" alt="${campaign.title}" class="w-full max-h-[500px] object-contain">
+                    <img src="${this.addTimestampToImageUrl(campaign.thumbnail_image, 1024)}" alt="${campaign.title}" class="w-full max-h-[500px] object-contain">
                   </div>
                 ` : `
                   <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center">
@@ -3201,7 +3260,7 @@ class ReviewSphere {
                 <!-- 썸네일 이미지 -->
                 ${c.thumbnail_image ? `
                   <div class="w-full sm:w-32 h-32 flex-shrink-0">
-                    <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-full object-cover">
+                    <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-full object-cover">
                   </div>
                 ` : `
                   <div class="w-full sm:w-32 h-32 flex-shrink-0 bg-gray-200 flex items-center justify-center">
@@ -6055,7 +6114,7 @@ class ReviewSphere {
             ${favoriteCampaigns.map(c => `
               <div class="border rounded-lg overflow-hidden hover:shadow-md transition">
                 ${c.thumbnail_image ? `
-                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-56 object-cover cursor-pointer" onclick="app.viewCampaignDetail(${c.id})">
+                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-56 object-cover cursor-pointer" onclick="app.viewCampaignDetail(${c.id})">
                 ` : ''}
                 <div class="p-4">
                   <div class="flex items-start justify-between mb-2">
@@ -6491,7 +6550,7 @@ class ReviewSphere {
             ${favoriteCampaigns.map(c => `
               <div class="border rounded-lg overflow-hidden hover:shadow-lg transition">
                 ${c.thumbnail_image ? `
-                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-64 object-cover cursor-pointer" onclick="app.viewCampaignDetail(${c.id})">
+                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-64 object-cover cursor-pointer" onclick="app.viewCampaignDetail(${c.id})">
                 ` : `
                   <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center cursor-pointer" onclick="app.viewCampaignDetail(${c.id})">
                     <i class="fas fa-image text-white text-6xl opacity-50"></i>
@@ -6613,7 +6672,7 @@ class ReviewSphere {
               <!-- 썸네일 이미지 -->
               ${c.thumbnail_image ? `
                 <div class="w-full h-64 overflow-hidden bg-gray-100">
-                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image)}" alt="${c.title}" class="w-full h-full object-cover">
+                  <img src="${this.addTimestampToImageUrl(c.thumbnail_image, 480)}" alt="${c.title}" class="w-full h-full object-cover">
                 </div>
               ` : `
                 <div class="w-full h-64 bg-gradient-to-br from-purple-400 to-blue-500 flex items-center justify-center">
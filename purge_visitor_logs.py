@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+방문 기록 보관 기간 정리 (스케줄 작업)
+
+Deletes visitor_logs rows older than the retention window, plus the
+per-day IP dedup rows in daily_visitor_ips once their day is over. Until
+now admin /stats ran this purge on every dashboard load. The daily_stats
+rollup (migration 0107) keeps the aggregated history, so only the raw
+rows are dropped.
+
+visitor_logs ids grow with visited_at, so the expired rows form an id
+prefix. They are deleted in id-range chunks of DELETE_BATCH_SIZE rows, so
+each D1 statement stays short and never blocks the worker's inserts for
+long.
+
+--verify compares the rollup totals with the raw tables: users,
+campaigns, and today's unique visitors.
+
+Run once a day, e.g. from cron:
+
+  30 18 * * *  cd /home/user/webapp && python3 purge_visitor_logs.py   # 03:30 KST
+
+Usage:
+  python3 purge_visitor_logs.py                  # 프로덕션 D1, 30일 보관
+  python3 purge_visitor_logs.py --days 60 --local
+  python3 purge_visitor_logs.py --verify
+"""
+
+from datetime import datetime, timedelta, timezone
+import argparse
+import sqlite3
+import time
+import sys
+
+from application_counters import d1_query, sqlite_query
+from d1_client import D1Error
+from refresh_display_status import kst_today
+
+# Raw visitor logs kept for this many days (admin /stats used the same window)
+RETENTION_DAYS = 30
+# visitor_logs ids per DELETE statement
+DELETE_BATCH_SIZE = 5000
+# daily_visitor_ips only dedups today's visitors; keep yesterday for late writes
+VISITOR_IP_DAYS = 2
+
+def purge_visitor_logs(query, cutoff, batch_size=DELETE_BATCH_SIZE):
+    """Delete visitor_logs rows visited before `cutoff` (ISO string); returns rows deleted"""
+    bounds = query(
+        "SELECT MIN(id) AS low, MAX(id) AS high, COUNT(*) AS count FROM visitor_logs WHERE visited_at < ?",
+        [cutoff]
+    )[0]
+    if not bounds['count']:
+        return 0
+    for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+        query(
+            "DELETE FROM visitor_logs WHERE id >= ? AND id < ? AND visited_at < ?",
+            [start, start + batch_size, cutoff]
+        )
+    return bounds['count']
+
+def purge_visitor_ips(query, today):
+    """Drop dedup rows for days that can no longer receive visits"""
+    oldest = (datetime.fromisoformat(today) - timedelta(days=VISITOR_IP_DAYS - 1)).date().isoformat()
+    query("DELETE FROM daily_visitor_ips WHERE day < ?", [oldest])
+
+def verify(query, today):
+    """[(metric, rollup value, actual value)] for every metric that disagrees"""
+    row = query(
+        """SELECT
+          (SELECT COALESCE(SUM(new_users), 0) FROM daily_stats) AS rollup_users,
+          (SELECT COUNT(*) FROM users) AS actual_users,
+          (SELECT COALESCE(SUM(new_campaigns), 0) FROM daily_stats) AS rollup_campaigns,
+          (SELECT COUNT(*) FROM campaigns) AS actual_campaigns,
+          (SELECT COALESCE(MAX(visitors), 0) FROM daily_stats WHERE day = ?1) AS rollup_visitors,
+          (SELECT COUNT(DISTINCT ip_address) FROM visitor_logs WHERE date(visited_at, '+9 hours') = ?1) AS actual_visitors""",
+        [today]
+    )[0]
+    return [
+        (metric, row[f'rollup_{metric}'], row[f'actual_{metric}'])
+        for metric in ('users', 'campaigns', 'visitors')
+        if row[f'rollup_{metric}'] != row[f'actual_{metric}']
+    ]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="방문 기록 보관 기간 정리")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 대상")
+    target.add_argument('--sqlite', help="SQLite 파일 대상")
+    parser.add_argument('--days', type=int, default=RETENTION_DAYS, help="보관 일수 (기본 %(default)s)")
+    parser.add_argument('--verify', action='store_true', help="삭제하지 않고 daily_stats 롤업만 검사")
+    args = parser.parse_args(argv)
+
+    query = sqlite_query(args.sqlite) if args.sqlite else d1_query(remote=not args.local)
+    today = kst_today()
+    started = time.time()
+    try:
+        if args.verify:
+            mismatches = verify(query, today)
+            for metric, rollup, actual in mismatches:
+                print(f"⚠️  {metric}: daily_stats {rollup:,} ≠ 실제 {actual:,}")
+            if mismatches:
+                return 1
+            print(f"✅ daily_stats 롤업이 실제 데이터와 일치합니다 ({today})")
+            return 0
+
+        # Same cutoff the dashboard used: now - N days, as an ISO timestamp like visited_at
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=args.days)).isoformat(timespec='milliseconds')
+        cutoff = cutoff.replace('+00:00', 'Z')
+        deleted = purge_visitor_logs(query, cutoff)
+        purge_visitor_ips(query, today)
+    except (D1Error, sqlite3.Error) as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return 1
+
+    print(f"🧹 {args.days}일 지난 방문 기록 {deleted:,}건 삭제 ({time.time() - started:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
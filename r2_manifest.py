@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Content-addressed R2 upload manifest
+
+Every object put to R2 by the migration tools is recorded here with the
+SHA-256 of its bytes (→ key, size, etag, content type), one JSON line per
+upload. Before a put the file is hashed and the manifest consulted: when
+the key was last written with these exact bytes and R2 still reports the
+recorded size and etag (a HEAD, so objects the worker has overwritten or
+deleted since are noticed), the upload is skipped.
+
+With dedupe=True the bytes go to their content-addressed key
+(sha256/<digest>.<ext>) instead of the caller's key. Nothing else writes
+under sha256/, so campaigns sharing an image can all point at that object
+without a later edit of one of them changing the others.
+
+Reruns after partial failures only upload what actually changed. Local
+(miniflare) and remote buckets keep separate manifests.
+
+Usage:
+  from r2_manifest import UploadManifest
+  manifest = UploadManifest.for_mode(remote=True)
+  key, uploaded = manifest.put(client, '13.jpg', '/tmp/13.jpg', 'image/jpeg')
+"""
+
+from concurrent.futures import Future
+from datetime import datetime, timezone
+import threading
+import hashlib
+import json
+import os
+import re
+
+from d1_client import D1Error
+
+MANIFEST_FILE = "r2-manifest.{mode}.jsonl"
+# Immutable, content-addressed objects (dedupe=True)
+CONTENT_KEY_PREFIX = "sha256/"
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def content_key(digest, content_type):
+    """sha256/<digest>.<ext> for bytes of the given content type"""
+    subtype = re.sub(r'\W', '', content_type.split('/')[-1].split(';')[0]) or 'bin'
+    return f"{CONTENT_KEY_PREFIX}{digest}.{'jpg' if subtype == 'jpeg' else subtype}"
+
+class UploadManifest:
+    """R2 key → last uploaded bytes, backed by an append-only JSON lines file (thread-safe)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        # key → entry of its last upload
+        self.keys = {}
+        # (key, sha256) → Future, for puts in progress
+        self.inflight = {}
+
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._index(json.loads(line))
+                    except (ValueError, KeyError):
+                        # Torn last line from a crash
+                        continue
+
+        self.f = open(path, 'a', encoding='utf-8')
+
+    @classmethod
+    def for_mode(cls, remote=True):
+        return cls(MANIFEST_FILE.format(mode='remote' if remote else 'local'))
+
+    def _index(self, entry):
+        self.keys[entry['key']] = entry
+
+    def _record(self, entry):
+        with self.lock:
+            self.f.write(json.dumps(entry) + "\n")
+            self.f.flush()
+            os.fsync(self.f.fileno())
+            self._index(entry)
+
+    def _still_stored(self, client, entry):
+        """True if R2 still holds the object as it was recorded"""
+        try:
+            head = client.r2_head(entry['key'])
+        except D1Error:
+            # Unknown: upload again rather than trust the cache
+            return False
+        if head is None or head.get('size') != entry.get('size'):
+            return False
+        return not (entry.get('etag') and head.get('etag')) or head['etag'] == entry['etag']
+
+    def put(self, client, key, path, content_type='image/jpeg', dedupe=False, put=None):
+        """Upload path to key unless R2 already has the bytes there
+
+        put(key, path, content_type) does the actual upload (default
+        client.r2_put; pass a retrying wrapper to add retries). Returns
+        (key, uploaded) where key is where the bytes live: the caller's key,
+        or their content-addressed key with dedupe=True.
+        """
+        put = put or client.r2_put
+        digest = file_sha256(path)
+        if dedupe:
+            key = content_key(digest, content_type)
+
+        while True:
+            with self.lock:
+                entry = self.keys.get(key)
+                waiting = self.inflight.get((key, digest))
+                if waiting is None:
+                    claim = Future()
+                    self.inflight[(key, digest)] = claim
+                    break
+            # Same bytes are being put to the same key by another worker right now
+            try:
+                waiting.result()
+                return key, False
+            except Exception:
+                continue
+
+        try:
+            uploaded = not (entry and entry['sha256'] == digest and self._still_stored(client, entry))
+            if uploaded:
+                result = put(key, path, content_type) or {}
+                self._record({
+                    'sha256': digest,
+                    'key': key,
+                    'size': result.get('size', os.path.getsize(path)),
+                    'etag': result.get('etag'),
+                    'content_type': content_type,
+                    'at': datetime.now(timezone.utc).isoformat(),
+                })
+        except BaseException as e:
+            with self.lock:
+                self.inflight.pop((key, digest), None)
+            claim.set_exception(e)
+            raise
+
+        with self.lock:
+            self.inflight.pop((key, digest), None)
+        claim.set_result(key)
+        return key, uploaded
+
+    def close(self):
+        self.f.close()
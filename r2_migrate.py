@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Base64 썸네일 → R2 마이그레이션 엔진
+
+Uploads inline base64 thumbnails to R2 on a bounded worker pool, with
+retry and exponential backoff. Successful uploads are collected and
+campaigns.thumbnail_image is repointed at /api/images/{key} with a few
+batched CASE updates, each followed by a verification read. A campaign is
+appended to the journal only once both R2 and D1 are done, so a crashed
+or interrupted run resumes where it stopped and never leaves a row
+pointing at a missing object.
+
+Each source keeps its own journal (r2-migration.{source}.journal), since
+file ids and table ids are independent. Only the files source skips ids
+found in its journal; for the db source the `LIKE 'data:image%'`
+candidate query already reflects what is left, so its journal is an
+audit log only.
+
+Every put goes through the upload manifest (r2_manifest.py): bytes R2
+already holds are not uploaded again. The db source stores images under
+their immutable content-addressed key (sha256/<digest>.jpg), so campaigns
+sharing an image all point at one object that the worker's {id}.jpg
+uploads never overwrite.
+
+Sources:
+  - db:    campaigns whose thumbnail_image is still a data URI (whole table)
+  - files: local campaign_{id}_base64.txt files (upload only)
+
+Usage:
+  python3 r2_migrate.py                      # 전체 테이블 마이그레이션
+  python3 r2_migrate.py --start-id 40        # ID 40부터
+  python3 r2_migrate.py --source files       # campaign_*_base64.txt 업로드
+  python3 r2_migrate.py --local              # 로컬 miniflare D1/R2 대상
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+import threading
+import argparse
+import tempfile
+import random
+import glob
+import json
+import time
+import sys
+import os
+import re
+
+from d1_client import D1Error, get_client
+from datauri import decode_stream, iter_file_chunks
+from r2_manifest import UploadManifest
+
+# Append-only progress journal (one JSON line per finished campaign), one per source
+JOURNAL_FILE = "r2-migration.{source}.journal"
+
+# Concurrent uploads
+MIGRATION_WORKERS = 8
+# Upload retries with exponential backoff (seconds)
+UPLOAD_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30
+# Campaign ids fetched per candidate page
+CANDIDATE_PAGE_SIZE = 100
+# Thumbnail URL updates: D1 allows 100 bound parameters per statement and a
+# CASE row uses 3 (WHEN ?, THEN ?, IN ?), so 33 rows per UPDATE; uploads are
+# flushed to D1 in one batch call every URL_UPDATE_FLUSH_SIZE successes
+URL_UPDATE_ROWS_PER_STATEMENT = 33
+URL_UPDATE_FLUSH_SIZE = 99
+
+BASE64_FILES_GLOB = "campaign_*_base64*.txt"
+
+# Characters of a data URI fetched per substr() query / file read, so a
+# decode never holds more than one chunk of base64 text in memory
+DATA_URI_CHUNK_CHARS = 256 * 1024
+
+def r2_key_for(campaign_id):
+    return f"{campaign_id}.jpg"
+
+def r2_url_for(key):
+    return f"/api/images/{key}"
+
+class Journal:
+    """Append-only log of finished campaign ids (thread-safe)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.done = set()
+
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self.done.add(json.loads(line)['campaign_id'])
+                    except (ValueError, KeyError):
+                        # Torn last line from a crash
+                        continue
+
+        self.f = open(path, 'a', encoding='utf-8')
+
+    def record(self, campaign_id, **details):
+        entry = {'campaign_id': campaign_id, 'at': datetime.now(timezone.utc).isoformat(), **details}
+        with self.lock:
+            self.f.write(json.dumps(entry) + "\n")
+            self.f.flush()
+            os.fsync(self.f.fileno())
+            self.done.add(campaign_id)
+
+    def close(self):
+        self.f.close()
+
+def with_retry(action, description, retries=UPLOAD_RETRIES):
+    """Run action(), retrying D1/R2 errors with exponential backoff and jitter"""
+    for attempt in range(retries + 1):
+        try:
+            return action()
+        except D1Error as e:
+            if attempt == retries:
+                raise
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)) * (0.5 + random.random())
+            print(f"   🔁 {description}: {e} (재시도 {attempt + 1}/{retries}, {delay:.1f}s 후)")
+            time.sleep(delay)
+
+def iter_db_data_uri_chunks(client, campaign_id, length, chunk_chars=DATA_URI_CHUNK_CHARS,
+                            retries=UPLOAD_RETRIES):
+    """Yield campaigns.thumbnail_image of one row in substr() chunks"""
+    for start in range(1, length + 1, chunk_chars):
+        rows = with_retry(lambda: client.query(
+            "SELECT substr(thumbnail_image, ?, ?) AS chunk FROM campaigns WHERE id = ?",
+            [start, chunk_chars, campaign_id]
+        ), f"ID {campaign_id} 조회", retries)
+        if not rows or rows[0]['chunk'] is None:
+            raise D1Error(f"campaign {campaign_id} changed while reading")
+        yield rows[0]['chunk']
+
+def upload_image(client, campaign_id, chunks, retries=UPLOAD_RETRIES, manifest=None, dedupe=False):
+    """Decode base64 chunks into a temp file and put it to R2 with retries
+
+    Returns (key, byte size, uploaded). The MIME type from the data URI
+    header is kept as the object's content type. With a manifest the put
+    is skipped when R2 already has the bytes; with dedupe the key is the
+    content-addressed one, shared by every campaign with the same image.
+    """
+    with tempfile.NamedTemporaryFile(suffix='.img', delete=False) as tmp_file:
+        tmp_path = tmp_file.name
+        try:
+            mime, size = decode_stream(chunks, tmp_file)
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_path)
+            raise
+
+    def put(key, path, content_type):
+        return with_retry(lambda: client.r2_put(key, path, content_type),
+                          f"ID {campaign_id} 업로드", retries)
+
+    key = r2_key_for(campaign_id)
+    try:
+        if manifest is None:
+            put(key, tmp_path, mime)
+            return key, size, True
+        key, uploaded = manifest.put(client, key, tmp_path, mime, dedupe=dedupe, put=put)
+        return key, size, uploaded
+    finally:
+        os.unlink(tmp_path)
+
+def iter_db_candidates(client, start_id=0, page_size=CANDIDATE_PAGE_SIZE):
+    """Yield ids of campaigns that still hold a data URI (keyset paginated)"""
+    last_id = start_id - 1
+    while True:
+        rows = with_retry(lambda: client.query(
+            "SELECT id FROM campaigns WHERE id > ? AND thumbnail_image LIKE 'data:image%' "
+            "ORDER BY id LIMIT ?",
+            [last_id, page_size]
+        ), "후보 조회")
+        for row in rows:
+            yield row['id']
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+def migrate_db_campaign(client, campaign_id, retries=UPLOAD_RETRIES, manifest=None):
+    """Upload one campaign's inline thumbnail, return upload_image()'s (key, size, uploaded)
+
+    None if the row is no longer inline. Identical images are stored once.
+    The row is repointed later by flush_url_updates().
+    """
+    rows = with_retry(lambda: client.query(
+        "SELECT length(thumbnail_image) AS length FROM campaigns "
+        "WHERE id = ? AND thumbnail_image LIKE 'data:image%'", [campaign_id]
+    ), f"ID {campaign_id} 조회", retries)
+    if not rows:
+        # Migrated by someone else in the meantime
+        return None
+
+    chunks = iter_db_data_uri_chunks(client, campaign_id, rows[0]['length'], retries=retries)
+    return upload_image(client, campaign_id, chunks, retries, manifest, dedupe=True)
+
+def build_url_updates(updates, rows_per_statement=URL_UPDATE_ROWS_PER_STATEMENT):
+    """[(campaign_id, url), ...] → [(sql, params), ...] CASE updates"""
+    statements = []
+    for i in range(0, len(updates), rows_per_statement):
+        chunk = updates[i:i + rows_per_statement]
+        cases = " ".join("WHEN ? THEN ?" for _ in chunk)
+        placeholders = ", ".join("?" for _ in chunk)
+        params = [value for campaign_id, url in chunk for value in (campaign_id, url)]
+        params += [campaign_id for campaign_id, _ in chunk]
+        statements.append((
+            f"UPDATE campaigns SET thumbnail_image = CASE id {cases} END WHERE id IN ({placeholders})",
+            params
+        ))
+    return statements
+
+def flush_url_updates(client, updates, retries=UPLOAD_RETRIES):
+    """Apply URL updates in one D1 batch, then read them back
+
+    Returns the set of campaign ids whose thumbnail_image now matches.
+    """
+    if not updates:
+        return set()
+
+    with_retry(lambda: client.batch(build_url_updates(updates)), "URL 일괄 업데이트", retries)
+
+    expected = dict(updates)
+    placeholders = ", ".join("?" for _ in updates)
+    rows = with_retry(lambda: client.query(
+        f"SELECT id, thumbnail_image FROM campaigns WHERE id IN ({placeholders})", list(expected)
+    ), "URL 업데이트 검증", retries)
+    verified = {row['id'] for row in rows if row['thumbnail_image'] == expected.get(row['id'])}
+
+    print(f"   📝 DB 업데이트: {len(verified)}/{len(updates)}개 확인 (1 batch)")
+    return verified
+
+def iter_file_candidates(pattern=BASE64_FILES_GLOB):
+    """Yield (campaign_id, path) for local base64 files, preferring *_updated versions"""
+    files = {}
+    for path in sorted(glob.glob(pattern)):
+        match = re.match(r'campaign_(\d+)_base64(_updated)?\.txt$', os.path.basename(path))
+        if not match:
+            continue
+        campaign_id = int(match.group(1))
+        if match.group(2) or campaign_id not in files:
+            files[campaign_id] = path
+    yield from sorted(files.items())
+
+def migrate_file_campaign(client, campaign_id, path, retries=UPLOAD_RETRIES, manifest=None):
+    """Upload one local base64 file to {id}.jpg, return (key, size, uploaded)"""
+    chunks = iter_file_chunks(path, DATA_URI_CHUNK_CHARS)
+    return upload_image(client, campaign_id, chunks, retries, manifest)
+
+def migrate(source='db', remote=True, workers=MIGRATION_WORKERS, retries=UPLOAD_RETRIES,
+            journal_path=None, start_id=0, files_glob=BASE64_FILES_GLOB, manifest_path=None):
+    """Run the whole migration, return (success, skipped, failed) counts"""
+    client = get_client(remote)
+    journal = Journal(journal_path or JOURNAL_FILE.format(source=source))
+    manifest = UploadManifest(manifest_path) if manifest_path else UploadManifest.for_mode(remote)
+    update_db = source == 'db'
+    counts = {'success': 0, 'skip': 0, 'fail': 0}
+    # Uploaded but not yet repointed in D1: [(campaign_id, key, size)]
+    pending = []
+
+    if source == 'files':
+        tasks = ((campaign_id, lambda cid=campaign_id, p=path: migrate_file_campaign(client, cid, p, retries, manifest))
+                 for campaign_id, path in iter_file_candidates(files_glob))
+    else:
+        tasks = ((campaign_id, lambda cid=campaign_id: migrate_db_campaign(client, cid, retries, manifest))
+                 for campaign_id in iter_db_candidates(client, start_id))
+
+    def collect(future, campaign_id):
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"   ❌ ID {campaign_id}: {e}")
+            counts['fail'] += 1
+            return
+        if result is None:
+            counts['skip'] += 1
+            return
+
+        key, size, uploaded = result
+        if uploaded:
+            print(f"   📤 ID {campaign_id}: {key} ({size:,} bytes)")
+        else:
+            print(f"   ♻️  ID {campaign_id}: R2에 동일 이미지 있음 → {key}")
+        if not update_db:
+            journal.record(campaign_id, key=key, bytes=size)
+            counts['success'] += 1
+            return
+
+        pending.append((campaign_id, key, size))
+        if len(pending) >= URL_UPDATE_FLUSH_SIZE:
+            flush()
+
+    def flush():
+        batch = pending[:]
+        pending.clear()
+        try:
+            verified = flush_url_updates(client, [(cid, r2_url_for(key)) for cid, key, _ in batch], retries)
+        except D1Error as e:
+            print(f"   ❌ DB 업데이트 실패 ({len(batch)}개): {e}")
+            verified = set()
+
+        for campaign_id, key, size in batch:
+            if campaign_id in verified:
+                journal.record(campaign_id, key=key, url=r2_url_for(key), bytes=size)
+                counts['success'] += 1
+            else:
+                # Uploaded but not repointed: retried on the next run (the
+                # manifest skips the re-upload)
+                counts['fail'] += 1
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for campaign_id, task in tasks:
+                # db candidates come from the table itself, so only files consult the journal
+                if not update_db and campaign_id in journal.done:
+                    counts['skip'] += 1
+                    continue
+                futures[pool.submit(task)] = campaign_id
+
+                # Keep the submitted queue bounded
+                if len(futures) >= workers * 4:
+                    done = next(as_completed(futures))
+                    collect(done, futures.pop(done))
+
+            for done in as_completed(futures):
+                collect(done, futures[done])
+
+        flush()
+    finally:
+        journal.close()
+        manifest.close()
+
+    if update_db:
+        remaining = with_retry(lambda: client.query(
+            "SELECT COUNT(*) AS count FROM campaigns WHERE thumbnail_image LIKE 'data:image%'"
+        ), "남은 Base64 확인", retries)[0]['count']
+        print(f"\n🔎 검증: Base64 썸네일이 남은 캠페인 {remaining}개")
+
+    return counts['success'], counts['skip'], counts['fail']
+
+def build_parser(description, **defaults):
+    """Migration options shared by the migrate_*_to_r2.py wrappers"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--source', choices=['db', 'files'], default=defaults.get('source', 'db'))
+    parser.add_argument('--start-id', type=int, default=defaults.get('start_id', 0))
+    parser.add_argument('--workers', type=int, default=MIGRATION_WORKERS)
+    parser.add_argument('--retries', type=int, default=UPLOAD_RETRIES)
+    parser.add_argument('--journal', help="저널 경로 (기본: r2-migration.{db,files}.journal)")
+    parser.add_argument('--files', default=BASE64_FILES_GLOB, help="glob for --source files")
+    parser.add_argument('--manifest', help="업로드 매니페스트 경로 (기본: r2-manifest.{remote,local}.jsonl)")
+    parser.add_argument('--local', action='store_true', help="로컬 miniflare D1/R2 대상")
+    return parser
+
+def run(args, description):
+    """Run a migration from parsed build_parser() arguments, return the exit code"""
+    args.journal = args.journal or JOURNAL_FILE.format(source=args.source)
+
+    print(f"🚀 {description} (source={args.source}, workers={args.workers})\n")
+    started = time.time()
+
+    success_count, skip_count, fail_count = migrate(
+        source=args.source, remote=not args.local, workers=args.workers, retries=args.retries,
+        journal_path=args.journal, start_id=args.start_id, files_glob=args.files,
+        manifest_path=args.manifest
+    )
+
+    print(f"\n📊 마이그레이션 결과 ({time.time() - started:.1f}s):")
+    print(f"   ✅ 성공: {success_count}개")
+    print(f"   ⏭️  스킵 (이미 완료): {skip_count}개")
+    print(f"   ❌ 실패: {fail_count}개")
+    if fail_count:
+        print(f"\n다시 실행하면 실패한 항목부터 이어서 진행합니다 ({args.journal})")
+        return 1
+    return 0
+
+def main(argv=None, description="Base64 썸네일 → R2 마이그레이션", **defaults):
+    return run(build_parser(description, **defaults).parse_args(argv), description)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+캠페인 화면 상태 갱신 (campaigns.display_status, 스케줄 작업)
+
+Migration 0106 stores the status users see (recruiting / in_progress /
+approved / pending / ...) on campaigns, together with display_status_until.
+That column is the next KST date on which the dates alone would change the
+status. Triggers already handle status, payment and schedule edits, so
+this job only has to catch date boundaries. Each run recomputes just the
+rows whose display_status_until has passed. Because of the partial index
+on that column, a daily run touches only a handful of campaigns.
+
+Run it shortly after midnight KST (the worker is a Pages project, so there
+is no Workers cron trigger):
+
+  5 15 * * *  cd /home/user/webapp && python3 refresh_display_status.py   # 00:05 KST
+
+The campaign list route also runs the same UPDATE once per isolate per KST
+day (refreshExpiredDisplayStatus), so a missed cron run never leaves the
+list showing yesterday's status; the cron just keeps that request cheap.
+
+The SQL mirrors getDisplayStatus() and refreshExpiredDisplayStatus() in
+src/utils/campaign-status.ts and the triggers in
+migrations/0106_add_campaign_display_status.sql.
+
+Usage:
+  python3 refresh_display_status.py                    # 프로덕션 D1, 경계가 지난 행만
+  python3 refresh_display_status.py --local --all      # 로컬 D1 전체 재계산
+  python3 refresh_display_status.py --verify           # 저장된 상태와 재계산 결과 비교
+  python3 refresh_display_status.py --sqlite /tmp/g.sqlite --date 2025-12-01
+"""
+
+from datetime import datetime, timedelta, timezone
+from collections import Counter
+import argparse
+import sqlite3
+import time
+import sys
+
+from application_counters import d1_query, sqlite_query
+from d1_client import D1Error
+
+KST = timezone(timedelta(hours=9))
+
+# ?1 = today (KST, YYYY-MM-DD); same branches as getDisplayStatus()
+DISPLAY_STATUS_SQL = """CASE
+    WHEN status != 'approved' THEN status
+    WHEN payment_status IS NOT 'paid' THEN 'pending'
+    WHEN NULLIF(application_start_date, '') IS NOT NULL AND NULLIF(application_end_date, '') IS NOT NULL
+      AND ?1 >= application_start_date AND ?1 <= application_end_date THEN 'recruiting'
+    WHEN NULLIF(application_end_date, '') IS NOT NULL AND ?1 > application_end_date
+      AND (NULLIF(content_end_date, '') IS NULL OR ?1 <= content_end_date) THEN 'in_progress'
+    ELSE 'approved'
+  END"""
+
+# Earliest date after today on which one of the date comparisons above flips
+DISPLAY_STATUS_UNTIL_SQL = """CASE WHEN status = 'approved' AND payment_status IS 'paid' THEN (
+    SELECT MIN(d) FROM (
+      SELECT NULLIF(campaigns.application_start_date, '') AS d
+      UNION ALL SELECT date(NULLIF(campaigns.application_end_date, ''), '+1 day')
+      UNION ALL SELECT date(NULLIF(campaigns.content_end_date, ''), '+1 day')
+    ) WHERE d > ?1
+  ) END"""
+
+def kst_today():
+    return datetime.now(KST).date().isoformat()
+
+def refresh(query, today, full=False):
+    """Recompute display_status for rows whose boundary has passed (or all rows)
+
+    Returns the updated rows as dicts with id, display_status.
+    """
+    where = "" if full else "\nWHERE display_status_until <= ?1"
+    return query(
+        f"UPDATE campaigns SET\n  display_status = {DISPLAY_STATUS_SQL},\n"
+        f"  display_status_until = {DISPLAY_STATUS_UNTIL_SQL}{where}\n"
+        f"RETURNING id, display_status",
+        [today]
+    )
+
+def find_stale(query, today):
+    """Campaigns whose stored status differs from a fresh computation for today"""
+    return query(
+        f"SELECT id, display_status, {DISPLAY_STATUS_SQL} AS actual FROM campaigns\n"
+        f"WHERE display_status IS NOT {DISPLAY_STATUS_SQL}\nORDER BY id",
+        [today]
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="캠페인 화면 상태(display_status) 갱신")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 대상")
+    target.add_argument('--sqlite', help="SQLite 파일 대상")
+    parser.add_argument('--date', default=None, help="기준 날짜 YYYY-MM-DD (기본: 오늘, 한국 시간)")
+    parser.add_argument('--all', action='store_true', help="경계와 상관없이 모든 캠페인 재계산")
+    parser.add_argument('--verify', action='store_true', help="갱신하지 않고 저장된 상태만 검사")
+    args = parser.parse_args(argv)
+
+    today = args.date or kst_today()
+    query = sqlite_query(args.sqlite) if args.sqlite else d1_query(remote=not args.local)
+    started = time.time()
+    try:
+        if args.verify:
+            stale = find_stale(query, today)
+            if stale:
+                print(f"⚠️  {today} 기준 상태가 다른 캠페인 {len(stale)}개")
+                for row in stale[:20]:
+                    print(f"   #{row['id']}: {row['display_status']} → {row['actual']}")
+                return 1
+            print(f"✅ {today} 기준 모든 캠페인의 display_status가 최신입니다")
+            return 0
+
+        updated = refresh(query, today, full=args.all)
+    except (D1Error, sqlite3.Error) as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return 1
+
+    counts = Counter(row['display_status'] for row in updated)
+    summary = ', '.join(f"{status} {count}" for status, count in sorted(counts.items()))
+    print(f"🔁 {today} 기준 {len(updated)}개 캠페인 상태 갱신 ({time.time() - started:.1f}s)"
+          + (f": {summary}" if summary else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+SQL 덤프 → 로컬 SQLite 고속 복원
+
+Restores a D1 dump (backups/db_backup_*.sql, auto_backup.sh output,
+prod-to-local-sync.sql, .sql.gz) into a SQLite file or the local
+miniflare D1 state, much faster than `wrangler d1 execute --file`:
+
+  - statements are streamed from the dump (sql_dump.py), never loaded whole
+  - everything runs in ONE transaction with fsync off, the rollback
+    journal in memory and foreign keys off during the load
+  - CREATE INDEX / CREATE TRIGGER are held back and run after the data,
+    so indexes are built once instead of updated per row (and triggers
+    do not fire on restored rows)
+
+On any error the transaction is rolled back, so the target is never left
+half restored. Doubles as a quick "is this backup restorable?" check.
+
+Usage:
+  python3 restore_dump.py backups/db_backup_20251118_073354.sql --sqlite /tmp/restore.sqlite
+  python3 restore_dump.py backups/db_backup_20251118_073354.sql --local --drop-existing
+"""
+
+import argparse
+import sqlite3
+import time
+import sys
+import re
+
+from d1_sync import LOCAL_D1_STATE_DIR, find_local_d1_sqlite
+from sql_dump import iter_statements, open_dump
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 2.0
+
+_SKIPPED = re.compile(r'(?:PRAGMA|BEGIN|COMMIT|END|ROLLBACK)\b', re.I)
+_DEFERRED = re.compile(r'CREATE\s+(?:UNIQUE\s+)?(?:INDEX|TRIGGER|TEMP\w*\s+TRIGGER|VIEW)\b', re.I)
+_INSERT = re.compile(r'(?:INSERT|REPLACE)\b', re.I)
+
+class RestoreError(Exception):
+    """A dump statement failed; the restore was rolled back"""
+
+def user_tables(conn):
+    """Application tables (not SQLite or miniflare internals)"""
+    return [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' "
+        "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '_cf_%'"
+    )]
+
+def drop_user_tables(conn):
+    for name in user_tables(conn):
+        conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+
+def restore(path, conn, drop_existing=False, quiet=False):
+    """Load a dump into an open connection, return stats
+
+    conn must be in autocommit mode (isolation_level=None); the restore
+    manages its own transaction.
+    """
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if journal_mode != 'wal':
+        conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 MB
+
+    stats = {'statements': 0, 'rows': 0, 'indexes': 0, 'load_seconds': 0.0, 'index_seconds': 0.0}
+    deferred = []
+    started = time.time()
+    last_report = started
+
+    conn.execute("BEGIN")
+    try:
+        if drop_existing:
+            drop_user_tables(conn)
+
+        with open_dump(path) as f:
+            for number, sql in enumerate(iter_statements(f), 1):
+                if _SKIPPED.match(sql):
+                    continue
+                if _DEFERRED.match(sql):
+                    deferred.append((number, sql))
+                    continue
+                try:
+                    cursor = conn.execute(sql)
+                except sqlite3.Error as e:
+                    raise RestoreError(f"statement #{number}: {e}: {sql[:200]}") from e
+
+                stats['statements'] += 1
+                if _INSERT.match(sql):
+                    stats['rows'] += max(cursor.rowcount, 0)
+
+                now = time.time()
+                if not quiet and now - last_report >= PROGRESS_INTERVAL:
+                    print(f"   ⏳ {stats['rows']:,} rows ({stats['rows'] / (now - started):,.0f} rows/s)")
+                    last_report = now
+
+        stats['load_seconds'] = time.time() - started
+
+        index_started = time.time()
+        for number, sql in deferred:
+            try:
+                conn.execute(sql)
+            except sqlite3.Error as e:
+                raise RestoreError(f"statement #{number}: {e}: {sql[:200]}") from e
+            stats['indexes'] += 1
+        stats['index_seconds'] = time.time() - index_started
+
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+        if journal_mode != 'wal':
+            conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+
+    conn.execute("PRAGMA optimize")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQL 덤프 → 로컬 SQLite 고속 복원")
+    parser.add_argument('dump', help=".sql / .sql.gz 덤프 파일")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--sqlite', help="복원할 SQLite 파일 경로 (없으면 생성)")
+    target.add_argument('--local', action='store_true', help="로컬 miniflare D1 상태에 복원")
+    parser.add_argument('--drop-existing', action='store_true',
+                        help="복원 전에 기존 테이블 삭제 (같은 트랜잭션)")
+    args = parser.parse_args(argv)
+
+    path = args.sqlite
+    if args.local:
+        path = find_local_d1_sqlite()
+        if not path:
+            print(f"❌ {LOCAL_D1_STATE_DIR} 아래에 로컬 D1 데이터베이스가 없습니다 "
+                  f"(먼저 `npm run db:migrate:local` 실행)")
+            return 1
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    existing = user_tables(conn)
+    if existing and not args.drop_existing:
+        print(f"❌ {path} 에 이미 테이블 {len(existing)}개가 있습니다 (--drop-existing 으로 덮어쓰기)")
+        return 1
+
+    print(f"🚚 복원: {args.dump} → {path}")
+    try:
+        stats = restore(args.dump, conn, drop_existing=args.drop_existing)
+    except RestoreError as e:
+        print(f"❌ 복원 실패 (롤백됨): {e}")
+        return 1
+    finally:
+        conn.close()
+
+    total = stats['load_seconds'] + stats['index_seconds']
+    print(f"\n✅ 복원 완료 ({total:.2f}s)")
+    print(f"   📄 구문: {stats['statements']:,}개")
+    print(f"   📥 행: {stats['rows']:,}개 ({stats['rows'] / max(stats['load_seconds'], 1e-9):,.0f} rows/s)")
+    print(f"   🗂️  인덱스/트리거: {stats['indexes']}개 ({stats['index_seconds']:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
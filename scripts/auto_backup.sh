@@ -8,7 +8,11 @@ set -e
 
 BACKUP_DIR="/home/user/webapp/backups"
 DATE=$(date +%Y%m%d_%H%M%S)
-BACKUP_FILE="$BACKUP_DIR/db_backup_$DATE.sql"
+BACKUP_NAME="db_backup_$DATE"
+BACKUP_FILE="$BACKUP_DIR/$BACKUP_NAME.sql"
+# 중복 제거 저장소 (backup_store.py) - 변경분만 저장되므로 오래 보관
+STORE_DIR="$BACKUP_DIR/store"
+KEEP_DAYS=365
 
 echo "================================"
 echo "DB 자동 백업 시작"
@@ -21,7 +25,7 @@ echo ""
 mkdir -p "$BACKUP_DIR"
 
 # D1 Export (로컬)
-echo "[1/3] DB Export 중..."
+echo "[1/4] DB Export 중..."
 cd /home/user/webapp
 npx wrangler d1 export review-spheres-v1-production --remote --output="$BACKUP_FILE" 2>&1 || {
     echo "❌ 백업 실패"
@@ -32,14 +36,27 @@ npx wrangler d1 export review-spheres-v1-production --remote --output="$BACKUP_F
 FILESIZE=$(stat -f%z "$BACKUP_FILE" 2>/dev/null || stat -c%s "$BACKUP_FILE")
 echo "✓ 백업 완료: $(numfmt --to=iec-i --suffix=B $FILESIZE 2>/dev/null || echo $FILESIZE bytes)"
 
-# 오래된 백업 삭제 (30일 이상)
-echo "[2/3] 오래된 백업 정리..."
-find "$BACKUP_DIR" -name "db_backup_*.sql" -mtime +30 -delete 2>/dev/null || true
-BACKUP_COUNT=$(ls -1 "$BACKUP_DIR"/db_backup_*.sql 2>/dev/null | wc -l)
+# 백업 검증: 임시 SQLite 복원 + integrity/foreign_key 검사 + 이전 백업과 행 수/체크섬 비교
+echo "[2/4] 백업 검증 중..."
+python3 verify_backup.py "$BACKUP_FILE" --store "$STORE_DIR" || {
+    echo "❌ 백업 검증 실패 - 덤프를 확인하세요: $BACKUP_FILE"
+    exit 1
+}
+
+# 중복 제거 저장소에 저장 (새 청크만 압축 저장, 검증 후 원본 .sql 삭제)
+echo "[3/4] 증분 백업 저장 및 오래된 백업 정리..."
+python3 backup_store.py --store "$STORE_DIR" add "$BACKUP_FILE" --delete-source || {
+    echo "❌ 백업 저장소 기록 실패 (원본 유지: $BACKUP_FILE)"
+    exit 1
+}
+python3 backup_store.py --store "$STORE_DIR" prune --keep-days $KEEP_DAYS
+# 저장소 도입 전의 전체 덤프 파일 정리 (30일 이상)
+find "$BACKUP_DIR" -maxdepth 1 -name "db_backup_*.sql" -mtime +30 -delete 2>/dev/null || true
+BACKUP_COUNT=$(ls -1 "$STORE_DIR"/manifests/*.json 2>/dev/null | wc -l)
 echo "✓ 현재 백업 개수: $BACKUP_COUNT"
 
 # Time Travel 북마크 저장
-echo "[3/3] Time Travel 북마크 저장..."
+echo "[4/4] Time Travel 북마크 저장..."
 npx wrangler d1 time-travel info review-spheres-v1-production > "$BACKUP_DIR/bookmark_$DATE.txt" 2>&1
 echo "✓ 북마크 저장 완료"
 
@@ -47,6 +64,7 @@ echo ""
 echo "================================"
 echo "✅ 백업 완료!"
 echo "================================"
-echo "백업 파일: $BACKUP_FILE"
+echo "백업 이름: $BACKUP_NAME (저장소: $STORE_DIR)"
 echo "복구 방법:"
+echo "  python3 backup_store.py --store $STORE_DIR restore $BACKUP_NAME -o $BACKUP_FILE"
 echo "  npx wrangler d1 execute review-spheres-v1-production --remote --file=$BACKUP_FILE"
@@ -0,0 +1,254 @@
+#!/usr/bin/env node
+//
+// D1/R2 bridge for the Python tools (d1_client.py)
+// 한 번 띄워두고 stdin/stdout 으로 JSON 요청을 주고받는 상주 프로세스
+//
+// Protocol: one JSON object per line
+//   request:  {"id": 1, "op": "query", "sql": "...", "params": [...]}
+//             {"id": 2, "op": "batch", "statements": [{"sql": "...", "params": [...]}]}
+//             {"id": 3, "op": "r2_put", "key": "13.jpg", "file": "/tmp/x.jpg", "content_type": "image/jpeg"}
+//             {"id": 4, "op": "r2_get", "key": "13.jpg", "file": "/tmp/x.jpg"}
+//             {"id": 5, "op": "r2_head", "key": "13.jpg"}
+//   response: {"id": 1, "ok": true, "results": [...], "meta": {...}}
+//             {"id": 1, "ok": false, "error": "..."}
+//
+// Requests are handled concurrently, so responses can come back out of order
+// (clients match them by id).
+//
+// Usage:
+//   node scripts/d1-bridge.mjs --local    # miniflare state in .wrangler/state/v3 (offline)
+//   node scripts/d1-bridge.mjs --remote   # Cloudflare REST API
+//                                         # (CLOUDFLARE_API_TOKEN, CLOUDFLARE_ACCOUNT_ID)
+//
+
+import { readFile, writeFile } from 'node:fs/promises';
+import { createInterface } from 'node:readline';
+
+const CONFIG_PATH = process.env.WRANGLER_CONFIG || 'wrangler.jsonc';
+const remote = process.argv.includes('--remote');
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+// wrangler.jsonc → plain JSON (comments and trailing commas removed)
+async function readWranglerConfig() {
+  const text = await readFile(CONFIG_PATH, 'utf-8');
+  const json = text
+    .replace(/("(?:[^"\\]|\\.)*")|\/\/[^\n]*|\/\*[\s\S]*?\*\//g, (m, str) => str || '')
+    .replace(/,(\s*[}\]])/g, '$1');
+  return JSON.parse(json);
+}
+
+// Local backend: the same miniflare bindings `wrangler --local` uses
+async function createLocalBackend() {
+  const { getPlatformProxy } = await import('wrangler');
+  const proxy = await getPlatformProxy({ configPath: CONFIG_PATH, persist: true });
+  const { DB, R2 } = proxy.env;
+
+  return {
+    async query(sql, params = []) {
+      const result = await DB.prepare(sql).bind(...params).all();
+      return { results: result.results, meta: result.meta };
+    },
+    async batch(statements) {
+      const results = await DB.batch(statements.map(s => DB.prepare(s.sql).bind(...(s.params || []))));
+      return { results: results.map(r => ({ results: r.results, meta: r.meta })) };
+    },
+    async r2Put(key, body, contentType) {
+      const object = await R2.put(key, body, { httpMetadata: { contentType } });
+      return { results: [{ key: object.key, size: object.size, etag: object.etag }] };
+    },
+    async r2Get(key) {
+      const object = await R2.get(key);
+      if (!object) return null;
+      return {
+        body: Buffer.from(await object.arrayBuffer()),
+        contentType: object.httpMetadata?.contentType,
+        etag: object.etag
+      };
+    },
+    async r2Head(key) {
+      const object = await R2.head(key);
+      return object && { size: object.size, etag: object.etag };
+    },
+    async close() {
+      await proxy.dispose();
+    }
+  };
+}
+
+// SQL literal for one bound value (JSON params: null, boolean, number, string)
+function sqlLiteral(value) {
+  if (value === null || value === undefined) return 'NULL';
+  if (typeof value === 'boolean') return value ? '1' : '0';
+  if (typeof value === 'number') {
+    if (!Number.isFinite(value)) throw new Error(`Cannot bind non-finite number: ${value}`);
+    return String(value);
+  }
+  if (typeof value === 'string') return `'${value.replace(/'/g, "''")}'`;
+  throw new Error(`Cannot bind ${typeof value} parameter`);
+}
+
+// Replace ? / ?NNN placeholders with literals, skipping quoted text and comments
+// (numbering follows SQLite: a bare ? is one more than the largest index so far)
+function inlineParams(sql, params = []) {
+  if (params.length === 0) return sql;
+  let largest = 0;
+  return sql.replace(
+    /'(?:[^']|'')*'|"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\]|--[^\n]*|\/\*[\s\S]*?(?:\*\/|$)|\?(\d*)/g,
+    (match, index) => {
+      if (index === undefined) return match;
+      const n = index ? Number(index) : largest + 1;
+      largest = Math.max(largest, n);
+      if (n < 1 || n > params.length) throw new Error(`No value for parameter ?${n}`);
+      return sqlLiteral(params[n - 1]);
+    }
+  );
+}
+
+// Remote backend: Cloudflare REST API (no wrangler process per call)
+async function createRemoteBackend() {
+  const config = await readWranglerConfig();
+  const token = process.env.CLOUDFLARE_API_TOKEN;
+  const accountId = process.env.CLOUDFLARE_ACCOUNT_ID;
+  if (!token || !accountId) {
+    throw new Error('CLOUDFLARE_API_TOKEN and CLOUDFLARE_ACCOUNT_ID are required for --remote');
+  }
+
+  const databaseId = process.env.D1_DATABASE_ID || config.d1_databases[0].database_id;
+  const bucket = process.env.R2_BUCKET || config.r2_buckets[0].bucket_name;
+  const base = `https://api.cloudflare.com/client/v4/accounts/${accountId}`;
+
+  async function api(path, init) {
+    const response = await fetch(`${base}${path}`, {
+      ...init,
+      headers: { Authorization: `Bearer ${token}`, ...(init.headers || {}) }
+    });
+    const data = await response.json();
+    if (!response.ok || !data.success) {
+      const message = (data.errors || []).map(e => e.message).join('; ') || response.statusText;
+      throw new Error(`Cloudflare API ${response.status}: ${message}`);
+    }
+    return data.result;
+  }
+
+  async function d1(sql, params) {
+    return api(`/d1/database/${databaseId}/query`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ sql, params })
+    });
+  }
+
+  return {
+    async query(sql, params = []) {
+      const [result] = await d1(sql, params);
+      return { results: result.results, meta: result.meta };
+    },
+    async batch(statements) {
+      // One request, so D1 runs the statements as one atomic batch like DB.batch();
+      // the REST API binds params for a single statement only, so they are inlined
+      const sql = statements.map(s => inlineParams(s.sql, s.params || []).replace(/;\s*$/, '')).join(';\n');
+      const results = await d1(sql, []);
+      return { results: results.map(r => ({ results: r.results, meta: r.meta })) };
+    },
+    async r2Put(key, body, contentType) {
+      const object = await api(`/r2/buckets/${bucket}/objects/${encodeURIComponent(key)}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': contentType },
+        body
+      });
+      return { results: [{ key, size: body.length, etag: object && object.etag }] };
+    },
+    async r2Get(key) {
+      // Object bodies are raw bytes, not the usual JSON envelope
+      const response = await fetch(`${base}/r2/buckets/${bucket}/objects/${encodeURIComponent(key)}`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      if (response.status === 404) return null;
+      if (!response.ok) throw new Error(`Cloudflare API ${response.status}: ${response.statusText}`);
+      return {
+        body: Buffer.from(await response.arrayBuffer()),
+        contentType: response.headers.get('content-type'),
+        etag: response.headers.get('etag')
+      };
+    },
+    async r2Head(key) {
+      const response = await fetch(`${base}/r2/buckets/${bucket}/objects/${encodeURIComponent(key)}`, {
+        method: 'HEAD',
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      if (response.status === 404) return null;
+      if (!response.ok) throw new Error(`Cloudflare API ${response.status}: ${response.statusText}`);
+      return {
+        size: Number(response.headers.get('content-length')),
+        // HTTP etags are quoted, the put result's etag is not
+        etag: (response.headers.get('etag') || '').replace(/^(?:W\/)?"|"$/g, '') || null
+      };
+    },
+    async close() {}
+  };
+}
+
+async function handle(backend, request) {
+  switch (request.op) {
+    case 'query':
+      return backend.query(request.sql, request.params);
+    case 'batch':
+      return backend.batch(request.statements);
+    case 'r2_put': {
+      const body = await readFile(request.file);
+      return backend.r2Put(request.key, body, request.content_type || 'application/octet-stream');
+    }
+    case 'r2_get': {
+      const object = await backend.r2Get(request.key);
+      if (!object) return { results: [] };
+      await writeFile(request.file, object.body);
+      return { results: [{ key: request.key, size: object.body.length, content_type: object.contentType, etag: object.etag }] };
+    }
+    case 'r2_head': {
+      const object = await backend.r2Head(request.key);
+      return { results: object ? [{ key: request.key, size: object.size, etag: object.etag }] : [] };
+    }
+    case 'ping':
+      return { results: [] };
+    default:
+      throw new Error(`Unknown op: ${request.op}`);
+  }
+}
+
+async function main() {
+  const backend = remote ? await createRemoteBackend() : await createLocalBackend();
+  send({ id: 0, ok: true, ready: true, mode: remote ? 'remote' : 'local' });
+
+  const pending = new Set();
+  const lines = createInterface({ input: process.stdin });
+
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (e) {
+      send({ id: null, ok: false, error: `Invalid JSON: ${e.message}` });
+      continue;
+    }
+
+    const task = handle(backend, request)
+      .then(result => send({ id: request.id, ok: true, ...result }))
+      .catch(e => send({ id: request.id, ok: false, error: String(e && e.message || e) }))
+      .finally(() => pending.delete(task));
+    pending.add(task);
+  }
+
+  // stdin closed: finish in-flight requests, then shut down
+  await Promise.all(pending);
+  await backend.close();
+}
+
+main().catch(e => {
+  send({ id: 0, ok: false, error: String(e && e.message || e) });
+  process.exit(1);
+});
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+SQL 파일 분할 + 테이블별 병렬 적용
+
+Cuts a SQL file (prod-to-local-sync.sql, update_campaign_thumbnails.sql,
+backups, ...) into chunks that end on statement boundaries and stay under
+a byte and statement budget, then applies them through the D1 bridge
+instead of one all-or-nothing `wrangler d1 execute --file`:
+
+  - data statements (INSERT/UPDATE/DELETE) are grouped into chunks per table
+  - DDL and other statements act as barriers and run in file order
+  - tables are applied concurrently once the tables they reference
+    (foreign keys, from migrations/) are done; a table's own chunks stay
+    in order
+  - each chunk is one D1 batch, retried on its own with backoff; chunks
+    that still fail are written to <out>/failed/ for a targeted reapply,
+    and tables depending on them are skipped
+  - leading PRAGMA statements (e.g. defer_foreign_keys) are repeated at
+    the start of every chunk
+  - with --rebuild-derived, trigger-maintained data (derived_data.py) is
+    recomputed in one batch at the end. Use it for copies of whole tables
+    (e.g. prod-to-local-sync.sql): the triggers count the applied rows on
+    top of the copied counter values. Small edits such as
+    update_campaign_thumbnails.sql do not need it; the full-table rebuild
+    is not run implicitly
+
+Usage:
+  python3 split_dump.py update_campaign_thumbnails.sql            # production
+  python3 split_dump.py prod-to-local-sync.sql --local --workers 4 --rebuild-derived
+  python3 split_dump.py big.sql --plan --out chunks/              # 분할만
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from collections import namedtuple
+import threading
+import argparse
+import tempfile
+import shutil
+import time
+import sys
+import os
+import re
+
+from d1_client import get_client
+from d1_sync import schema_from_migrations
+from derived_data import SOURCE_TABLES, rebuild_statements
+from r2_migrate import UPLOAD_RETRIES, with_retry
+from sql_dump import iter_statements, open_dump, statement_table
+
+# D1 rejects statements over 100 KB, and the remote bridge sends a whole
+# chunk as one query request; keep each chunk under that
+D1_MAX_STATEMENT_BYTES = 100 * 1024
+CHUNK_MAX_BYTES = 90 * 1024
+CHUNK_MAX_STATEMENTS = 100
+APPLY_WORKERS = 4
+
+_DATA = re.compile(r'(?:INSERT|REPLACE|UPDATE|DELETE)\b', re.I)
+_PRAGMA = re.compile(r'PRAGMA\b', re.I)
+_TRANSACTION = re.compile(r'(?:BEGIN|COMMIT|END|ROLLBACK)\b', re.I)
+
+# A chunk file on disk; table is None for barrier (DDL/other) chunks
+Chunk = namedtuple('Chunk', ['segment', 'table', 'path', 'statements', 'bytes'])
+
+class ChunkWriter:
+    """Accumulates statements for one table and flushes them to chunk files"""
+
+    def __init__(self, out_dir, segment, table, prelude, max_bytes, max_statements, chunks):
+        self.out_dir = out_dir
+        self.segment = segment
+        self.table = table
+        self.prelude = prelude
+        self.max_bytes = max_bytes
+        self.max_statements = max_statements
+        self.chunks = chunks
+        self.pending = []
+        self.size = 0
+
+    def add(self, sql):
+        size = len(sql.encode('utf-8')) + 1
+        if self.pending and (len(self.pending) >= self.max_statements or self.size + size > self.max_bytes):
+            self.flush()
+        self.pending.append(sql)
+        self.size += size
+
+    def flush(self):
+        if not self.pending:
+            return
+        name = f"{self.segment:03d}_{len(self.chunks):05d}_{self.table or '_barrier'}.sql"
+        path = os.path.join(self.out_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            for sql in self.prelude + self.pending:
+                f.write(sql + "\n")
+        self.chunks.append(Chunk(self.segment, self.table, path, len(self.pending), self.size))
+        self.pending = []
+        self.size = 0
+
+def split(path, out_dir, max_bytes=CHUNK_MAX_BYTES, max_statements=CHUNK_MAX_STATEMENTS):
+    """Stream a SQL file into chunk files under out_dir, return [Chunk] in apply order"""
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = []
+    prelude = []
+    segment = 0
+    writers = {}
+    oversized = 0
+
+    def close_segment():
+        for writer in writers.values():
+            writer.flush()
+        writers.clear()
+
+    with open_dump(path) as f:
+        for sql in iter_statements(f):
+            if _TRANSACTION.match(sql):
+                # Each chunk is its own D1 batch (= transaction)
+                continue
+            if _PRAGMA.match(sql) and not chunks and not writers:
+                prelude.append(sql)
+                continue
+            if len(sql.encode('utf-8')) > D1_MAX_STATEMENT_BYTES:
+                oversized += 1
+
+            table = statement_table(sql) if _DATA.match(sql) else None
+            if table is None:
+                # Barrier: everything before it is applied first, in order
+                if None not in writers:
+                    close_segment()
+                    segment += 1
+                    writers[None] = ChunkWriter(out_dir, segment, None, prelude, max_bytes,
+                                                max_statements, chunks)
+                writers[None].add(sql)
+                continue
+
+            if None in writers:
+                close_segment()
+                segment += 1
+            writer = writers.get(table)
+            if writer is None:
+                writer = writers[table] = ChunkWriter(out_dir, segment, table, prelude, max_bytes,
+                                                      max_statements, chunks)
+            writer.add(sql)
+
+    close_segment()
+    if oversized:
+        print(f"⚠️  D1 구문 크기 제한(100KB)을 넘는 구문 {oversized}개 - 해당 청크는 실패할 수 있습니다")
+    return chunks
+
+def apply_chunk(client, chunk, retries=UPLOAD_RETRIES):
+    with open(chunk.path, encoding='utf-8') as f:
+        statements = [(sql, []) for sql in iter_statements(f)]
+    with_retry(lambda: client.batch(statements), os.path.basename(chunk.path), retries)
+
+def apply_chunks(chunks, client, workers=APPLY_WORKERS, retries=UPLOAD_RETRIES, failed_dir=None):
+    """Apply chunks segment by segment, tables in parallel; return (applied, failed, skipped) chunk counts"""
+    deps = schema_from_migrations()
+    counts = {'applied': 0, 'failed': 0, 'skipped': 0}
+    lock = threading.Lock()
+
+    def count(key, n=1):
+        with lock:
+            counts[key] += n
+
+    def fail(chunk, error):
+        count('failed')
+        print(f"   ❌ {os.path.basename(chunk.path)}: {error}")
+        if failed_dir:
+            os.makedirs(failed_dir, exist_ok=True)
+            shutil.copy(chunk.path, failed_dir)
+
+    def run_table(table_chunks):
+        """Apply one table's chunks in order; stop at the first failure"""
+        for i, chunk in enumerate(table_chunks):
+            try:
+                apply_chunk(client, chunk, retries)
+            except Exception as e:
+                fail(chunk, e)
+                for rest in table_chunks[i + 1:]:
+                    count('skipped')
+                    if failed_dir:
+                        shutil.copy(rest.path, failed_dir)
+                return False
+            count('applied')
+            print(f"   ✅ {os.path.basename(chunk.path)} ({chunk.statements}개 구문, {chunk.bytes:,} bytes)")
+        return True
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for segment in sorted({chunk.segment for chunk in chunks}):
+            by_table = {}
+            for chunk in chunks:
+                if chunk.segment == segment:
+                    by_table.setdefault(chunk.table, []).append(chunk)
+
+            if None in by_table:
+                # Barrier segment: strictly in file order
+                if not run_table(by_table.pop(None)):
+                    later = [chunk for chunk in chunks if chunk.segment > segment]
+                    count('skipped', len(later))
+                    for chunk in later:
+                        if failed_dir:
+                            shutil.copy(chunk.path, failed_dir)
+                    print("   ⛔ 이후 청크는 건너뜀 (순서 의존 구문 실패)")
+                    break
+
+            waiting = {table: {ref for ref in deps.get(table, ()) if ref in by_table and ref != table}
+                       for table in by_table}
+            running = {}
+            broken = set()
+
+            while waiting or running:
+                ready = [t for t, refs in waiting.items() if not refs]
+                for table in ready:
+                    del waiting[table]
+                    running[pool.submit(run_table, by_table[table])] = table
+
+                if not running:
+                    # Everything left depends on a failed table
+                    for table in waiting:
+                        count('skipped', len(by_table[table]))
+                        for chunk in by_table[table]:
+                            if failed_dir:
+                                shutil.copy(chunk.path, failed_dir)
+                        print(f"   ⏭️  {table}: 참조 테이블 실패로 건너뜀")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table = running.pop(future)
+                    if not future.result():
+                        broken.add(table)
+                    for other, refs in waiting.items():
+                        if table in refs and table not in broken:
+                            refs.discard(table)
+
+    return counts['applied'], counts['failed'], counts['skipped']
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQL 파일 분할 + 테이블별 병렬 적용")
+    parser.add_argument('file', help=".sql / .sql.gz 파일")
+    parser.add_argument('--max-bytes', type=int, default=CHUNK_MAX_BYTES, help="청크당 최대 바이트")
+    parser.add_argument('--max-statements', type=int, default=CHUNK_MAX_STATEMENTS, help="청크당 최대 구문 수")
+    parser.add_argument('--workers', type=int, default=APPLY_WORKERS)
+    parser.add_argument('--retries', type=int, default=UPLOAD_RETRIES)
+    parser.add_argument('--out', help="청크 파일을 남길 디렉터리 (기본: 임시 디렉터리)")
+    parser.add_argument('--plan', action='store_true', help="분할만 하고 적용하지 않음")
+    parser.add_argument('--local', action='store_true', help="로컬 miniflare D1 대상")
+    parser.add_argument('--rebuild-derived', action='store_true',
+                        help="적용 후 트리거 파생 데이터 전체 재계산 (테이블 전체 복사 시)")
+    args = parser.parse_args(argv)
+
+    out_dir = args.out or tempfile.mkdtemp(prefix='split-dump-')
+
+    started = time.time()
+    chunks = split(args.file, out_dir, args.max_bytes, args.max_statements)
+    tables = sorted({chunk.table for chunk in chunks if chunk.table})
+    print(f"✂️  {args.file}: 청크 {len(chunks)}개, 테이블 {len(tables)}개 → {out_dir}")
+
+    if args.plan:
+        for chunk in chunks:
+            print(f"   {os.path.basename(chunk.path)}: {chunk.statements}개 구문, {chunk.bytes:,} bytes")
+        return 0
+
+    target = "로컬" if args.local else "production"
+    print(f"🚀 {target} D1에 적용 (workers={args.workers})\n")
+    failed_dir = os.path.join(out_dir, 'failed')
+    client = get_client(not args.local)
+    applied, failed, skipped = apply_chunks(chunks, client, args.workers, args.retries, failed_dir)
+
+    derived_sources = SOURCE_TABLES.intersection(tables)
+    if applied and derived_sources and not args.rebuild_derived:
+        print(f"ℹ️  {', '.join(sorted(derived_sources))} 변경: 테이블 전체를 복사했다면 "
+              f"--rebuild-derived 또는 python3 derived_data.py 로 파생 데이터 재계산")
+    elif applied and derived_sources:
+        try:
+            client.batch([(sql, []) for sql in rebuild_statements()])
+            print(f"🔁 파생 데이터 재계산 ({', '.join(sorted(derived_sources))} 변경)")
+        except Exception as e:
+            print(f"❌ 파생 데이터 재계산 실패: {e} (python3 derived_data.py 로 다시 실행)")
+            failed += 1
+
+    print(f"\n📊 결과 ({time.time() - started:.1f}s): ✅ {applied}개 적용, ❌ {failed}개 실패, ⏭️  {skipped}개 건너뜀")
+    if failed or skipped:
+        print(f"   실패/건너뛴 청크: {failed_dir} (파일별로 다시 실행 가능)")
+        return 1
+    if not args.out:
+        shutil.rmtree(out_dir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
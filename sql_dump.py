@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for SQL dump files
+
+Shared by the dump tools (analyze_dump.py, ...). Handles the formats we
+produce or keep around:
+
+  - `wrangler d1 export` backups (backups/db_backup_*.sql):
+      INSERT INTO "t" VALUES(...); with replace('..','\\n',char(10)) for newlines
+  - d1_sync.py dumps (prod-to-local-sync.sql):
+      INSERT INTO t (a, b) VALUES (...), (...) [ON CONFLICT(id) DO UPDATE ...];
+  - hand-written UPDATE/DELETE scripts
+
+Statements are split on ';' outside string literals, quoted identifiers
+and comments (CREATE TRIGGER bodies are kept whole), reading the file in
+fixed-size chunks, so memory is bounded by the largest single statement.
+INSERT values are evaluated by SQLite itself, so every literal form the
+dump uses (escapes, X'..' blobs, replace()/char() expressions) decodes
+exactly as it would on restore.
+
+Needs Python 3.11+: the statement splitter uses possessive quantifiers so
+a statement without a terminator cannot backtrack exponentially.
+"""
+
+from collections import namedtuple
+import sqlite3
+import gzip
+import sys
+import re
+
+if sys.version_info < (3, 11):
+    raise ImportError("sql_dump.py needs Python 3.11+ (possessive regex quantifiers)")
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Start of a string/identifier/comment, or a statement terminator
+_SPECIAL = re.compile(r"['\";`\[]|--|/\*")
+# Fast path: a whole statement with no comments or quoted identifiers
+_SIMPLE_STATEMENT = re.compile(r"""\s*+(?:[^'";`\[/-]++|'[^']*+'|"[^"]*+"|-(?!-)|/(?!\*))*+;""")
+_CLOSERS = {"'": "'", '"': '"', '`': '`', '[': ']', '--': '\n', '/*': '*/'}
+_LEADING_COMMENTS = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)+", re.S)
+
+_IDENTIFIER = r'"(?:[^"]|"")+"|`[^`]+`|\[[^\]]+\]|[\w.]+'
+_INSERT = re.compile(
+    r'(?:INSERT\s+(?:OR\s+\w+\s+)?|REPLACE\s+)INTO\s+(' + _IDENTIFIER + r')\s*'
+    r'(?:\(([^)]*)\)\s*)?VALUES\s*', re.I
+)
+_TABLE_PATTERNS = [
+    re.compile(r'(?:INSERT\s+(?:OR\s+\w+\s+)?|REPLACE\s+)INTO\s+(' + _IDENTIFIER + ')', re.I),
+    re.compile(r'UPDATE\s+(?:OR\s+\w+\s+)?(' + _IDENTIFIER + ')', re.I),
+    re.compile(r'DELETE\s+FROM\s+(' + _IDENTIFIER + ')', re.I),
+    re.compile(r'CREATE\s+(?:TEMP\w*\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(' + _IDENTIFIER + ')', re.I),
+    re.compile(r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:' + _IDENTIFIER
+               + r')\s+ON\s+(' + _IDENTIFIER + ')', re.I),
+]
+
+Insert = namedtuple('Insert', ['table', 'columns', 'values_sql'])
+
+def open_dump(path):
+    """Open a .sql or .sql.gz dump as text"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+def strip_leading_comments(sql):
+    return _LEADING_COMMENTS.sub('', sql, count=1)
+
+def iter_statements(f, chunk_size=READ_CHUNK_SIZE):
+    """Yield complete statements (with their trailing ';') from a text file object"""
+    buf = ''
+    start = 0   # start of the current statement in buf
+    pos = start
+    closer = None
+
+    while True:
+        while pos < len(buf):
+            if closer is None and pos == start:
+                match = _SIMPLE_STATEMENT.match(buf, pos)
+                if match and sqlite3.complete_statement(match.group()):
+                    statement = match.group().strip()
+                    if statement != ';':
+                        yield statement
+                    start = pos = match.end()
+                    continue
+            if closer is None:
+                match = _SPECIAL.search(buf, pos)
+                if not match:
+                    # Keep the last char: it may be the first half of '--' or '/*'
+                    pos = max(pos, len(buf) - 1)
+                    break
+                token = match.group()
+                pos = match.end()
+                if token != ';':
+                    closer = _CLOSERS[token]
+                    continue
+                statement = buf[start:pos]
+                # Semicolons inside CREATE TRIGGER ... END do not end the statement
+                if sqlite3.complete_statement(statement):
+                    statement = strip_leading_comments(statement).strip()
+                    if statement != ';':
+                        yield statement
+                    start = pos
+            else:
+                end = buf.find(closer, pos)
+                if end == -1:
+                    # The closer may straddle the chunk boundary
+                    pos = max(pos, len(buf) - len(closer) + 1)
+                    break
+                pos = end + len(closer)
+                closer = None
+
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buf = buf[start:] + chunk
+        pos -= start
+        start = 0
+
+    statement = strip_leading_comments(buf[start:]).strip()
+    if statement:
+        yield statement
+
+def unquote_identifier(name):
+    if name[0] == '"' and name[-1] == '"':
+        return name[1:-1].replace('""', '"')
+    if name[0] in '`[' and name[-1] in '`]':
+        return name[1:-1]
+    return name
+
+def statement_table(sql):
+    """Table an INSERT/UPDATE/DELETE/CREATE TABLE/CREATE INDEX statement touches (None otherwise)"""
+    for pattern in _TABLE_PATTERNS:
+        match = pattern.match(sql)
+        if match:
+            return unquote_identifier(match.group(1))
+    return None
+
+_IN_TUPLE_SPECIAL = re.compile(r"['\"`\[()]")
+_BETWEEN_TUPLES = re.compile(r"[^\s,]")
+
+def _end_of_values(sql, start):
+    """Index just past the VALUES tuple list that starts at sql[start]"""
+    depth = 0
+    pos = start
+
+    while True:
+        if depth == 0:
+            # Between tuples: anything but '(' (ON CONFLICT, RETURNING, ';') ends the list
+            match = _BETWEEN_TUPLES.search(sql, pos)
+            if not match or match.group() != '(':
+                return pos
+            depth = 1
+            pos = match.end()
+            continue
+
+        match = _IN_TUPLE_SPECIAL.search(sql, pos)
+        if not match:
+            return len(sql)
+        token = match.group()
+        pos = match.end()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        else:
+            end = sql.find(_CLOSERS[token], pos)
+            if end == -1:
+                return len(sql)
+            pos = end + 1
+
+def parse_insert(sql):
+    """INSERT statement → Insert(table, columns or None, values_sql) (None if not an INSERT)"""
+    match = _INSERT.match(sql)
+    if not match:
+        return None
+    table = unquote_identifier(match.group(1))
+    columns = None
+    if match.group(2):
+        columns = [unquote_identifier(col.strip()) for col in match.group(2).split(',')]
+    values_sql = sql[match.end():_end_of_values(sql, match.end())]
+    return Insert(table, columns, values_sql)
+
+class DumpSchema:
+    """In-memory SQLite that learns table layouts from the dump's CREATE TABLEs
+
+    Also evaluates INSERT value lists, so literal decoding matches SQLite.
+    """
+
+    def __init__(self):
+        self.conn = sqlite3.connect(':memory:')
+        self._columns = {}
+
+    def observe(self, sql):
+        """Feed a statement; CREATE TABLEs are applied so their columns are known"""
+        if re.match(r'CREATE\s+(?:TEMP\w*\s+)?TABLE', sql, re.I):
+            table = statement_table(sql)
+            if table.startswith('sqlite_'):
+                return
+            try:
+                self.conn.execute(sql)
+            except sqlite3.Error:
+                return
+            self._columns.pop(table, None)
+
+    def columns(self, table):
+        if table not in self._columns:
+            rows = self.conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+            self._columns[table] = [row[1] for row in rows] or None
+        return self._columns[table]
+
+    def rows(self, insert):
+        """Evaluate an Insert's VALUES list, return (columns, rows)"""
+        rows = self.conn.execute("VALUES " + insert.values_sql).fetchall()
+        columns = insert.columns or self.columns(insert.table)
+        if not columns or (rows and len(columns) != len(rows[0])):
+            columns = [f"col{i + 1}" for i in range(len(rows[0]) if rows else 0)]
+        return columns, rows
+
+def iter_dump_rows(path, schema=None):
+    """Yield (table, columns, row) for every INSERTed row in a dump"""
+    schema = schema or DumpSchema()
+    with open_dump(path) as f:
+        for sql in iter_statements(f):
+            insert = parse_insert(sql)
+            if insert is None:
+                schema.observe(sql)
+                continue
+            columns, rows = schema.rows(insert)
+            for row in rows:
+                yield insert.table, columns, row
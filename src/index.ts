@@ -22,6 +22,8 @@ type Bindings = {
   DB: D1Database;
   R2: R2Bucket;
   RESEND_API_KEY: string;
+  // '1' = 방문 기록을 isolate당 하루 한 번으로 줄임 (middleware/visitor.ts, 기본 꺼짐)
+  VISITOR_DEDUP?: string;
 };
 
 type Variables = {
@@ -85,7 +87,25 @@ app.get('/sitemap.xml', (c) => {
   });
 });
 
+// 썸네일 변형 이미지 너비 (build_image_variants.py VARIANT_WIDTHS 와 동일해야 함)
+const IMAGE_VARIANT_WIDTHS = [480, 1024, 1200];
+
+// Accept / ?w= 에 맞는 변형 이미지 키 후보 (선호 순서), 없으면 원본
+function imageVariantKeys(path: string, accept: string, width: number): string[] {
+  if (!width || path.startsWith('variants/')) return [];
+
+  // 요청 너비 이상인 가장 작은 변형 (없으면 가장 큰 변형)
+  const variantWidth = IMAGE_VARIANT_WIDTHS.find(w => w >= width) ?? IMAGE_VARIANT_WIDTHS[IMAGE_VARIANT_WIDTHS.length - 1];
+  const stem = path.replace(/\.[^./]+$/, '');
+
+  const keys: string[] = [];
+  if (accept.includes('image/avif')) keys.push(`variants/${stem}/${variantWidth}.avif`);
+  if (accept.includes('image/webp')) keys.push(`variants/${stem}/${variantWidth}.webp`);
+  return keys;
+}
+
 // R2 이미지 제공 API (와일드카드 경로 지원)
+// ?w=480 처럼 너비를 주면 Accept 에 맞춰 AVIF/WebP 변형 이미지를 제공
 app.get('/api/images/*', async (c) => {
   try {
     // /api/images/ 이후의 전체 경로를 가져오기
@@ -94,9 +114,19 @@ app.get('/api/images/*', async (c) => {
     if (!path) {
       return c.notFound();
     }
-    
-    // R2에서 이미지 가져오기
-    const object = await c.env.R2.get(path);
+
+    const width = parseInt(c.req.query('w') || '0', 10) || 0;
+    const variantKeys = imageVariantKeys(path, c.req.header('Accept') || '', width);
+
+    // R2에서 이미지 가져오기 (변형 이미지가 아직 없으면 원본)
+    let object: R2ObjectBody | null = null;
+    for (const key of variantKeys) {
+      object = await c.env.R2.get(key);
+      if (object) break;
+    }
+    if (!object) {
+      object = await c.env.R2.get(path);
+    }
     
     if (!object) {
       console.error('R2 image not found:', path);
@@ -104,13 +134,16 @@ app.get('/api/images/*', async (c) => {
     }
 
     // 이미지를 응답으로 반환 (캐시 활성화)
-    return new Response(object.body, {
-      headers: {
-        'Content-Type': object.httpMetadata?.contentType || 'image/jpeg',
-        'Cache-Control': 'public, max-age=31536000, immutable', // 1년 캐시
-        'ETag': object.etag || '',
-      }
-    });
+    const headers: Record<string, string> = {
+      'Content-Type': object.httpMetadata?.contentType || 'image/jpeg',
+      'Cache-Control': 'public, max-age=31536000, immutable', // 1년 캐시
+      'ETag': object.etag || '',
+    };
+    if (variantKeys.length > 0) {
+      // Accept 에 따라 응답이 달라지므로 캐시 키에 포함
+      headers['Vary'] = 'Accept';
+    }
+    return new Response(object.body, { headers });
   } catch (error) {
     console.error('R2 image fetch error:', error);
     return c.json({ error: '이미지를 불러올 수 없습니다' }, 500);
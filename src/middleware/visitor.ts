@@ -1,35 +1,121 @@
 // Visitor tracking middleware
+// 요청마다 INSERT 하지 않고 isolate 안에서 모았다가 여러 행을 한 번에 기록
+// - 응답 경로에서 DB를 기다리지 않음 (executionCtx.waitUntil)
+// - 요청 1건 = visitor_logs 1행 (daily_stats.page_views 가 페이지뷰 수를 유지, 0107)
+// - VISITOR_DEDUP=1 이면 같은 날 같은 IP/사용자는 isolate당 한 번만 기록
+//   → visitor_logs / page_views 는 페이지뷰가 아니라 (isolate별) 방문 수가 됨, 기본은 꺼짐
 import { Context, Next } from 'hono';
 
+type VisitorHit = [userId: number | null, ip: string, userAgent: string, visitedAt: string];
+
+// D1 바인딩별 버퍼: 모은 행은 그 행을 받은 바인딩으로만 기록
+type VisitorBuffer = {
+  rows: VisitorHit[];
+  scheduledFlush: Promise<void> | null;
+  seenDay: string;
+  seen: Set<string>;
+};
+
+// 한 INSERT에 담는 최대 행 수 (D1 바인딩 파라미터 100개 제한 / 4컬럼)
+const FLUSH_MAX_ROWS = 25;
+// 첫 요청 이후 이 시간 동안 들어온 방문을 모아서 기록
+const FLUSH_DELAY_MS = 2000;
+// 중복 제거 키 최대 개수 (초과하면 비움)
+const SEEN_MAX_KEYS = 10000;
+
+const buffers = new WeakMap<D1Database, VisitorBuffer>();
+
+function bufferFor(db: D1Database): VisitorBuffer {
+  let buffer = buffers.get(db);
+  if (!buffer) {
+    buffer = { rows: [], scheduledFlush: null, seenDay: '', seen: new Set() };
+    buffers.set(db, buffer);
+  }
+  return buffer;
+}
+
+async function flush(db: D1Database, buffer: VisitorBuffer): Promise<void> {
+  while (buffer.rows.length > 0) {
+    const rows = buffer.rows.splice(0, FLUSH_MAX_ROWS);
+    try {
+      await db.prepare(
+        `INSERT INTO visitor_logs (user_id, ip_address, user_agent, visited_at) VALUES ${rows.map(() => '(?, ?, ?, ?)').join(', ')}`
+      ).bind(...rows.flat()).run();
+    } catch (e) {
+      // Ignore errors if table doesn't exist yet
+      console.log('Visitor log error (table may not exist):', e);
+    }
+  }
+}
+
+// 대기 중인 flush가 있으면 그 Promise를 공유 → 모든 요청의 waitUntil이 같은 기록을 기다림
+function scheduleFlush(db: D1Database, buffer: VisitorBuffer): Promise<void> {
+  if (buffer.rows.length >= FLUSH_MAX_ROWS) {
+    return flush(db, buffer);
+  }
+  if (!buffer.scheduledFlush) {
+    buffer.scheduledFlush = new Promise<void>((resolve) => setTimeout(resolve, FLUSH_DELAY_MS)).then(() => {
+      buffer.scheduledFlush = null;
+      return flush(db, buffer);
+    });
+  }
+  return buffer.scheduledFlush;
+}
+
+// 오늘(한국 시간) 이미 기록한 방문자인지 확인 (VISITOR_DEDUP)
+function alreadySeen(buffer: VisitorBuffer, ip: string, userId: number | null, visitedAt: string): boolean {
+  const day = new Date(new Date(visitedAt).getTime() + (9 * 60 * 60 * 1000)).toISOString().split('T')[0];
+  if (day !== buffer.seenDay || buffer.seen.size >= SEEN_MAX_KEYS) {
+    buffer.seenDay = day;
+    buffer.seen = new Set();
+  }
+  const key = `${ip}|${userId ?? ''}`;
+  if (buffer.seen.has(key)) {
+    return true;
+  }
+  buffer.seen.add(key);
+  return false;
+}
+
 export async function visitorLogger(c: Context, next: Next) {
   try {
-    const { env } = c as any;
-    
+    const db: D1Database = c.env.DB;
+    const buffer = bufferFor(db);
+
     // Get IP address
-    const ip = c.req.header('cf-connecting-ip') || 
-               c.req.header('x-forwarded-for') || 
-               c.req.header('x-real-ip') || 
+    const ip = c.req.header('cf-connecting-ip') ||
+               c.req.header('x-forwarded-for') ||
+               c.req.header('x-real-ip') ||
                'unknown';
-    
+
     // Get user agent
     const userAgent = c.req.header('user-agent') || 'unknown';
-    
+
     // Get user ID if authenticated
     const user = c.get('user');
     const userId = user?.userId || null;
-    
-    // Log visitor (don't wait for response)
-    try {
-      await env.DB.prepare(
-        'INSERT INTO visitor_logs (user_id, ip_address, user_agent, visited_at) VALUES (?, ?, ?, ?)'
-      ).bind(userId, ip, userAgent, new Date().toISOString()).run();
-    } catch (e) {
-      // Ignore errors if table doesn't exist yet
-      console.log('Visitor log error (table may not exist):', e);
+
+    const visitedAt = new Date().toISOString();
+    const dedup = c.env.VISITOR_DEDUP === '1';
+    if (!dedup || !alreadySeen(buffer, ip, userId, visitedAt)) {
+      buffer.rows.push([userId, ip, userAgent, visitedAt]);
+
+      // Log visitor (don't wait for response)
+      let ctx: ExecutionContext | null = null;
+      try {
+        ctx = c.executionCtx;
+      } catch (e) {
+        // executionCtx가 없는 환경 (로컬 테스트 등)
+      }
+      if (ctx) {
+        ctx.waitUntil(scheduleFlush(db, buffer));
+      } else {
+        await flush(db, buffer);
+      }
     }
   } catch (error) {
     console.error('Visitor logger error:', error);
   }
-  
+
   await next();
 }
@@ -272,61 +272,42 @@ admin.put('/reviews/:id/best', async (c) => {
 });
 
 // 통계 조회
+// daily_stats 롤업(트리거로 누적, 0107)만 읽으므로 visitor_logs가 커져도 일정한 비용
+// visitor_logs 보관 기간 정리는 purge_visitor_logs.py (스케줄 작업)
 admin.get('/stats', async (c) => {
   try {
     const { env } = c;
     
     // 오늘 날짜 (한국 시간 기준 KST, UTC+9)
-    const now = new Date();
-    const kstOffset = 9 * 60 * 60 * 1000; // 9 hours in milliseconds
-    const kstNow = new Date(now.getTime() + kstOffset);
-    
-    // 한국 시간 기준 오늘 00:00:00
-    const kstToday = new Date(kstNow);
-    kstToday.setUTCHours(0, 0, 0, 0);
-    
-    // UTC로 변환 (한국 시간 00:00:00 = UTC 전날 15:00:00)
-    const todayStr = new Date(kstToday.getTime() - kstOffset).toISOString();
-    
-    // 오늘 방문자 수 (visitor_logs 테이블이 없으면 0 반환)
-    let todayVisitors = 0;
-    try {
-      // 30일 이상 된 로그 삭제 (DB 용량 관리)
-      const thirtyDaysAgo = new Date();
-      thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
-      await env.DB.prepare(
-        `DELETE FROM visitor_logs WHERE visited_at < ?`
-      ).bind(thirtyDaysAgo.toISOString()).run();
-      
-      // 오늘 방문자 수 조회
-      const visitorsResult = await env.DB.prepare(
-        `SELECT COUNT(DISTINCT ip_address) as count 
-         FROM visitor_logs 
-         WHERE visited_at >= ?`
-      ).bind(todayStr).first();
-      todayVisitors = visitorsResult?.count || 0;
-    } catch (e) {
-      console.log('Visitor logs table not found, returning 0');
-    }
-    
-    // 전체 통계
-    const totalUsers = await env.DB.prepare('SELECT COUNT(*) as count FROM users').first();
-    const totalCampaigns = await env.DB.prepare('SELECT COUNT(*) as count FROM campaigns').first();
-    // 현재 모집 중인 캠페인 = approved 상태 + 신청기간 내
-    const currentDate = new Date();
-    const koreaDate = new Date(currentDate.getTime() + (9 * 60 * 60 * 1000)).toISOString().split('T')[0];
-    const activeCampaigns = await env.DB.prepare(
-      `SELECT COUNT(*) as count FROM campaigns 
-       WHERE status = 'approved' 
-       AND application_start_date <= ? 
-       AND application_end_date >= ?`
-    ).bind(koreaDate, koreaDate).first();
+    const koreaDate = new Date(Date.now() + (9 * 60 * 60 * 1000)).toISOString().split('T')[0];
+    
+    // 한 번의 왕복으로 조회
+    const [visitors, totals, activeCampaigns] = await env.DB.batch([
+      // 오늘 순 방문자 수 (IP 기준)
+      env.DB.prepare('SELECT visitors FROM daily_stats WHERE day = ?').bind(koreaDate),
+      // 전체 회원/캠페인 수 = 일별 생성 수의 합
+      env.DB.prepare(
+        `SELECT COALESCE(SUM(new_users), 0) as users, COALESCE(SUM(new_campaigns), 0) as campaigns
+         FROM daily_stats`
+      ),
+      // 현재 모집 중인 캠페인 = approved 상태 + 신청기간 내
+      env.DB.prepare(
+        `SELECT COUNT(*) as count FROM campaigns 
+         WHERE status = 'approved' 
+         AND application_start_date <= ? 
+         AND application_end_date >= ?`
+      ).bind(koreaDate, koreaDate)
+    ]);
+    
+    const visitorsRow = visitors.results[0] as any;
+    const totalsRow = totals.results[0] as any;
+    const activeRow = activeCampaigns.results[0] as any;
     
     return c.json({
-      todayVisitors,
-      totalUsers: totalUsers?.count || 0,
-      totalCampaigns: totalCampaigns?.count || 0,
-      activeCampaigns: activeCampaigns?.count || 0
+      todayVisitors: visitorsRow?.visitors || 0,
+      totalUsers: totalsRow?.users || 0,
+      totalCampaigns: totalsRow?.campaigns || 0,
+      activeCampaigns: activeRow?.count || 0
     });
   } catch (error) {
     console.error('Get stats error:', error);
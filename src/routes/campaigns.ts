@@ -3,7 +3,7 @@
 import { Hono } from 'hono';
 import type { Campaign } from '../types';
 import { getCurrentDateTime, verifyJWT } from '../utils';
-import { getDisplayStatus, getKoreanDate } from '../utils/campaign-status';
+import { getDisplayStatus, getKoreanDate, refreshExpiredDisplayStatus } from '../utils/campaign-status';
 import { authMiddleware, requireRole } from '../middleware/auth';
 
 type Bindings = {
@@ -45,6 +45,20 @@ async function uploadImageToR2(r2: R2Bucket, imageData: string, filename: string
   }
 }
 
+// 원본 썸네일을 교체하면 변형 이미지(variants/{stem}/*.avif|webp, build_image_variants.py)도 삭제
+// 남겨두면 /api/images/*?w= 가 예전 이미지를 계속 제공함 → 다음 빌드 전까지는 원본으로 대체
+async function deleteImageVariants(r2: R2Bucket, filename: string): Promise<void> {
+  const prefix = `variants/${filename.replace(/\.[^./]+$/, '')}/`;
+  let cursor: string | undefined;
+  do {
+    const listed = await r2.list({ prefix, cursor });
+    if (listed.objects.length > 0) {
+      await r2.delete(listed.objects.map(object => object.key));
+    }
+    cursor = listed.truncated ? listed.cursor : undefined;
+  } while (cursor);
+}
+
 // 캠페인 등록 (광고주)
 campaigns.post('/', authMiddleware, requireRole('advertiser', 'agency', 'rep', 'admin'), async (c) => {
   try {
@@ -187,8 +201,7 @@ campaigns.get('/my', authMiddleware, requireRole('advertiser', 'agency', 'rep',
     const pointsFeeRate = (settings.points_fee_rate || 30) / 100;
     
     const campaigns = await env.DB.prepare(
-      `SELECT c.*, 
-       (SELECT COUNT(*) FROM applications WHERE campaign_id = c.id) as application_count
+      `SELECT c.*
        FROM campaigns c
        WHERE c.advertiser_id = ? 
        ORDER BY c.created_at DESC`
@@ -252,37 +265,127 @@ campaigns.get('/my', authMiddleware, requireRole('advertiser', 'agency', 'rep',
   }
 });
 
+// 목록 페이지 크기 (limit 파라미터)
+const LIST_DEFAULT_LIMIT = 24;
+const LIST_MAX_LIMIT = 50;
+
+// 목록 카드에 필요한 컬럼만 조회 (설명은 카드에 2줄만 보이므로 잘라서 전송)
+const LIST_CARD_COLUMNS = `c.id, c.title, substr(c.description, 1, 120) as description, c.thumbnail_image,
+  c.status, c.pricing_type, c.channel_type, c.slots,
+  c.sphere_points, c.point_reward, c.product_value,
+  c.application_end_date, c.result_announcement_date,
+  c.application_count, c.display_status, c.sort_rank, c.created_at`;
+
+// display_status 필터 (campaigns.display_status, 0106)
+const DISPLAY_STATUSES = ['pending', 'recruiting', 'in_progress', 'approved', 'suspended', 'completed', 'cancelled'];
+
+// 커서: 마지막 행의 정렬 키 [sort_rank, created_at, id]를 base64url JSON으로 인코딩
+function encodeListCursor(row: any): string {
+  return btoa(JSON.stringify([row.sort_rank, row.created_at, row.id]))
+    .replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+// created_at이 NULL인 행도 있으므로 커서의 created_at은 null 허용
+function decodeListCursor(cursor: string): [number, string | null, number] | null {
+  try {
+    const key = JSON.parse(atob(cursor.replace(/-/g, '+').replace(/_/g, '/')));
+    if (Array.isArray(key) && key.length === 3 && Number.isInteger(key[0])
+        && (typeof key[1] === 'string' || key[1] === null) && Number.isInteger(key[2])) {
+      return key as [number, string | null, number];
+    }
+  } catch (e) {
+    // 잘못된 커서는 아래에서 400 처리
+  }
+  return null;
+}
+
 // 승인된 캠페인 목록 조회 (인플루언서 및 메인 페이지)
+// limit 또는 cursor 파라미터가 있으면 카드용 필드만 커서 페이지네이션으로 반환
+// { campaigns: [...], next_cursor: string | null }
+// display_status 파라미터로 화면 상태별 조회 (예: ?display_status=recruiting&limit=24)
 campaigns.get('/', async (c) => {
   try {
     const { env } = c;
     const type = c.req.query('type'); // 'best' or undefined
     const visible = c.req.query('visible'); // '1' for main page filtering
-    const today = getKoreanDate(); // 한국 시간 기준 오늘 날짜
-    
+    const limitParam = c.req.query('limit');
+    const cursorParam = c.req.query('cursor');
+    const displayStatus = c.req.query('display_status');
+
+    // 날짜 경계가 지난 캠페인의 display_status를 먼저 갱신 (isolate당 하루 한 번)
+    await refreshExpiredDisplayStatus(env.DB, getKoreanDate());
+
+    if (type !== 'best' && (limitParam !== undefined || cursorParam !== undefined || displayStatus !== undefined)) {
+      // 정렬 키 (sort_rank DESC, created_at DESC, id DESC)는 idx_campaigns_list_order 인덱스와 동일
+      // → 커서 다음 행부터 인덱스를 그대로 읽고 limit개에서 멈춤 (전체 정렬/집계 없음)
+      const parsedLimit = parseInt(limitParam || '', 10);
+      const limit = Math.min(Math.max(isNaN(parsedLimit) ? LIST_DEFAULT_LIMIT : parsedLimit, 1), LIST_MAX_LIMIT);
+
+      const conditions = [`c.status IN ('pending', 'approved', 'suspended', 'completed', 'cancelled')`];
+      const params: any[] = [];
+      if (visible === '1') {
+        conditions.push('c.is_visible = 1');
+      }
+      if (displayStatus !== undefined) {
+        if (!DISPLAY_STATUSES.includes(displayStatus)) {
+          return c.json({ error: '유효하지 않은 상태입니다' }, 400);
+        }
+        // idx_campaigns_display_status (display_status, sort_rank, created_at, id)
+        conditions.push('c.display_status = ?');
+        params.push(displayStatus);
+      }
+      if (cursorParam) {
+        const key = decodeListCursor(cursorParam);
+        if (!key) {
+          return c.json({ error: '잘못된 커서입니다' }, 400);
+        }
+        // (sort_rank, created_at, id) < 커서. 행 값 비교는 NULL이 섞이면 NULL이 되므로 풀어서 비교
+        // SQLite에서 NULL은 가장 작은 값 → DESC 정렬에서 같은 sort_rank의 맨 뒤에 옴
+        const [sortRank, createdAt, id] = key;
+        if (createdAt === null) {
+          conditions.push('(c.sort_rank < ? OR (c.sort_rank = ? AND c.created_at IS NULL AND c.id < ?))');
+          params.push(sortRank, sortRank, id);
+        } else {
+          conditions.push(`(c.sort_rank < ? OR (c.sort_rank = ? AND (c.created_at < ? OR c.created_at IS NULL
+            OR (c.created_at = ? AND c.id < ?))))`);
+          params.push(sortRank, sortRank, createdAt, createdAt, id);
+        }
+      }
+
+      // limit + 1개를 조회해 다음 페이지 존재 여부 확인
+      const page = await env.DB.prepare(
+        `SELECT ${LIST_CARD_COLUMNS}
+         FROM campaigns c
+         WHERE ${conditions.join(' AND ')}
+         ORDER BY c.sort_rank DESC, c.created_at DESC, c.id DESC
+         LIMIT ?`
+      ).bind(...params, limit + 1).all();
+
+      const rows = page.results as any[];
+      const hasMore = rows.length > limit;
+      const pageRows = hasMore ? rows.slice(0, limit) : rows;
+
+      return c.json({
+        campaigns: pageRows,
+        next_cursor: hasMore ? encodeListCursor(pageRows[pageRows.length - 1]) : null
+      });
+    }
+
     if (type === 'best') {
       // 베스트 캠페인: 관리자가 선정한 캠페인 (is_best = 1)
       // visible 파라미터가 있으면 is_visible = 1만 필터링
-      // LEFT JOIN으로 N+1 문제 해결
+      // 지원자 수는 campaigns.application_count (트리거로 유지, 0105)
       const visibleCondition = visible === '1' ? 'AND c.is_visible = 1' : '';
       const campaigns = await env.DB.prepare(
-        `SELECT c.*, 
-         COALESCE(COUNT(a.id), 0) as application_count
+        `SELECT c.*
          FROM campaigns c
-         LEFT JOIN applications a ON a.campaign_id = c.id
          WHERE c.is_best = 1 ${visibleCondition}
-         GROUP BY c.id
          ORDER BY c.updated_at DESC
          LIMIT 20`
       ).all();
       
-      // display_status 추가
-      const campaignsWithStatus = campaigns.results.map((campaign: any) => ({
-        ...campaign,
-        display_status: getDisplayStatus(campaign, today)
-      }));
-      
-      return c.json(campaignsWithStatus);
+      // display_status는 저장된 컬럼 (0106, 위에서 날짜 경계가 지난 행을 갱신)
+      return c.json(campaigns.results);
     } else {
       // 진행중인 캠페인: 모집중, 진행중, 일시중지, 완료됨, 취소됨 순으로 정렬
       // visible 파라미터가 있으면 is_visible = 1만 필터링
@@ -291,34 +394,18 @@ campaigns.get('/', async (c) => {
       // - 일시중지(suspended): 세 번째
       // - 완료됨(completed): 네 번째
       // - 취소됨(cancelled): 마지막
-      // LEFT JOIN으로 N+1 문제 해결
+      // 지원자 수는 campaigns.application_count (트리거로 유지, 0105)
       const visibleCondition = visible === '1' ? 'AND c.is_visible = 1' : '';
       const campaigns = await env.DB.prepare(
-        `SELECT c.*, 
-         COALESCE(COUNT(a.id), 0) as application_count
+        `SELECT c.*
          FROM campaigns c
-         LEFT JOIN applications a ON a.campaign_id = c.id
          WHERE c.status IN ('pending', 'approved', 'suspended', 'completed', 'cancelled')
          ${visibleCondition}
-         GROUP BY c.id
-         ORDER BY 
-           CASE 
-             WHEN c.status = 'approved' THEN 0
-             WHEN c.status = 'suspended' THEN 1
-             WHEN c.status = 'completed' THEN 2
-             WHEN c.status = 'cancelled' THEN 3
-             WHEN c.status = 'pending' THEN 4
-           END,
-           c.created_at DESC`
+         ORDER BY c.sort_rank DESC, c.created_at DESC, c.id DESC`
       ).all();
       
-      // display_status 추가
-      const campaignsWithStatus = campaigns.results.map((campaign: any) => ({
-        ...campaign,
-        display_status: getDisplayStatus(campaign, today)
-      }));
-      
-      return c.json(campaignsWithStatus);
+      // display_status는 저장된 컬럼 (0106, 위에서 날짜 경계가 지난 행을 갱신)
+      return c.json(campaigns.results);
     }
   } catch (error) {
     console.error('Get campaigns error:', error);
@@ -537,6 +624,11 @@ campaigns.put('/:id', authMiddleware, async (c) => {
       try {
         finalThumbnailImage = await uploadImageToR2(env.R2, thumbnail_image, `${campaignId}.jpg`);
         console.log('[캠페인 수정 API] R2 업로드 성공 - URL:', finalThumbnailImage);
+        try {
+          await deleteImageVariants(env.R2, `${campaignId}.jpg`);
+        } catch (error) {
+          console.error('[캠페인 수정 API] 변형 이미지 삭제 실패:', error);
+        }
       } catch (error) {
         console.error('[캠페인 수정 API] R2 upload failed during update, using Base64 as fallback');
       }
@@ -76,6 +76,8 @@ export function calculateCampaignStatus(campaign: any, today: string): string {
 
 /**
  * 프론트엔드 표시용 상태 계산
+ * 목록 조회는 저장된 campaigns.display_status를 사용 (같은 계산식:
+ * migrations/0106_add_campaign_display_status.sql, refresh_display_status.py)
  * @param campaign - 캠페인 객체
  * @param today - 현재 날짜 (YYYY-MM-DD, 한국 시간 기준)
  * @returns 프론트엔드 표시 상태
@@ -124,3 +126,50 @@ export function getKoreanDate(): string {
   const koreaTime = new Date(now.getTime() + (9 * 60 * 60 * 1000));
   return koreaTime.toISOString().split('T')[0];
 }
+
+// display_status 계산식 (?1 = 오늘, 한국 시간) - refresh_display_status.py와 동일하게 유지할 것
+const DISPLAY_STATUS_SQL = `CASE
+    WHEN status != 'approved' THEN status
+    WHEN payment_status IS NOT 'paid' THEN 'pending'
+    WHEN NULLIF(application_start_date, '') IS NOT NULL AND NULLIF(application_end_date, '') IS NOT NULL
+      AND ?1 >= application_start_date AND ?1 <= application_end_date THEN 'recruiting'
+    WHEN NULLIF(application_end_date, '') IS NOT NULL AND ?1 > application_end_date
+      AND (NULLIF(content_end_date, '') IS NULL OR ?1 <= content_end_date) THEN 'in_progress'
+    ELSE 'approved'
+  END`;
+
+const DISPLAY_STATUS_UNTIL_SQL = `CASE WHEN status = 'approved' AND payment_status IS 'paid' THEN (
+    SELECT MIN(d) FROM (
+      SELECT NULLIF(campaigns.application_start_date, '') AS d
+      UNION ALL SELECT date(NULLIF(campaigns.application_end_date, ''), '+1 day')
+      UNION ALL SELECT date(NULLIF(campaigns.content_end_date, ''), '+1 day')
+    ) WHERE d > ?1
+  ) END`;
+
+// D1 바인딩별로 마지막으로 갱신한 날짜 (isolate 안에서 하루 한 번만 갱신)
+const displayStatusRefreshedOn = new WeakMap<D1Database, string>();
+
+/**
+ * 날짜 경계(display_status_until)가 지난 캠페인의 display_status 재계산
+ * 저장된 상태로 목록을 조회하기 전에 호출 (refresh_display_status.py 스케줄이 없거나 늦어도 최신 상태 유지)
+ * 경계는 날짜 단위이므로 isolate당 하루 한 번만 실행, 갱신할 행이 없으면 부분 인덱스만 확인
+ * @param db - D1 바인딩
+ * @param today - 현재 날짜 (YYYY-MM-DD, 한국 시간 기준)
+ */
+export async function refreshExpiredDisplayStatus(db: D1Database, today: string): Promise<void> {
+  if (displayStatusRefreshedOn.get(db) === today) {
+    return;
+  }
+  try {
+    await db.prepare(
+      `UPDATE campaigns SET
+         display_status = ${DISPLAY_STATUS_SQL},
+         display_status_until = ${DISPLAY_STATUS_UNTIL_SQL}
+       WHERE display_status_until <= ?1`
+    ).bind(today).run();
+    displayStatusRefreshedOn.set(db, today);
+  } catch (error) {
+    // 갱신에 실패해도 목록은 저장된 상태로 응답 (다음 요청에서 다시 시도)
+    console.error('Refresh display status error:', error);
+  }
+}
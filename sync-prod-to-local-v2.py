@@ -2,113 +2,53 @@
 """
 Sync production D1 database to local database - Version 2
 Execute table by table to avoid size limits
+
+Usage:
+  python3 sync-prod-to-local-v2.py                 # wrangler --local, one call per table
+  python3 sync-prod-to-local-v2.py --sink sqlite   # write directly into .wrangler/state/v3/d1
+  python3 sync-prod-to-local-v2.py --full          # ignore .sync-state.json, copy everything
 """
 
-import subprocess
-import json
+import argparse
 import sys
 
-DB_NAME = "review-spheres-v1-production"
-
-# Tables in dependency order
-TABLES = [
-    "users",
-    "advertiser_profiles",
-    "influencer_profiles", 
-    "campaigns",
-    "applications",
-    "reviews",
-    "points",
-    "notifications",
-    "settlements",
-    "withdrawal_requests",
-    "password_reset_tokens",
-    "system_settings",
-]
-
-def run_wrangler_command(command, remote=True):
-    """Execute wrangler d1 command and return JSON output"""
-    location = "--remote" if remote else "--local"
-    cmd = f'npx wrangler d1 execute {DB_NAME} {location} --command="{command}" --json'
-    
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        output = result.stdout
-        
-        start_idx = output.find('[')
-        if start_idx == -1:
-            return None
-            
-        json_str = output[start_idx:]
-        data = json.loads(json_str)
-        
-        if data and len(data) > 0 and 'results' in data[0]:
-            return data[0]['results']
-        return []
-    except Exception as e:
-        print(f"Error: {e}")
-        return None
-
-def escape_sql_value(value):
-    """Escape value for SQL INSERT"""
-    if value is None:
-        return "NULL"
-    elif isinstance(value, (int, float)):
-        return str(value)
-    else:
-        return "'" + str(value).replace("'", "''") + "'"
-
-def sync_table(table):
-    """Sync a single table from production to local"""
-    print(f"\n📋 Syncing table: {table}")
-    
-    # Get data from production
-    rows = run_wrangler_command(f"SELECT * FROM {table}", remote=True)
-    
-    if rows is None:
-        print(f"  ⚠️  Failed to fetch data")
-        return False
-    
-    row_count = len(rows)
-    print(f"  📊 Found {row_count} rows")
-    
-    if row_count == 0:
-        # Just delete local data
-        result = run_wrangler_command(f"DELETE FROM {table}", remote=False)
-        print(f"  ✅ Cleared local table")
-        return True
-    
-    # Delete existing data
-    run_wrangler_command(f"DELETE FROM {table}", remote=False)
-    print(f"  🗑️  Cleared local table")
-    
-    # Insert row by row
-    columns = list(rows[0].keys())
-    success_count = 0
-    
-    for row in rows:
-        values = [escape_sql_value(row.get(col)) for col in columns]
-        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(values)})"
-        
-        result = run_wrangler_command(sql, remote=False)
-        if result is not None:
-            success_count += 1
-    
-    print(f"  ✅ Inserted {success_count}/{row_count} rows")
-    return success_count == row_count
+from d1_sync import (
+    SINKS, SYNC_WORKERS, make_sink, sync_tables, sync_tables_in_order, load_sync_state, save_sync_state
+)
 
 def main():
+    parser = argparse.ArgumentParser(description="Sync production D1 to local, table by table")
+    parser.add_argument('--sink', choices=sorted(SINKS), default='wrangler',
+                        help="where to write rows (default: wrangler)")
+    parser.add_argument('--sqlite-path', help="local D1 SQLite file for --sink sqlite (auto-detected)")
+    parser.add_argument('--page-size', type=int, help="rows per D1 export page (default: per table)")
+    parser.add_argument('--full', action='store_true', help="full resync instead of incremental delta")
+    parser.add_argument('--workers', type=int, default=SYNC_WORKERS, help="concurrent table exports")
+    parser.add_argument('--schema', choices=['migrations', 'remote'], default='migrations',
+                        help="where to read tables and foreign keys from (default: migrations/)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Syncing Production DB to Local DB (Table by Table)")
     print("=" * 60)
     
-    failed_tables = []
-    
-    for table in TABLES:
-        success = sync_table(table)
-        if not success:
-            failed_tables.append(table)
+    sink = make_sink(args.sink, args.sqlite_path)
+    state = load_sync_state()
+
+    # Tables in foreign-key dependency order
+    tables = sync_tables_in_order(args.schema)
+    print(f"📋 Tables: {', '.join(tables)}\n")
+
+    new_state, failed_tables = sync_tables(
+        tables, sink, state, full=args.full, page_size=args.page_size, workers=args.workers
+    )
     
+    if not sink.close():
+        print("❌ Failed to apply to local database")
+        return 1
+
+    save_sync_state(new_state)
+
     print(f"\n{'=' * 60}")
     if failed_tables:
         print(f"❌ Failed tables: {', '.join(failed_tables)}")
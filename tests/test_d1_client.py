@@ -0,0 +1,56 @@
+import shutil
+import subprocess
+
+import pytest
+
+import d1_client
+from d1_client import D1Client, D1Error
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason="node is not installed")
+
+def fake_bridge(tmp_path, source):
+    path = tmp_path / "bridge.mjs"
+    path.write_text(source)
+    return str(path)
+
+def started(monkeypatch):
+    """Record the helper processes D1Client starts"""
+    procs = []
+    popen = subprocess.Popen
+
+    def record(*args, **kwargs):
+        proc = popen(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(d1_client.subprocess, 'Popen', record)
+    return procs
+
+def test_startup_timeout_kills_bridge_and_reports_stderr(tmp_path, monkeypatch):
+    monkeypatch.setattr(d1_client, 'STARTUP_TIMEOUT', 1)
+    procs = started(monkeypatch)
+    bridge = fake_bridge(tmp_path, "console.error('waiting for wrangler login'); setInterval(() => {}, 1000);\n")
+
+    with pytest.raises(D1Error, match=r"did not start within 1s[\s\S]*waiting for wrangler login"):
+        D1Client(remote=False, bridge=bridge)
+    assert procs[0].poll() is not None
+
+def test_bridge_exit_before_ready_reports_stderr(tmp_path, monkeypatch):
+    procs = started(monkeypatch)
+    bridge = fake_bridge(tmp_path, "console.error('CLOUDFLARE_API_TOKEN is not set'); process.exit(1);\n")
+
+    with pytest.raises(D1Error, match=r"failed to start[\s\S]*CLOUDFLARE_API_TOKEN is not set"):
+        D1Client(remote=True, bridge=bridge)
+    assert procs[0].poll() == 1
+
+def test_ready_bridge_answers_queries(tmp_path):
+    bridge = fake_bridge(tmp_path, """
+import readline from 'node:readline';
+console.log(JSON.stringify({ id: 0, ok: true, ready: true }));
+for await (const line of readline.createInterface({ input: process.stdin })) {
+  const { id, sql } = JSON.parse(line);
+  console.log(JSON.stringify({ id, ok: true, results: [{ sql }] }));
+}
+""")
+    with D1Client(remote=False, bridge=bridge) as client:
+        assert client.query("SELECT 1") == [{'sql': "SELECT 1"}]
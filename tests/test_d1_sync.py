@@ -0,0 +1,73 @@
+import sqlite3
+
+import pytest
+
+from d1_sync import build_insert_batches, topological_order
+
+COLUMNS = ['id', 'name', 'note']
+
+def rows(count, note=''):
+    return [{'id': i, 'name': f"it's #{i}", 'note': note} for i in range(1, count + 1)]
+
+def load(statements):
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, note TEXT)")
+    for sql in statements:
+        conn.execute(sql)
+    return conn.execute("SELECT id, name, note FROM t ORDER BY id").fetchall()
+
+def test_batches_capped_by_rows():
+    statements = build_insert_batches('t', COLUMNS, rows(250), max_rows=100)
+    assert len(statements) == 3
+    assert load(statements) == [(r['id'], r['name'], r['note']) for r in rows(250)]
+
+def test_batches_capped_by_bytes():
+    max_bytes = 2000
+    statements = build_insert_batches('t', COLUMNS, rows(40, note='x' * 100), max_bytes=max_bytes)
+    assert len(statements) > 1
+    assert all(len(sql.encode('utf-8')) <= max_bytes for sql in statements)
+    assert len(load(statements)) == 40
+
+def test_oversized_row_gets_its_own_statement():
+    data = rows(3)
+    data[1]['note'] = 'y' * 5000
+    statements = build_insert_batches('t', COLUMNS, data, max_bytes=1000)
+    assert len(statements) == 3
+    assert load(statements)[1][2] == 'y' * 5000
+
+def test_null_and_numbers():
+    statements = build_insert_batches('t', COLUMNS, [{'id': 1, 'name': None, 'note': 2.5}])
+    assert statements == ["INSERT INTO t (id, name, note) VALUES (1, NULL, 2.5);"]
+
+def test_no_rows():
+    assert build_insert_batches('t', COLUMNS, []) == []
+
+def test_upsert_overwrites_existing_rows():
+    first = build_insert_batches('t', COLUMNS, rows(2))
+    second = build_insert_batches('t', COLUMNS, [{'id': 2, 'name': 'new', 'note': 'n'}], upsert=True)
+    assert second[0].endswith("ON CONFLICT(id) DO UPDATE SET name = excluded.name, note = excluded.note;")
+    assert load(first + second) == [(1, "it's #1", ''), (2, 'new', 'n')]
+
+def test_topological_order():
+    schema = {
+        'users': set(),
+        'campaigns': {'users'},
+        'applications': {'campaigns', 'users'},
+        'reviews': {'applications'},
+        'notifications': {'users'},
+        'comments': {'comments', 'users'},   # self reference
+        'logs': {'missing_table'},           # unknown reference
+    }
+    order = topological_order(schema)
+    assert sorted(order) == sorted(schema)
+    for table, refs in schema.items():
+        for ref in refs & set(schema) - {table}:
+            assert order.index(ref) < order.index(table)
+
+def test_topological_order_is_deterministic():
+    schema = {'b': set(), 'a': set(), 'c': {'a', 'b'}}
+    assert topological_order(schema) == ['a', 'b', 'c']
+
+def test_topological_order_cycle():
+    with pytest.raises(ValueError, match='a, b'):
+        topological_order({'a': {'b'}, 'b': {'a'}, 'c': set()})
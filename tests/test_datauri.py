@@ -0,0 +1,59 @@
+import base64
+import binascii
+import io
+
+import pytest
+
+from datauri import Base64StreamDecoder, decode_stream, parse_data_uri_header
+
+PAYLOAD = bytes(range(256)) * 7 + b'tail'
+ENCODED = base64.b64encode(PAYLOAD).decode()
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+@pytest.mark.parametrize('size', [1, 3, 4, 5, 17, 1000, 100000])
+def test_decode_stream_any_chunking(size):
+    out = io.BytesIO()
+    mime, written = decode_stream(chunked("data:image/png;base64," + ENCODED, size), out)
+    assert mime == 'image/png'
+    assert written == len(PAYLOAD)
+    assert out.getvalue() == PAYLOAD
+
+def test_bare_base64_defaults_to_jpeg():
+    out = io.BytesIO()
+    assert decode_stream(chunked(ENCODED, 10), out) == ('image/jpeg', len(PAYLOAD))
+    assert out.getvalue() == PAYLOAD
+
+def test_whitespace_and_missing_padding():
+    text = "data:image/gif;base64," + "\n".join(chunked(ENCODED.rstrip('='), 76))
+    out = io.BytesIO()
+    decode_stream(chunked(text, 33), out)
+    assert out.getvalue() == PAYLOAD
+
+def test_short_input_in_one_chunk():
+    out = io.BytesIO()
+    assert decode_stream(["data:;base64,aGk="], out) == ('image/jpeg', 2)
+    assert out.getvalue() == b'hi'
+
+def test_empty_input():
+    with pytest.raises(ValueError):
+        decode_stream([], io.BytesIO())
+
+def test_invalid_characters():
+    with pytest.raises(binascii.Error):
+        decode_stream(["data:image/png;base64,ab$d"], io.BytesIO())
+
+def test_truncated_group():
+    decoder = Base64StreamDecoder()
+    decoder.feed("aGk=a")
+    with pytest.raises(binascii.Error):
+        decoder.finish()
+
+def test_header_parsing():
+    assert parse_data_uri_header("data:image/webp;base64,AAAA") == ('image/webp', 23)
+    assert parse_data_uri_header("AAAA") == ('image/jpeg', 0)
+    with pytest.raises(ValueError):
+        parse_data_uri_header("data:text/plain,hello")
+    with pytest.raises(ValueError):
+        parse_data_uri_header("data:image/png;base64")
@@ -0,0 +1,63 @@
+import os
+import sqlite3
+
+import pytest
+
+from derived_data import rebuild_sqlite
+from generate_dataset import apply_migrations
+from purge_visitor_logs import verify
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+COUNTERS = ("application_count, pending_application_count, "
+            "approved_application_count, rejected_application_count")
+TODAY = '2025-06-10'
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:', isolation_level=None)
+    apply_migrations(conn, MIGRATIONS_DIR)
+    conn.execute("INSERT INTO users (id, email, password_hash, nickname, role, created_at) VALUES "
+                 "(1, 'a@x', 'h', 'a', 'advertiser', '2025-06-01T00:00:00Z'), "
+                 "(2, 'b@x', 'h', 'b', 'influencer', '2025-06-09T16:00:00Z'), "
+                 "(3, 'c@x', 'h', 'c', 'influencer', '2025-06-10T01:00:00Z')")
+    conn.execute("INSERT INTO campaigns (id, advertiser_id, title, status, channel_type, created_at) "
+                 "VALUES (1, 1, 't', 'approved', 'instagram', '2025-06-02T00:00:00Z')")
+    conn.execute("INSERT INTO applications (campaign_id, influencer_id, status) "
+                 "VALUES (1, 2, 'approved'), (1, 3, 'pending')")
+    conn.execute("INSERT INTO visitor_logs (ip_address, visited_at) VALUES "
+                 "('1.1.1.1', '2025-06-10T00:00:00Z'), ('1.1.1.1', '2025-06-10T01:00:00Z'), "
+                 "('2.2.2.2', '2025-06-09T20:00:00Z')")
+    yield conn
+    conn.close()
+
+def test_rebuild_fixes_copied_counters(conn):
+    # What a bulk copy leaves behind: copied counters plus the trigger increments
+    conn.execute("UPDATE campaigns SET application_count = 4, pending_application_count = 2, "
+                 "approved_application_count = 2, sort_rank = 0, display_status = 'recruiting'")
+    rebuild_sqlite(conn, TODAY)
+    assert conn.execute(f"SELECT {COUNTERS} FROM campaigns").fetchone() == (2, 1, 1, 0)
+    assert conn.execute("SELECT sort_rank FROM campaigns").fetchone() == (4,)
+    assert conn.execute("SELECT display_status FROM campaigns").fetchone() == ('pending',)
+
+def test_rebuild_daily_stats(conn):
+    conn.execute("UPDATE daily_stats SET visitors = visitors + 5, new_users = new_users + 3")
+    rebuild_sqlite(conn, TODAY, keep_history=False)
+    conn.row_factory = sqlite3.Row
+    query = lambda sql, params=(): [dict(row) for row in conn.execute(sql, params)]
+    assert verify(query, TODAY) == []
+    assert query("SELECT visitors, page_views, new_users FROM daily_stats WHERE day = ?", [TODAY]) == [
+        {'visitors': 2, 'page_views': 3, 'new_users': 2}
+    ]
+
+def test_rebuild_keeps_history(conn):
+    conn.execute("INSERT INTO daily_stats (day, visitors, page_views) VALUES ('2025-01-01', 7, 70)")
+    rebuild_sqlite(conn, TODAY)
+    assert conn.execute("SELECT visitors, page_views FROM daily_stats WHERE day = '2025-01-01'").fetchone() == (7, 70)
+    rebuild_sqlite(conn, TODAY, keep_history=False)
+    assert conn.execute("SELECT COUNT(*) FROM daily_stats WHERE day = '2025-01-01'").fetchone() == (0,)
+
+def test_rebuild_is_idempotent(conn):
+    rebuild_sqlite(conn, TODAY)
+    first = conn.execute("SELECT * FROM daily_stats ORDER BY day").fetchall()
+    rebuild_sqlite(conn, TODAY)
+    assert conn.execute("SELECT * FROM daily_stats ORDER BY day").fetchall() == first
@@ -0,0 +1,71 @@
+import hashlib
+import threading
+import time
+
+from r2_manifest import UploadManifest, content_key
+
+class FakeR2:
+    """Just the bridge calls the manifest makes, on an in-memory bucket"""
+
+    def __init__(self):
+        self.objects = {}
+        self.puts = []
+        self.lock = threading.Lock()
+
+    def r2_put(self, key, path, content_type):
+        time.sleep(0.02)
+        with open(path, 'rb') as f:
+            data = f.read()
+        with self.lock:
+            self.puts.append(key)
+            self.objects[key] = data
+        return {'key': key, 'size': len(data), 'etag': hashlib.md5(data).hexdigest()}
+
+    def r2_head(self, key):
+        data = self.objects.get(key)
+        return data and {'key': key, 'size': len(data), 'etag': hashlib.md5(data).hexdigest()}
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def test_skips_unchanged_object(tmp_path):
+    r2, manifest = FakeR2(), UploadManifest(str(tmp_path / 'm.jsonl'))
+    image = write(tmp_path, 'a', b'AAAA')
+    assert manifest.put(r2, '1.jpg', image) == ('1.jpg', True)
+    assert manifest.put(r2, '1.jpg', image) == ('1.jpg', False)
+    assert r2.puts == ['1.jpg']
+
+def test_reuploads_object_changed_behind_its_back(tmp_path):
+    r2, manifest = FakeR2(), UploadManifest(str(tmp_path / 'm.jsonl'))
+    image = write(tmp_path, 'a', b'AAAA')
+    manifest.put(r2, '1.jpg', image)
+    manifest.close()
+
+    r2.objects['1.jpg'] = b'overwritten by the worker'
+    manifest = UploadManifest(str(tmp_path / 'm.jsonl'))
+    assert manifest.put(r2, '1.jpg', image) == ('1.jpg', True)
+    del r2.objects['1.jpg']
+    assert manifest.put(r2, '1.jpg', image) == ('1.jpg', True)
+
+def test_dedupe_uses_content_addressed_key(tmp_path):
+    r2, manifest = FakeR2(), UploadManifest(str(tmp_path / 'm.jsonl'))
+    image = write(tmp_path, 'a', b'AAAA')
+    key = content_key(hashlib.sha256(b'AAAA').hexdigest(), 'image/jpeg')
+    assert key.startswith('sha256/') and key.endswith('.jpg')
+    assert manifest.put(r2, '1.jpg', image, dedupe=True) == (key, True)
+    assert manifest.put(r2, '2.jpg', image, dedupe=True) == (key, False)
+    assert '1.jpg' not in r2.objects and '2.jpg' not in r2.objects
+
+def test_concurrent_puts(tmp_path):
+    r2, manifest = FakeR2(), UploadManifest(str(tmp_path / 'm.jsonl'))
+    image = write(tmp_path, 'b', b'BBBBBB')
+    threads = [threading.Thread(target=manifest.put, args=(r2, 'x.jpg', image)) for _ in range(5)]
+    # Same bytes under other keys are separate objects, each uploaded once
+    threads += [threading.Thread(target=manifest.put, args=(r2, f'y{i}.jpg', image)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(r2.puts) == ['x.jpg', 'y0.jpg', 'y1.jpg', 'y2.jpg']
@@ -0,0 +1,64 @@
+import io
+
+import pytest
+
+from sql_dump import iter_statements, parse_insert, statement_table
+
+def split(text, chunk_size=1024 * 1024):
+    return list(iter_statements(io.StringIO(text), chunk_size=chunk_size))
+
+def test_simple_statements():
+    assert split("INSERT INTO t VALUES (1);\nDELETE FROM t;\n") == [
+        "INSERT INTO t VALUES (1);",
+        "DELETE FROM t;",
+    ]
+
+def test_semicolons_inside_literals_and_identifiers():
+    text = ("INSERT INTO \"we;ird\" VALUES ('a;b', 'it''s;');\n"
+            "INSERT INTO [x;y] VALUES (`c;d`);\n")
+    assert split(text) == [
+        "INSERT INTO \"we;ird\" VALUES ('a;b', 'it''s;');",
+        "INSERT INTO [x;y] VALUES (`c;d`);",
+    ]
+
+def test_comments_are_skipped():
+    text = "-- header; not a statement\n/* block; comment */\nINSERT INTO t VALUES (1); -- trailing;\n"
+    assert split(text) == ["INSERT INTO t VALUES (1);"]
+
+def test_trigger_body_kept_whole():
+    trigger = ("CREATE TRIGGER trg AFTER INSERT ON a\nBEGIN\n"
+               "  UPDATE b SET n = n + 1;\n  DELETE FROM c;\nEND;")
+    assert split(trigger + "\nINSERT INTO a VALUES (1);") == [trigger, "INSERT INTO a VALUES (1);"]
+
+def test_unterminated_tail_is_yielded():
+    assert split("INSERT INTO t VALUES (1);\nINSERT INTO t VALUES (2)") == [
+        "INSERT INTO t VALUES (1);",
+        "INSERT INTO t VALUES (2)",
+    ]
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64])
+def test_chunk_boundaries(chunk_size):
+    text = ("-- c;\nINSERT INTO \"t\" VALUES ('x;--y', X'00ff');\n"
+            "/* a */ UPDATE t SET a = '/*;*/' WHERE b = 1;\n"
+            "CREATE TRIGGER g AFTER DELETE ON t BEGIN DELETE FROM u; END;\n")
+    assert split(text, chunk_size) == split(text)
+    assert len(split(text)) == 3
+
+def test_parse_insert():
+    parsed = parse_insert("INSERT INTO \"users\" (id, name) VALUES (1, 'a), (b'), (2, 'c') "
+                          "ON CONFLICT(id) DO NOTHING;")
+    assert parsed.table == 'users'
+    assert parsed.columns == ['id', 'name']
+    assert parsed.values_sql == "(1, 'a), (b'), (2, 'c')"
+    assert parse_insert("DELETE FROM users;") is None
+
+@pytest.mark.parametrize('sql, table', [
+    ("INSERT OR REPLACE INTO campaigns VALUES (1);", 'campaigns'),
+    ("UPDATE \"applications\" SET a = 1;", 'applications'),
+    ("DELETE FROM [points];", 'points'),
+    ("CREATE TABLE IF NOT EXISTS users (id INTEGER);", 'users'),
+    ("CREATE UNIQUE INDEX idx ON reviews (application_id);", 'reviews'),
+    ("PRAGMA foreign_keys = ON;", None),
+])
+def test_statement_table(sql, table):
+    assert statement_table(sql) == table
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+그라디언트 + 이모지 썸네일 생성 (공용 모듈)
+
+One implementation of the placeholder thumbnails used by
+create_gradient_thumbnails.py, update_specific_thumbnails.py and
+create_missing_thumbnails.py:
+
+  - the vertical gradient is one NumPy array operation (no per-scanline draw)
+  - fonts are loaded once per process
+  - rendered images are memoized on disk by (colors, emoji, size, format)
+  - batches render on a process pool
+
+Usage:
+  from thumbnails import render_thumbnail, render_batch, to_data_uri
+  jpeg = render_thumbnail("#FFD700", "#FFA500", "🍗")
+  images = render_batch([("#9333EA", "#EC4899", None, (400, 300))])
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import base64
+import io
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_SIZE = 120
+DEFAULT_SIZE = (400, 400)
+JPEG_QUALITY = 85
+SHADOW_OFFSET = 3
+
+CACHE_DIR = ".thumbnail-cache"
+# Bump when the rendering changes so stale cache entries are not reused
+CACHE_VERSION = 1
+
+MIME_TYPES = {'JPEG': 'image/jpeg', 'PNG': 'image/png', 'WEBP': 'image/webp'}
+
+@lru_cache(maxsize=None)
+def parse_hex_color(color):
+    """'#RRGGBB' → (r, g, b)"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+@lru_cache(maxsize=None)
+def get_font(path=FONT_PATH, size=FONT_SIZE):
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+def gradient_image(color1, color2, size=DEFAULT_SIZE):
+    """Top-to-bottom gradient from color1 to color2 as an RGB image"""
+    width, height = size
+    start = np.array(parse_hex_color(color1), dtype=np.float64)
+    end = np.array(parse_hex_color(color2), dtype=np.float64)
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    # Truncate like int() did in the per-scanline version
+    rows = (start + (end - start) * ratio).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    return Image.fromarray(pixels, 'RGB')
+
+def draw_emoji(image, emoji, font=None):
+    """Centered emoji with a drop shadow"""
+    font = font or get_font()
+    draw = ImageDraw.Draw(image)
+    bbox = draw.textbbox((0, 0), emoji, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    position = ((image.width - text_width) // 2, (image.height - text_height) // 2)
+
+    draw.text((position[0] + SHADOW_OFFSET, position[1] + SHADOW_OFFSET),
+              emoji, font=font, fill=(0, 0, 0, 128))
+    draw.text(position, emoji, font=font, fill=(255, 255, 255))
+
+def create_gradient_thumbnail(color1, color2, emoji=None, size=DEFAULT_SIZE):
+    """그라디언트 배경에 이모지가 있는 썸네일 생성 (PIL Image)"""
+    image = gradient_image(color1, color2, size)
+    if emoji:
+        draw_emoji(image, emoji)
+    return image
+
+def _cache_path(color1, color2, emoji, size, fmt, cache_dir):
+    key = repr((CACHE_VERSION, color1.upper(), color2.upper(), emoji, tuple(size), fmt))
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.{fmt.lower()}")
+
+def render_thumbnail(color1, color2, emoji=None, size=DEFAULT_SIZE, fmt='JPEG', cache_dir=CACHE_DIR):
+    """Encoded thumbnail bytes, from the disk cache when already rendered"""
+    path = _cache_path(color1, color2, emoji, size, fmt, cache_dir) if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    buffer = io.BytesIO()
+    options = {'quality': JPEG_QUALITY} if fmt in ('JPEG', 'WEBP') else {}
+    create_gradient_thumbnail(color1, color2, emoji, size).save(buffer, format=fmt, **options)
+    data = buffer.getvalue()
+
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return data
+
+def _render_spec(spec):
+    return render_thumbnail(*spec)
+
+def render_batch(specs, workers=None):
+    """Render [(color1, color2, emoji, size[, fmt]), ...] on a process pool, in order"""
+    specs = [tuple(spec) for spec in specs]
+    if workers == 1 or len(specs) < 2:
+        return [_render_spec(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_spec, specs, chunksize=max(1, len(specs) // 32)))
+
+def to_data_uri(data, fmt='JPEG'):
+    return f"data:{MIME_TYPES[fmt]};base64,{base64.b64encode(data).decode('ascii')}"
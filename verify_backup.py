@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+백업 검증 (임시 SQLite 복원 + 무결성 검사 + 이전 백업과 비교)
+
+Runs after every backup (scripts/auto_backup.sh):
+
+  1. restores the dump into a throwaway SQLite file (restore_dump.py)
+  2. PRAGMA integrity_check and PRAGMA foreign_key_check
+  3. per-table row counts and content checksums, compared with the
+     previous backup: a table that disappears, empties or shrinks more
+     than SHRINK_TOLERANCE fails the check
+
+The per-table stats of each verified backup are kept in
+<store>/verify/<name>.json so the next run compares against them without
+restoring the previous backup again (if they are missing, the previous
+backup is restored from the backup store instead).
+
+Usage:
+  python3 verify_backup.py backups/db_backup_20251118_073354.sql
+  python3 verify_backup.py backups/db_backup_20251119_073354.sql --store backups/store
+"""
+
+from datetime import datetime, timezone
+import argparse
+import tempfile
+import hashlib
+import sqlite3
+import json
+import time
+import sys
+import os
+
+from backup_store import STORE_DIR, BackupStore, StoreError
+from restore_dump import RestoreError, restore, user_tables
+
+# Fail when a table loses more than this fraction of its rows between backups
+SHRINK_TOLERANCE = 0.05
+# Tables that are purged on purpose and may shrink freely
+VOLATILE_TABLES = {'password_reset_tokens', 'visitor_logs', 'user_ips',
+                   'daily_visitor_ips'}  # kept for two days by purge_visitor_logs.py
+
+def table_checksum(conn, table):
+    """Order-independent checksum of a table's rows (sum of per-row hashes mod 2^64)"""
+    total = 0
+    for row in conn.execute(f'SELECT * FROM "{table}"'):
+        digest = hashlib.blake2b(repr(row).encode('utf-8'), digest_size=8).digest()
+        total = (total + int.from_bytes(digest, 'big')) & 0xFFFFFFFFFFFFFFFF
+    return f"{total:016x}"
+
+def collect_stats(dump_path):
+    """Restore a dump into a temp SQLite and return its integrity/FK/table stats"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = sqlite3.connect(os.path.join(tmp_dir, 'verify.sqlite'), isolation_level=None)
+        try:
+            restored = restore(dump_path, conn, quiet=True)
+            integrity = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+            fk_violations = {}
+            for table, _, parent, _ in conn.execute("PRAGMA foreign_key_check"):
+                key = f"{table} → {parent}"
+                fk_violations[key] = fk_violations.get(key, 0) + 1
+            tables = {
+                table: {
+                    'rows': conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0],
+                    'checksum': table_checksum(conn, table),
+                }
+                for table in sorted(user_tables(conn))
+            }
+        finally:
+            conn.close()
+
+    return {
+        'rows': restored['rows'],
+        'integrity': integrity,
+        'fk_violations': fk_violations,
+        'tables': tables,
+    }
+
+def compare(current, previous, shrink_tolerance=SHRINK_TOLERANCE):
+    """Return (errors, notes) comparing two stats dicts"""
+    errors = []
+    notes = []
+
+    if current['integrity'] != ['ok']:
+        errors.append(f"integrity_check: {'; '.join(current['integrity'][:5])}")
+
+    previous_fk = sum(previous['fk_violations'].values()) if previous else 0
+    current_fk = sum(current['fk_violations'].values())
+    if current_fk > previous_fk:
+        details = ", ".join(f"{key} {count}개" for key, count in sorted(current['fk_violations'].items()))
+        errors.append(f"foreign_key_check 위반 증가 {previous_fk} → {current_fk} ({details})")
+    elif current_fk:
+        notes.append(f"foreign_key_check 위반 {current_fk}개 (이전과 동일 또는 감소)")
+
+    if not previous:
+        return errors, notes
+
+    for table, before in sorted(previous['tables'].items()):
+        after = current['tables'].get(table)
+        if after is None:
+            errors.append(f"{table}: 테이블이 사라짐 (이전 {before['rows']:,}행)")
+            continue
+        if table in VOLATILE_TABLES or after['rows'] >= before['rows']:
+            continue
+        if after['rows'] == 0 or before['rows'] - after['rows'] > before['rows'] * shrink_tolerance:
+            errors.append(f"{table}: 행 수 급감 {before['rows']:,} → {after['rows']:,}")
+        else:
+            notes.append(f"{table}: 행 수 감소 {before['rows']:,} → {after['rows']:,} (허용 범위)")
+
+    for table in sorted(set(current['tables']) - set(previous['tables'])):
+        notes.append(f"{table}: 새 테이블 ({current['tables'][table]['rows']:,}행)")
+    return errors, notes
+
+def backup_name(dump_path):
+    return os.path.basename(dump_path).split('.')[0]
+
+def load_previous_stats(store_root, name):
+    """Stats of the latest backup before name: from verify/*.json, else restored from the store"""
+    verify_dir = os.path.join(store_root, 'verify')
+    candidates = (sorted(entry[:-5] for entry in os.listdir(verify_dir)
+                        if entry.endswith('.json') and '.failed' not in entry and entry[:-5] < name)
+                  if os.path.isdir(verify_dir) else [])
+    if candidates:
+        with open(os.path.join(verify_dir, candidates[-1] + '.json'), encoding='utf-8') as f:
+            return json.load(f)
+
+    if not os.path.isdir(os.path.join(store_root, 'manifests')):
+        return None
+    store = BackupStore(store_root)
+    older = [manifest['name'] for manifest in store.manifests() if manifest['name'] < name]
+    if not older:
+        return None
+    with tempfile.NamedTemporaryFile(suffix='.sql', delete=False) as tmp_file:
+        tmp_path = tmp_file.name
+        try:
+            store.restore(older[-1], tmp_file)
+        except StoreError:
+            os.unlink(tmp_path)
+            raise
+    try:
+        return dict(collect_stats(tmp_path), name=older[-1])
+    finally:
+        os.unlink(tmp_path)
+
+def save_stats(store_root, name, stats):
+    verify_dir = os.path.join(store_root, 'verify')
+    os.makedirs(verify_dir, exist_ok=True)
+    path = os.path.join(verify_dir, name + '.json')
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+    os.replace(path + '.tmp', path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="백업 검증 (임시 SQLite 복원 + 비교)")
+    parser.add_argument('dump', help="검증할 .sql / .sql.gz 덤프")
+    parser.add_argument('--store', default=STORE_DIR, help="백업 저장소 (이전 백업 통계 위치)")
+    parser.add_argument('--shrink-tolerance', type=float, default=SHRINK_TOLERANCE,
+                        help="허용하는 테이블 행 감소 비율 (기본 0.05)")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    name = backup_name(args.dump)
+    print(f"🔍 백업 검증: {name}")
+
+    try:
+        current = collect_stats(args.dump)
+    except (RestoreError, sqlite3.Error) as e:
+        print(f"❌ 복원 불가: {e}")
+        return 1
+
+    try:
+        previous = load_previous_stats(args.store, name)
+    except (RestoreError, StoreError, sqlite3.Error) as e:
+        print(f"⚠️  이전 백업 통계를 불러오지 못함: {e}")
+        previous = None
+
+    errors, notes = compare(current, previous, args.shrink_tolerance)
+
+    print(f"   📥 복원: 테이블 {len(current['tables'])}개, {current['rows']:,}행")
+    print(f"   🧱 integrity_check: {', '.join(current['integrity'][:3])}")
+    if previous:
+        changed = [table for table, stats in current['tables'].items()
+                   if previous['tables'].get(table, {}).get('checksum') != stats['checksum']]
+        print(f"   🔁 이전 백업({previous.get('name', '?')}) 대비 변경된 테이블: {', '.join(changed) or '없음'}")
+    else:
+        print("   ℹ️  비교할 이전 백업 없음")
+    for note in notes:
+        print(f"   ℹ️  {note}")
+
+    current.update(name=name, verified_at=datetime.now(timezone.utc).isoformat(), ok=not errors)
+    if errors:
+        print(f"\n❌ 백업 검증 실패 ({time.time() - started:.1f}s):")
+        for error in errors:
+            print(f"   - {error}")
+        # Kept for the post-mortem, but never used as the baseline
+        save_stats(args.store, name + '.failed', current)
+        return 1
+
+    save_stats(args.store, name, current)
+    print(f"\n✅ 백업 검증 통과 ({time.time() - started:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())